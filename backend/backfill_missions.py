@@ -0,0 +1,27 @@
+# backend/backfill_missions.py
+"""Populate the `mission` summary table from existing `event_log` rows.
+
+Run once after applying the migration that creates `mission`, so missions
+recorded before it existed show up in /api/v1/missions. Safe to re-run: each
+mission's event count and time range are recomputed from the log.
+
+    python -m backend.backfill_missions
+"""
+import asyncio
+
+from backend.database import async_session_factory
+from backend.repository import EventLogRepository
+
+
+async def backfill() -> int:
+    async with async_session_factory() as session:
+        return await EventLogRepository(session).backfill_missions()
+
+
+def main() -> None:
+    count = asyncio.run(backfill())
+    print(f"Backfilled {count} missions from event_log")
+
+
+if __name__ == "__main__":
+    main()
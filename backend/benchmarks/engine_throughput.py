@@ -0,0 +1,49 @@
+# backend/benchmarks/engine_throughput.py
+"""Session-ticks per second: per-object `RovSimulator` vs `VectorizedRovEngine`.
+
+Run with `python -m backend.benchmarks.engine_throughput [sessions] [ticks]`.
+Every session runs the power_fault scenario, which stays active (descending,
+then draining) for the whole measured window.
+"""
+import sys
+import time
+
+from backend.simulator import RovSimulator
+from backend.vector_engine import VectorizedRovEngine
+
+START = {"command": "START_SIMULATION", "payload": {"scenario": "power_fault"}}
+
+
+def bench_scalar(sessions: int, ticks: int) -> float:
+    sims = [RovSimulator() for _ in range(sessions)]
+    for sim in sims:
+        sim.handle_command(START)
+    started = time.perf_counter()
+    for _ in range(ticks):
+        for sim in sims:
+            sim.update()
+    return sessions * ticks / (time.perf_counter() - started)
+
+
+def bench_vectorized(sessions: int, ticks: int) -> float:
+    engine = VectorizedRovEngine(capacity=sessions)
+    for _ in range(sessions):
+        engine.handle_command(engine.add_session(), START)
+    started = time.perf_counter()
+    for _ in range(ticks):
+        engine.update()
+    return sessions * ticks / (time.perf_counter() - started)
+
+
+def main(argv: list[str]) -> None:
+    ticks = int(argv[1]) if len(argv) > 1 else 60
+    session_counts = [int(argv[0])] if argv else [1, 10, 50, 200, 1000]
+    print(f"{'sessions':>8} {'scalar/s':>12} {'vector/s':>12} {'speedup':>8}")
+    for sessions in session_counts:
+        scalar = bench_scalar(sessions, ticks)
+        vectorized = bench_vectorized(sessions, ticks)
+        print(f"{sessions:>8} {scalar:>12,.0f} {vectorized:>12,.0f} {vectorized / scalar:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
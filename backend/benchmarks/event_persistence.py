@@ -0,0 +1,73 @@
+# backend/benchmarks/event_persistence.py
+"""Rows per second: per-row `EventLogRepository.insert` vs the batched `EventWriter`.
+
+Run with `python -m backend.benchmarks.event_persistence [rows]` against the
+database in DATABASE_URL. Rows are written under throwaway mission ids and
+deleted afterwards.
+"""
+import asyncio
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend.config import settings
+from backend.db_models import EventLog, Mission
+from backend.event_writer import EventWriter
+from backend.logs import LogEntry, LogLevel
+from backend.repository import EventLogRepository
+
+
+def _entry(i: int) -> LogEntry:
+    return LogEntry(timestamp=datetime.now(UTC), level=LogLevel.WARNING, message=f"bench {i}")
+
+
+async def bench_per_row(session_factory, rows: int, mission_id: uuid.UUID) -> float:
+    entries = [_entry(i) for i in range(rows)]
+    started = time.perf_counter()
+    async with session_factory() as db_session:
+        repo = EventLogRepository(db_session)
+        for entry in entries:
+            await repo.insert(
+                timestamp=entry.timestamp,
+                severity=entry.level.value,
+                message=entry.message,
+                mission_id=mission_id,
+            )
+    return rows / (time.perf_counter() - started)
+
+
+async def bench_writer(session_factory, rows: int, mission_id: uuid.UUID) -> float:
+    entries = [_entry(i) for i in range(rows)]
+    writer = EventWriter(max_queue=rows, session_factory=session_factory)
+    writer.start()
+    started = time.perf_counter()
+    for entry in entries:
+        writer.submit(mission_id, entry)
+    await writer.stop()
+    assert writer.persisted_events == rows
+    return rows / (time.perf_counter() - started)
+
+
+async def main(rows: int) -> None:
+    engine = create_async_engine(settings.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    mission_ids = [uuid.uuid4(), uuid.uuid4()]
+    try:
+        per_row = await bench_per_row(session_factory, rows, mission_ids[0])
+        batched = await bench_writer(session_factory, rows, mission_ids[1])
+        print(f"per-row insert: {per_row:>10,.0f} rows/s")
+        print(f"EventWriter:    {batched:>10,.0f} rows/s ({batched / per_row:.1f}x)")
+    finally:
+        async with session_factory() as db_session:
+            await db_session.execute(delete(EventLog).where(EventLog.mission_id.in_(mission_ids)))
+            await db_session.execute(delete(Mission).where(Mission.id.in_(mission_ids)))
+            await db_session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,99 @@
+# backend/benchmarks/session_footprint.py
+"""Memory and tick cost per session, and how many sessions they let one instance run.
+
+Run with `python -m backend.benchmarks.session_footprint [sessions] [ticks]`.
+Every session starts the nominal scenario and is ticked `ticks` times.
+Memory is what tracemalloc sees allocated, per session: "simulator" is a bare
+`RovSimulator`; "session" is a `SimulationSession` around one, which adds
+the telemetry history ring and the queues. The tick cost is the per-session
+work of a scheduler pass (`update()`, `history.record()` and
+`get_telemetry_json()`). Capacity is sessions per GiB of memory, and sessions
+one core can tick at TICKS_PER_SECOND. To compare two commits, run it in a
+checkout of each.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+import uuid
+
+from backend.outbound_queue import OutboundQueue
+from backend.simulation_manager import SimulationSession
+from backend.simulator import RovSimulator
+
+START = {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+
+
+def _simulator() -> RovSimulator:
+    sim = RovSimulator()
+    sim.handle_command(START)
+    return sim
+
+
+def _session() -> SimulationSession:
+    # Frames are never sent, so the sessions need no socket.
+    ws = None
+    session = SimulationSession(
+        str(uuid.uuid4()), _simulator(), ws, OutboundQueue(ws)  # type: ignore[arg-type]
+    )
+    session.simulator.on_event = session.pending_events.append
+    return session
+
+
+def _tick(session: SimulationSession):
+    sim = session.simulator
+    sim.update()
+    session.history.record(sim)
+    sim.get_telemetry_json()
+    session.pending_events.clear()
+
+
+def bytes_per_simulator(sessions: int, ticks: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    sims = [_simulator() for _ in range(sessions)]
+    for _ in range(ticks):
+        for sim in sims:
+            sim.update()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated / sessions
+
+
+def bytes_per_session(sessions: int, ticks: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    live = [_session() for _ in range(sessions)]
+    for _ in range(ticks):
+        for session in live:
+            _tick(session)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated / sessions
+
+
+def us_per_tick(sessions: int, ticks: int) -> float:
+    live = [_session() for _ in range(sessions)]
+    started = time.perf_counter()
+    for _ in range(ticks):
+        for session in live:
+            _tick(session)
+    return (time.perf_counter() - started) / (sessions * ticks) * 1e6
+
+
+def main(sessions: int, ticks: int) -> None:
+    simulator = bytes_per_simulator(sessions, ticks)
+    session = bytes_per_session(sessions, ticks)
+    tick = us_per_tick(sessions, ticks)
+    tps = RovSimulator.TICKS_PER_SECOND
+    print(f"{sessions} sessions, {ticks} ticks each, {tps} ticks/s")
+    print(f"memory per simulator: {simulator / 1024:8.1f} KiB")
+    print(f"memory per session:   {session / 1024:8.1f} KiB ({2**30 / session:,.0f} per GiB)")
+    print(f"tick per session:     {tick:8.2f} us ({1e6 / (tick * tps):,.0f} per core)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1_000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    )
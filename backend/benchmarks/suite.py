@@ -0,0 +1,443 @@
+# backend/benchmarks/suite.py
+"""The backend's hot paths in one run, saved as JSON for comparing commits.
+
+    python -m backend.benchmarks.suite [--quick] [--only PREFIX ...] [--output FILE]
+    python -m backend.benchmarks.suite --compare BASE.json NEW.json
+
+Cases, each reported as microseconds per operation:
+  simulator.*   `RovSimulator.update` over a nominal mission, telemetry
+                snapshots (`get_telemetry` + `model_dump`, and the JSON fast
+                path) and `handle_command`; timed in rounds of many calls.
+  metrics.*     `Histogram.observe`, the instrumentation on the tick and send
+                paths (see backend/metrics.py).
+  manager.*     one scheduler pass of a `SimulationManager` with N sessions
+                (ticking, serializing and handing every frame to its socket).
+  repository.*  `EventLogRepository.insert`, and `list_events` /
+                `list_missions` on a seeded event_log; timed call by call
+                against the database in DATABASE_URL. Seeded rows use
+                throwaway mission ids and are deleted afterwards.
+
+The output file records the commit, interpreter and machine next to each
+case's samples summary (mean, median, p99, min, stdev, ops/s). `--compare`
+prints the median change per case between two such files; the default
+output name includes the commit so successive runs don't overwrite each other.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from backend import sim_snapshot
+from backend.config import settings
+from backend.db_models import EventLog, Mission
+from backend.metrics import Histogram
+from backend.query_cache import MISSIONS, QueryCache, event_tags
+from backend.repository import EventCursor, EventLogRepository
+from backend.simulation_manager import SimulationManager
+from backend.simulator import RovSimulator
+
+START_NOMINAL = {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+COMMANDS = [
+    {"command": "SET_PROPULSION_STATE", "payload": {"status": "inactive"}},
+    {"command": "SET_PROPULSION_STATE", "payload": {"status": "active"}},
+    {"command": "DEPLOY_ARM"},
+    {"command": "COLLECT_SAMPLE"},
+    {"command": "NOT_A_COMMAND"},
+]
+SEED_START = datetime(2001, 1, 1, tzinfo=UTC)
+
+
+def summarize(name: str, samples_us: list[float], **params) -> dict:
+    ordered = sorted(samples_us)
+    median = statistics.median(ordered)
+    return {
+        "name": name,
+        "params": params,
+        "samples": len(ordered),
+        "mean_us": statistics.fmean(ordered),
+        "median_us": median,
+        "p99_us": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))],
+        "min_us": ordered[0],
+        "stdev_us": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+        "ops_per_second": 1e6 / median if median else None,
+    }
+
+
+def _rounds(setup: Callable[[], Callable[[], object]], *, rounds: int, number: int) -> list[float]:
+    """Per-call microseconds of `number` calls of a fresh `setup()`, for each round."""
+    samples = []
+    for _ in range(rounds):
+        call = setup()
+        started = time.perf_counter()
+        for _ in range(number):
+            call()
+        samples.append((time.perf_counter() - started) / number * 1e6)
+    return samples
+
+
+async def _calls(call: Callable[[], Awaitable[object]], *, count: int, warmup: int = 5):
+    """Microseconds of each of `count` awaited calls, after `warmup` untimed ones."""
+    for _ in range(warmup):
+        await call()
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await call()
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+# --- Simulator ---
+
+
+def _running_simulator(warm_ticks: int = 0) -> RovSimulator:
+    sim = RovSimulator()
+    sim.handle_command(START_NOMINAL)
+    for _ in range(warm_ticks):
+        sim.update()
+    return sim
+
+
+def bench_simulator(quick: bool) -> list[dict]:
+    rounds = 10 if quick else 30
+    # A round is the first 200 ticks of a nominal mission: descent, arrival
+    # and searching, so every branch of the hot path is in the mix.
+    update = _rounds(lambda: _running_simulator().update, rounds=rounds, number=200)
+
+    def commands():
+        sim = _running_simulator(warm_ticks=10)
+        cycle = iter(COMMANDS * 200)
+        return lambda: sim.handle_command(next(cycle))
+
+    snapshot = _running_simulator(warm_ticks=20)
+    blob = sim_snapshot.snapshot(snapshot)
+    number = 2_000 if quick else 10_000
+    return [
+        summarize("simulator.update", update, ticks_per_round=200),
+        summarize(
+            "simulator.get_telemetry+model_dump",
+            _rounds(
+                lambda: lambda: snapshot.get_telemetry().model_dump(), rounds=rounds, number=number
+            ),
+        ),
+        summarize(
+            "simulator.get_telemetry_json",
+            _rounds(lambda: snapshot.get_telemetry_json, rounds=rounds, number=number),
+        ),
+        summarize("simulator.handle_command", _rounds(commands, rounds=rounds, number=1_000)),
+        summarize(
+            "simulator.snapshot",
+            _rounds(lambda: lambda: sim_snapshot.snapshot(snapshot), rounds=rounds, number=number),
+        ),
+        summarize(
+            "simulator.restore",
+            _rounds(lambda: lambda: sim_snapshot.restore(blob), rounds=rounds, number=number),
+        ),
+    ]
+
+
+# --- Metrics ---
+
+
+def bench_metrics(quick: bool) -> list[dict]:
+    histogram = Histogram()
+    values = iter([0.0003, 0.004, 0.07] * 40_000)
+    return [
+        summarize(
+            "metrics.histogram_observe",
+            _rounds(
+                lambda: lambda: histogram.observe(next(values)),
+                rounds=10 if quick else 30,
+                number=1_000,
+            ),
+        )
+    ]
+
+
+# --- SimulationManager ---
+
+
+class _SinkSocket:
+    """Accepts frames instantly, so a pass measures the server side only."""
+
+    async def send_text(self, text: str):
+        pass
+
+    async def close(self, code: int = 1000, reason: str | None = None):
+        pass
+
+
+async def _bench_manager(
+    sessions: int, passes: int, *, idle: bool = False
+) -> tuple[list[float], list[uuid.UUID]]:
+    manager = SimulationManager()
+    live = [await manager.create_session(_SinkSocket()) for _ in range(sessions)]  # type: ignore[arg-type]
+    # Drive the passes by hand instead of on the scheduler's clock.
+    assert manager._tick_task is not None
+    manager._tick_task.cancel()
+    manager._tick_task = None
+    if not idle:
+        for session in live:
+            await session.submit_command(START_NOMINAL)
+
+    samples = []
+    for _ in range(passes):
+        started = time.perf_counter()
+        for session in live:
+            manager._advance(session)
+        await asyncio.sleep(0)  # let the sender tasks write this pass's frames
+        samples.append((time.perf_counter() - started) * 1e6)
+    await manager.shutdown()
+    return samples, [session.mission_id for session in live]
+
+
+async def bench_manager(quick: bool, session_factory) -> list[dict]:
+    results, mission_ids = [], []
+    largest = SimulationManager.MAX_CONCURRENT_SESSIONS
+    for sessions in (1, 10, 100) if quick else (1, 10, 100, largest):
+        samples, ids = await _bench_manager(sessions, passes=50 if quick else 200)
+        mission_ids += ids
+        results.append(summarize("manager.tick_pass", samples, sessions=sessions))
+    # Connected sessions with no mission running, which hibernate.
+    sessions = 100 if quick else largest
+    samples, ids = await _bench_manager(sessions, passes=50 if quick else 200, idle=True)
+    mission_ids += ids
+    results.append(summarize("manager.tick_pass", samples, sessions=sessions, idle=True))
+    # The sessions recorded their missions through the EventWriter.
+    async with session_factory() as db_session:
+        await db_session.execute(delete(Mission).where(Mission.id.in_(mission_ids)))
+        await db_session.commit()
+    return results
+
+
+# --- Repository ---
+
+
+async def _seed(session_factory, missions: int, events_per_mission: int) -> list[uuid.UUID]:
+    mission_ids = [uuid.uuid4() for _ in range(missions)]
+    async with session_factory() as db_session:
+        repo = EventLogRepository(db_session)
+        for m, mission_id in enumerate(mission_ids):
+            await repo.insert_many(
+                [
+                    {
+                        "timestamp": SEED_START + timedelta(minutes=m, seconds=i),
+                        "severity": "CRITICAL" if i % 4 == 0 else "WARNING",
+                        "message": f"seeded event {i}",
+                        "mission_id": mission_id,
+                    }
+                    for i in range(events_per_mission)
+                ]
+            )
+    return mission_ids
+
+
+async def _delete(session_factory, mission_ids: list[uuid.UUID]):
+    async with session_factory() as db_session:
+        await db_session.execute(delete(EventLog).where(EventLog.mission_id.in_(mission_ids)))
+        await db_session.execute(delete(Mission).where(Mission.id.in_(mission_ids)))
+        await db_session.commit()
+
+
+async def bench_repository(quick: bool, session_factory) -> list[dict]:
+    count = 50 if quick else 300
+    missions, per_mission = (100, 100) if quick else (1_000, 100)
+    insert_mission = uuid.uuid4()
+    mission_ids = [insert_mission]
+    try:
+        async with session_factory() as db_session:
+            repo = EventLogRepository(db_session)
+
+            async def insert():
+                await repo.insert(
+                    timestamp=datetime.now(UTC),
+                    severity="WARNING",
+                    message="bench insert",
+                    mission_id=insert_mission,
+                )
+
+            results = [summarize("repository.insert", await _calls(insert, count=count))]
+
+        mission_ids += await _seed(session_factory, missions, per_mission)
+        middle = SEED_START + timedelta(minutes=missions // 2)
+        async with session_factory() as db_session:
+            repo = EventLogRepository(db_session)
+            (deep,) = await repo.list_events(since=middle, limit=1)
+            cases: dict[str, Callable[[], Awaitable[object]]] = {
+                "first_page": lambda: repo.list_events(since=SEED_START, limit=100),
+                "keyset_page": lambda: repo.list_events(
+                    after=EventCursor(deep.timestamp, deep.id), limit=100
+                ),
+                "mission": lambda: repo.list_events(mission_id=mission_ids[-1], limit=100),
+                "severity_range": lambda: repo.list_events(
+                    severity="CRITICAL", since=SEED_START, until=middle, limit=100
+                ),
+            }
+            for query, call in cases.items():
+                samples = await _calls(call, count=count)
+                results.append(
+                    summarize(
+                        "repository.list_events",
+                        samples,
+                        query=query,
+                        seeded_rows=missions * per_mission,
+                    )
+                )
+            samples = await _calls(lambda: repo.list_missions(limit=50), count=count)
+            results.append(
+                summarize("repository.list_missions", samples, limit=50, seeded_missions=missions)
+            )
+
+            # The same queries behind the API's read-through cache, as the
+            # HMI's repeated polls between writes see them.
+            cache = QueryCache(max_entries=1024, ttl_seconds=3600)
+            samples = await _calls(
+                lambda: cache.get_or_load("page", event_tags(None, None), cases["first_page"]),
+                count=count,
+            )
+            results.append(
+                summarize(
+                    "repository.list_events",
+                    samples,
+                    query="first_page",
+                    cached=True,
+                    seeded_rows=missions * per_mission,
+                )
+            )
+            samples = await _calls(
+                lambda: cache.get_or_load(
+                    "missions", (MISSIONS,), lambda: repo.list_missions(limit=50)
+                ),
+                count=count,
+            )
+            results.append(
+                summarize(
+                    "repository.list_missions",
+                    samples,
+                    limit=50,
+                    cached=True,
+                    seeded_missions=missions,
+                )
+            )
+    finally:
+        await _delete(session_factory, mission_ids)
+    return results
+
+
+# --- Runner ---
+
+
+def _metadata(quick: bool) -> dict:
+    def git(*args: str) -> str | None:
+        try:
+            return subprocess.run(
+                ["git", *args], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        "commit": git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "quick": quick,
+    }
+
+
+async def _run_async(quick: bool, selected: Callable[[str], bool]) -> list[dict]:
+    engine = create_async_engine(settings.database_url)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    results = []
+    try:
+        if selected("manager."):
+            results += await bench_manager(quick, session_factory)
+        if selected("repository."):
+            results += await bench_repository(quick, session_factory)
+    finally:
+        await engine.dispose()
+    return results
+
+
+def run(quick: bool, only: list[str]) -> dict:
+    def selected(group: str) -> bool:
+        return not only or any(group.startswith(p) or p.startswith(group) for p in only)
+
+    results = bench_simulator(quick) if selected("simulator.") else []
+    results += bench_metrics(quick) if selected("metrics.") else []
+    results += asyncio.run(_run_async(quick, selected))
+    if only:
+        results = [r for r in results if any(r["name"].startswith(p) for p in only)]
+    return {"metadata": _metadata(quick), "results": results}
+
+
+def _label(result: dict) -> str:
+    params = ",".join(f"{k}={v}" for k, v in result["params"].items() if k != "ticks_per_round")
+    return f"{result['name']}[{params}]" if params else result["name"]
+
+
+def _print(report: dict):
+    print(f"{'case':<64} {'median us':>11} {'p99 us':>11} {'ops/s':>12}")
+    for result in report["results"]:
+        print(
+            f"{_label(result):<64} {result['median_us']:>11.2f} "
+            f"{result['p99_us']:>11.2f} {result['ops_per_second']:>12,.0f}"
+        )
+
+
+def compare(base_path: str, new_path: str):
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    before = {_label(r): r for r in base["results"]}
+    print(f"{base['metadata']['commit']} -> {new['metadata']['commit']}")
+    print(f"{'case':<64} {'base us':>11} {'new us':>11} {'change':>8}")
+    for result in new["results"]:
+        label = _label(result)
+        if label not in before:
+            print(f"{label:<64} {'-':>11} {result['median_us']:>11.2f} {'new':>8}")
+            continue
+        old = before[label]["median_us"]
+        change = (result["median_us"] - old) / old * 100
+        print(f"{label:<64} {old:>11.2f} {result['median_us']:>11.2f} {change:>+7.1f}%")
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks.suite")
+    parser.add_argument("--quick", action="store_true", help="fewer rounds and smaller seeds")
+    parser.add_argument(
+        "--only", nargs="+", default=[], metavar="PREFIX", help="case name prefixes"
+    )
+    parser.add_argument("--output", help="results file (default: bench-results-<commit>.json)")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BASE", "NEW"), help="compare two results files"
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    report = run(args.quick, args.only)
+    _print(report)
+    output = args.output or f"bench-results-{report['metadata']['commit'] or 'unknown'}.json"
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Saved {len(report['results'])} results to {output}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,90 @@
+# backend/benchmarks/telemetry_archive.py
+"""Telemetry archive ingest: COPY (`TelemetryArchiver`) vs multi-row INSERT.
+
+Run with `python -m backend.benchmarks.telemetry_archive [sessions] [seconds]`
+against the database in DATABASE_URL. Simulates `sessions` sessions for
+`seconds` of mission time at TICKS_PER_SECOND, reports the per-tick cost of
+`record()` on the tick path and rows per second for each load method, and
+compares them with the rate the sessions generate. Rows are written under
+throwaway mission ids and deleted afterwards.
+"""
+import asyncio
+import sys
+import time
+import uuid
+
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from backend.clock import VirtualClock
+from backend.config import settings
+from backend.db_models import telemetry_sample
+from backend.simulator import RovSimulator
+from backend.telemetry_archive import COLUMNS, TelemetryArchiver
+
+
+def _simulators(sessions: int) -> list[tuple[uuid.UUID, RovSimulator, VirtualClock]]:
+    sims = []
+    for _ in range(sessions):
+        clock = VirtualClock()
+        sim = RovSimulator(clock=clock)
+        sim.handle_command({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        sims.append((uuid.uuid4(), sim, clock))
+    return sims
+
+
+def _fill(archiver: TelemetryArchiver, sims, ticks: int, tps: int) -> float:
+    """Record `ticks` ticks of every session; returns seconds spent in record()."""
+    spent = 0.0
+    for _ in range(ticks):
+        for mission_id, sim, clock in sims:
+            clock.advance(1 / tps)
+            sim.update()
+            started = time.perf_counter()
+            archiver.record(mission_id, sim)
+            spent += time.perf_counter() - started
+    return spent
+
+
+async def main(sessions: int = 50, seconds: int = 600) -> None:
+    tps = settings.ticks_per_second
+    ticks = seconds * tps
+    rows = sessions * ticks
+    engine = create_async_engine(settings.database_url)
+    archiver = TelemetryArchiver(engine=engine, max_pending=rows)
+    sims = _simulators(sessions)
+    try:
+        record_seconds = _fill(archiver, sims, ticks, tps)
+        batch = list(archiver._pending)
+
+        archiver.start()
+        started = time.perf_counter()
+        await archiver.stop()
+        copy_rate = rows / (time.perf_counter() - started)
+        assert archiver.archived_samples == rows
+
+        started = time.perf_counter()
+        async with engine.begin() as conn:
+            await conn.execute(
+                insert(telemetry_sample),
+                [dict(zip(COLUMNS, row, strict=True)) for row in batch],
+            )
+        insert_rate = rows / (time.perf_counter() - started)
+
+        needed = sessions * tps
+        print(f"{sessions} sessions x {tps} ticks/s = {needed:,} rows/s needed")
+        print(f"record():          {record_seconds / rows * 1e6:>10.2f} us/tick")
+        print(f"multi-row INSERT:  {insert_rate:>10,.0f} rows/s")
+        print(f"COPY:              {copy_rate:>10,.0f} rows/s ({copy_rate / insert_rate:.1f}x)")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(
+                delete(telemetry_sample).where(
+                    telemetry_sample.c.mission_id.in_([mission_id for mission_id, _, _ in sims])
+                )
+            )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(*(int(arg) for arg in sys.argv[1:3])))
@@ -0,0 +1,50 @@
+# backend/benchmarks/telemetry_serialization.py
+"""Microseconds per telemetry frame: pydantic + send_json path vs the fast path.
+
+Run with `python -m backend.benchmarks.telemetry_serialization [frames]`.
+"before" is what the tick loop used to do per frame (build a TelemetryMessage,
+`model_dump()` it, then encode it the way Starlette's `send_json` does);
+"after" is `RovSimulator.get_telemetry_json()`.
+"""
+import json
+import sys
+import time
+import warnings
+
+from backend.simulator import RovSimulator
+
+
+def _simulator() -> RovSimulator:
+    sim = RovSimulator()
+    sim.handle_command({"command": "START_SIMULATION", "payload": {"scenario": "power_fault"}})
+    for _ in range(20):
+        sim.update()
+    return sim
+
+
+def bench_pydantic(frames: int) -> float:
+    sim = _simulator()
+    started = time.perf_counter()
+    for _ in range(frames):
+        json.dumps(sim.get_telemetry().model_dump(), separators=(",", ":"), ensure_ascii=False)
+    return (time.perf_counter() - started) / frames * 1e6
+
+
+def bench_fast_path(frames: int) -> float:
+    sim = _simulator()
+    started = time.perf_counter()
+    for _ in range(frames):
+        sim.get_telemetry_json()
+    return (time.perf_counter() - started) / frames * 1e6
+
+
+def main(frames: int) -> None:
+    warnings.simplefilter("ignore")
+    before = bench_pydantic(frames)
+    after = bench_fast_path(frames)
+    print(f"pydantic + json.dumps: {before:6.2f} us/frame")
+    print(f"get_telemetry_json:    {after:6.2f} us/frame ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,373 @@
+# backend/benchmarks/ws_load.py
+"""Load-test /ws/telemetry with N synthetic operator clients on one Linux box.
+
+Run with `python -m backend.benchmarks.ws_load [--clients N ...] [--duration S]`.
+Without `--url` a backend is started with uvicorn on a free local port (using
+this environment's DATABASE_URL, i.e. the local Postgres) and stopped at the
+end; with `--url` pass `--server-pid` to also sample the server's CPU.
+
+Each client plays one of SCRIPTS on a loop (start a scenario, deploy the arm,
+jettison, ...) for the whole run. Several `--clients` values run as successive
+levels against the same server, one report row per level:
+
+  tick p50/p99   spacing of the server timestamps on consecutive frames; with
+                 jitter (p99 of |spacing - 1/tick_rate|, the rate the frame
+                 advertises, or TICKS_PER_SECOND from older servers) it shows
+                 how far the shared scheduler drifts from its period under
+                 load. A conflated frame (see OutboundQueue) shows up as a
+                 double gap.
+  latency        receive time minus the frame's server timestamp, i.e. tick to
+                 client, on the same clock since both ends share the machine.
+  rejected       connections closed with 1013 before the first frame (server
+                 at capacity); `slow` counts 1013 closes after it.
+  server cpu     mean/max percent of one core, server plus worker processes,
+                 sampled from /proc once a second.
+
+With `--idle-share F` that fraction of each level's clients connect and
+never send a command, leaving their sessions in standby. Their frames are
+counted (`idle f/s`) but kept out of the tick and latency columns, which
+then describe the operators alone.
+
+The clients share this process, so `load cpu` is reported too: near 100% the
+client is the bottleneck and latencies are overstated.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import websockets
+
+from backend.config import settings
+
+
+def _start(scenario: str) -> dict:
+    return {"command": "START_SIMULATION", "payload": {"scenario": scenario}}
+
+
+def _propulsion(status: str) -> dict:
+    return {"command": "SET_PROPULSION_STATE", "payload": {"status": status}}
+
+
+RESET = {"command": "RESET_SIMULATION"}
+
+# (seconds to wait, command) steps, replayed from the top when they run out.
+SCRIPTS: dict[str, list[tuple[float, dict]]] = {
+    "survey": [
+        (0, _start("nominal")),
+        (2, {"command": "DEPLOY_ARM"}),
+        (1, {"command": "COLLECT_SAMPLE"}),
+        (5, RESET),
+    ],
+    "pressure": [
+        (0, _start("pressure_anomaly")),
+        (3, _propulsion("inactive")),
+        (2, _propulsion("active")),
+        (3, RESET),
+    ],
+    "power": [
+        (0, _start("power_fault")),
+        (3, {"command": "JETTISON_PACKAGE"}),
+        (5, RESET),
+    ],
+}
+
+
+@dataclass
+class LevelStats:
+    clients: int
+    connected: int = 0
+    rejected: int = 0
+    failed: int = 0
+    slow: int = 0
+    commands: int = 0
+    frames: int = 0
+    idle_frames: int = 0
+    intervals_ms: list[float] = field(default_factory=list)
+    # The interval each frame's advertised tick_rate promised (None: unknown).
+    expected_ms: list[float | None] = field(default_factory=list)
+    latencies_ms: list[float] = field(default_factory=list)
+    server_cpu: list[float] = field(default_factory=list)
+    load_cpu: float = 0.0
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def _parse(text: str | bytes) -> tuple[float, float | None]:
+    """The frame's tick timestamp and its tick_rate, if the frame carries one."""
+    frame = json.loads(text)
+    if "type" in frame:  # ?encoding=delta; the timestamp changes every tick
+        frame = frame.get("telemetry") or frame["changes"]
+    return datetime.fromisoformat(frame["timestamp"]).timestamp(), frame.get("tick_rate")
+
+
+# --- Clients ---
+
+
+async def _play(ws, script: list[tuple[float, dict]], stats: LevelStats):
+    for delay, command in itertools.cycle(script):
+        await asyncio.sleep(delay)
+        await ws.send(json.dumps(command))
+        stats.commands += 1
+
+
+async def _client(
+    url: str, script: list[tuple[float, dict]] | None, deadline: float, stats: LevelStats
+):
+    """One operator playing `script`, or an idle client if it's None."""
+    try:
+        ws = await websockets.connect(url, max_size=None)
+    except (OSError, websockets.InvalidHandshake):
+        stats.failed += 1
+        return
+
+    player = None
+    received = False
+    last_tick = None
+    rate = None
+    try:
+        async with asyncio.timeout_at(deadline):
+            async for text in ws:
+                now = time.time()
+                tick, frame_rate = _parse(text)
+                rate = frame_rate or rate  # delta frames only carry it on change
+                if not received:
+                    received = True
+                    stats.connected += 1
+                    if script is not None:
+                        player = asyncio.create_task(_play(ws, script, stats))
+                if script is None:
+                    stats.idle_frames += 1
+                    continue
+                stats.frames += 1
+                stats.latencies_ms.append((now - tick) * 1000)
+                if last_tick is not None:
+                    stats.intervals_ms.append((tick - last_tick) * 1000)
+                    stats.expected_ms.append(1000 / rate if rate else None)
+                last_tick = tick
+    except TimeoutError:
+        pass
+    except websockets.ConnectionClosed:
+        pass
+    finally:
+        if player:
+            player.cancel()
+        await ws.close()
+
+    if ws.close_code == 1013:
+        if received:
+            stats.slow += 1
+        else:
+            stats.rejected += 1
+    elif not received:
+        stats.failed += 1
+
+
+# --- Server CPU ---
+
+
+def _cpu_seconds(pid: int) -> float:
+    """utime + stime of `pid` and its direct children (sharded workers), from /proc."""
+    total = 0.0
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # Fields after the parenthesized command: state, ppid, ... utime, stime.
+                fields = f.read().rpartition(")")[2].split()
+        except OSError:
+            continue
+        if int(entry) == pid or int(fields[1]) == pid:
+            total += int(fields[11]) + int(fields[12])
+    return total / os.sysconf("SC_CLK_TCK")
+
+
+async def _sample_cpu(pid: int, samples: list[float]):
+    last, last_at = _cpu_seconds(pid), time.monotonic()
+    while True:
+        await asyncio.sleep(1)
+        now, now_at = _cpu_seconds(pid), time.monotonic()
+        samples.append((now - last) / (now_at - last_at) * 100)
+        last, last_at = now, now_at
+
+
+# --- Runner ---
+
+
+async def run_level(
+    url: str,
+    clients: int,
+    duration: float,
+    ramp: float,
+    server_pid: int | None,
+    idle_share: float = 0.0,
+) -> LevelStats:
+    stats = LevelStats(clients)
+    sampler = asyncio.create_task(_sample_cpu(server_pid, stats.server_cpu)) if server_pid else None
+    started_cpu = time.process_time()
+    started = time.monotonic()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + ramp + duration
+    scripts = itertools.cycle(SCRIPTS.values())
+    idle = round(clients * idle_share)
+    tasks = []
+    for i in range(clients):
+        script = next(scripts) if i >= idle else None
+        tasks.append(asyncio.create_task(_client(url, script, deadline, stats)))
+        if ramp:
+            await asyncio.sleep(ramp / clients)
+    await asyncio.gather(*tasks)
+    stats.load_cpu = (time.process_time() - started_cpu) / (time.monotonic() - started) * 100
+    if sampler:
+        sampler.cancel()
+    return stats
+
+
+def summarize(stats: LevelStats, period_ms: float) -> dict:
+    jitter = [
+        abs(interval - (expected or period_ms))
+        for interval, expected in zip(stats.intervals_ms, stats.expected_ms, strict=True)
+    ]
+    return {
+        "clients": stats.clients,
+        "connected": stats.connected,
+        "rejected": stats.rejected,
+        "slow": stats.slow,
+        "failed": stats.failed,
+        "commands": stats.commands,
+        "frames": stats.frames,
+        "idle_frames": stats.idle_frames,
+        "tick_interval_ms_p50": _percentile(stats.intervals_ms, 0.5),
+        "tick_interval_ms_p99": _percentile(stats.intervals_ms, 0.99),
+        "tick_jitter_ms_p99": _percentile(jitter, 0.99),
+        "latency_ms_p50": _percentile(stats.latencies_ms, 0.5),
+        "latency_ms_p99": _percentile(stats.latencies_ms, 0.99),
+        "server_cpu_mean": statistics.fmean(stats.server_cpu) if stats.server_cpu else None,
+        "server_cpu_max": max(stats.server_cpu, default=None),
+        "load_cpu": stats.load_cpu,
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _wait_for_port(port: int, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"backend did not start listening on port {port}") from None
+            await asyncio.sleep(0.2)
+            continue
+        writer.close()
+        return
+
+
+def _spawn_backend(port: int) -> subprocess.Popen:
+    # A free gRPC port too, so the harness never collides with a dev server.
+    env = {**os.environ, "GRPC_PORT": "0"}
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--port", str(port)]
+        + ["--log-level", "warning"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+def _print(row: dict):
+    def cpu(value):
+        return f"{value:>5.0f}%" if value is not None else f"{'-':>6}"
+
+    print(
+        f"{row['clients']:>7} {row['connected']:>9} {row['rejected']:>8} {row['slow']:>5} "
+        f"{row['frames'] / row['duration']:>8.0f} {row['idle_frames'] / row['duration']:>8.0f} "
+        f"{row['tick_interval_ms_p50']:>8.1f} {row['tick_interval_ms_p99']:>8.1f} "
+        f"{row['tick_jitter_ms_p99']:>9.1f} "
+        f"{row['latency_ms_p50']:>8.1f} {row['latency_ms_p99']:>8.1f} "
+        f"{cpu(row['server_cpu_mean'])} {cpu(row['server_cpu_max'])} {cpu(row['load_cpu'])}"
+    )
+
+
+async def _main(args) -> list[dict]:
+    server = None
+    url, server_pid = args.url, args.server_pid
+    if url is None:
+        port = _free_port()
+        server = _spawn_backend(port)
+        server_pid = server.pid
+        url = f"ws://127.0.0.1:{port}/ws/telemetry"
+        await _wait_for_port(port)
+    if args.encoding != "full":
+        url += f"?encoding={args.encoding}"
+
+    period_ms = 1000 / args.tick_rate
+    print(f"{url}, {args.tick_rate} ticks/s, {args.duration:.0f}s per level")
+    print(
+        f"{'clients':>7} {'connected':>9} {'rejected':>8} {'slow':>5} "
+        f"{'frames/s':>8} {'idle f/s':>8} {'tick p50':>8} {'tick p99':>8} {'jitter99':>9} "
+        f"{'lat p50':>8} {'lat p99':>8} "
+        f"{'srv cpu':>6} {'max':>6} {'load':>6}"
+    )
+    rows = []
+    try:
+        for clients in args.clients:
+            stats = await run_level(
+                url, clients, args.duration, args.ramp, server_pid, args.idle_share
+            )
+            row = {**summarize(stats, period_ms), "duration": args.duration}
+            _print(row)
+            rows.append(row)
+            await asyncio.sleep(1)  # let the server tear the level's sessions down
+    finally:
+        if server:
+            server.send_signal(signal.SIGINT)
+            server.wait(timeout=30)
+    return rows
+
+
+def main(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks.ws_load")
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 50, 100, 200, 250])
+    parser.add_argument("--duration", type=float, default=20, help="seconds per level")
+    parser.add_argument("--ramp", type=float, default=2, help="seconds to open the clients over")
+    parser.add_argument("--url", help="ws:// URL of a running /ws/telemetry endpoint")
+    parser.add_argument("--server-pid", type=int, help="sample this process's CPU (with --url)")
+    parser.add_argument("--encoding", choices=["full", "delta"], default="full")
+    parser.add_argument(
+        "--idle-share", type=float, default=0.0, help="fraction of clients sending nothing"
+    )
+    parser.add_argument(
+        "--tick-rate", type=float, default=settings.ticks_per_second,
+        help="the server's TICKS_PER_SECOND (default: this environment's)",
+    )
+    parser.add_argument("--output", help="also write the report rows to this JSON file")
+    args = parser.parse_args(argv)
+
+    rows = asyncio.run(_main(args))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"url": args.url, "encoding": args.encoding, "levels": rows}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,25 @@
+# backend/clock.py
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+
+# A clock is any zero-argument callable returning an aware datetime. Simulators
+# take one so their log and telemetry timestamps can run on simulated time.
+Clock = Callable[[], datetime]
+
+
+def utc_now() -> datetime:
+    """The real wall clock, used by default."""
+    return datetime.now(UTC)
+
+
+class VirtualClock:
+    """A clock that only moves when advanced, for running simulations headless."""
+
+    def __init__(self, start: datetime | None = None):
+        self.now = start or utc_now()
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += timedelta(seconds=seconds)
@@ -12,6 +12,35 @@ class Settings(BaseSettings):
     cors_origins: list[str] = ["http://localhost:5173"]
     ticks_per_second: int = 2
     log_level: str = "INFO"
+    # Number of worker processes that run simulation sessions. 0 keeps every
+    # session on the API process's event loop; N > 0 shards sessions across N
+    # processes so tick work scales with cores (see backend/sharding.py).
+    simulation_workers: int = 0
+    # Seconds of telemetry each session keeps in memory for
+    # /api/v1/sessions/{id}/telemetry; the buffer holds this many seconds'
+    # worth of ticks and never grows beyond that.
+    telemetry_history_seconds: int = 300
+    # Mission log entries each session keeps in memory; older ones spill to
+    # a per-session file in `mission_log_dir` (the system temp directory if
+    # unset) and are read back when the full log is requested.
+    mission_log_memory_entries: int = 1000
+    mission_log_dir: str | None = None
+    # In-process cache of /api/v1/events and /api/v1/missions results (see
+    # backend/query_cache.py). Entries are invalidated when this process
+    # persists events they cover; the TTL bounds how stale they can get from
+    # writes it doesn't see. 0 entries disables it.
+    query_cache_entries: int = 1024
+    query_cache_ttl_seconds: float = 30.0
+    # Archive every tick of every session to the partitioned telemetry_sample
+    # table (see backend/telemetry_archive.py). Off by default: it is the
+    # bulk of the database's write volume.
+    telemetry_archive: bool = False
+    # Directory of extra scenario files (*.toml, see backend/scenario_engine.py)
+    # loaded alongside backend/scenarios/; one named like a built-in replaces it.
+    scenarios_dir: str | None = None
+    # Port of the gRPC MissionLogService served alongside the HTTP API
+    # (0 binds a free port, as the test suite does).
+    grpc_port: int = 50051
     # When true, the DB engine uses NullPool so connections are never reused
     # across event loops. The test suite spins up a fresh event loop per
     # TestClient, and pooled asyncpg connections are bound to the loop that
@@ -2,7 +2,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, Text
+from sqlalchemy import REAL, Column, DateTime, Index, Integer, String, Table, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -21,3 +21,47 @@ class EventLog(Base):
     severity: Mapped[str] = mapped_column(String(16), index=True)
     message: Mapped[str] = mapped_column(Text)
     mission_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), index=True)
+
+
+class Mission(Base):
+    """Per-mission summary, maintained incrementally as events are persisted.
+
+    A row is written when a session starts and its scenario/status are kept
+    current as they change; `event_count` and the first/last event timestamps
+    are bumped in the same transaction that inserts the mission's events, so
+    listing missions never has to aggregate `event_log`.
+    """
+
+    __tablename__ = "mission"
+
+    # Same value as EventLog.mission_id (the session id).
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    # Unknown for missions reconstructed from event_log alone (see backfill).
+    scenario: Mapped[str | None] = mapped_column(String(32))
+    status: Mapped[str | None] = mapped_column(String(32))
+    event_count: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    first_event_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    last_event_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+
+
+# Per-tick telemetry archive (optional, see Settings.telemetry_archive).
+# Range-partitioned by day on `timestamp`, so old days can be detached or
+# dropped wholesale; partitions are created on demand by TelemetryArchiver.
+# A plain Table rather than a mapped class: rows are only ever bulk-loaded
+# with COPY and read back as aggregates, and a partitioned table has no
+# natural primary key to map.
+telemetry_sample = Table(
+    "telemetry_sample",
+    Base.metadata,
+    Column("mission_id", UUID(as_uuid=True), nullable=False),
+    Column("timestamp", DateTime(timezone=True), nullable=False),
+    Column("charge_percent", REAL, nullable=False),
+    Column("power_level_percent", REAL, nullable=False),
+    Column("hull_pressure_kpa", Integer, nullable=False),
+    Column("depth_meters", REAL, nullable=False),
+    Column("water_temp_celsius", REAL, nullable=False),
+    Column("mission_status", String(32), nullable=False),
+    Index("ix_telemetry_sample_mission_id_timestamp", "mission_id", "timestamp"),
+    postgresql_partition_by="RANGE (timestamp)",
+)
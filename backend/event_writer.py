@@ -0,0 +1,156 @@
+# backend/event_writer.py
+import asyncio
+import logging
+import time
+import uuid
+from collections.abc import Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.database import async_session_factory
+from backend.logs import LogEntry
+from backend.metrics import Histogram
+from backend.repository import EventLogRepository, MissionUpdate
+
+logger = logging.getLogger(__name__)
+
+
+class EventWriter:
+    """Write-behind persistence for mission events from every session.
+
+    `submit` only enqueues, so the tick loop never waits on Postgres. A single
+    background task drains the queue and writes batches with one multi-row
+    INSERT and one commit, flushing when `batch_size` entries are waiting or
+    `flush_interval` seconds after the first entry of a batch arrived,
+    whichever comes first. The queue is bounded: once `max_queue` entries are
+    waiting (e.g. the database is down), new entries are dropped and counted
+    rather than growing memory without limit.
+
+    Mission scenario/status changes (`submit_mission`) travel through the same
+    queue, so a mission's row is written before the events that follow it.
+
+    After each batch, written or not (a failed one may be partly committed),
+    `on_write` is called with the batch's (severity, mission_id) pairs, e.g.
+    to invalidate cached queries.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_queue: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 0.25,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        on_write: Callable[[set[tuple[str, uuid.UUID]]], None] | None = None,
+    ):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._session_factory = session_factory
+        self.on_write = on_write
+        # Unbounded at the asyncio level so stop() can always enqueue its
+        # sentinel; the max_queue bound is enforced in submit().
+        self._queue: asyncio.Queue[tuple[uuid.UUID, LogEntry] | MissionUpdate | None] = (
+            asyncio.Queue()
+        )
+        self._task: asyncio.Task | None = None
+        self.persisted_events = 0
+        self.dropped_events = 0
+        self.failed_events = 0
+        # Duration of each batch's round trip to Postgres, failed ones included.
+        self.write_seconds = Histogram()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Flush everything already submitted, then stop the background task."""
+        if self._task is None:
+            return
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+
+    def submit(self, mission_id: uuid.UUID, entry: LogEntry) -> bool:
+        """Queue one entry for persistence; returns False if it was dropped."""
+        if self._queue.qsize() >= self.max_queue:
+            self.dropped_events += 1
+            return False
+        self._queue.put_nowait((mission_id, entry))
+        return True
+
+    def submit_mission(self, update: MissionUpdate):
+        """Queue a mission start or scenario/status change.
+
+        Not subject to `max_queue`: there are only a handful per mission, and
+        dropping one would leave the mission's summary stale for good.
+        """
+        self._queue.put_nowait(update)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            stopping = False
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except TimeoutError:
+                        break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+            if stopping:
+                return
+
+    async def _flush(self, batch: list[tuple[uuid.UUID, LogEntry] | MissionUpdate]):
+        missions = []
+        rows = []
+        events: set[tuple[str, uuid.UUID]] = set()
+        for item in batch:
+            if isinstance(item, MissionUpdate):
+                missions.append(item)
+                continue
+            mission_id, entry = item
+            events.add((entry.level.value, mission_id))
+            rows.append(
+                {
+                    "timestamp": entry.timestamp,
+                    "severity": entry.level.value,
+                    "message": entry.message,
+                    "mission_id": mission_id,
+                }
+            )
+        started = time.perf_counter()
+        try:
+            async with self._session_factory() as db_session:
+                repo = EventLogRepository(db_session)
+                await repo.upsert_missions(missions)
+                await repo.insert_many(rows)
+        except Exception:
+            self.failed_events += len(rows)
+            logger.exception("Failed to persist %d mission events", len(rows))
+            return
+        finally:
+            self.write_seconds.observe(time.perf_counter() - started)
+            if self.on_write is not None:
+                self.on_write(events)
+        self.persisted_events += len(rows)
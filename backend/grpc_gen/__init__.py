@@ -0,0 +1,8 @@
+# backend/grpc_gen/__init__.py
+"""Generated gRPC/protobuf code for proto/mission_log.proto. Do not edit.
+
+Regenerate from the repository root after changing the proto:
+
+    python -m grpc_tools.protoc -Ibackend/grpc_gen=proto \
+        --python_out=. --pyi_out=. --grpc_python_out=. proto/mission_log.proto
+"""
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: backend/grpc_gen/mission_log.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'backend/grpc_gen/mission_log.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\"backend/grpc_gen/mission_log.proto\"*\n\x14GetMissionLogRequest\x12\x12\n\nmission_id\x18\x01 \x01(\t\"3\n\x15GetMissionLogResponse\x12\x1a\n\x07\x65ntries\x18\x01 \x03(\x0b\x32\t.LogEntry\"-\n\x17StreamMissionLogRequest\x12\x12\n\nmission_id\x18\x01 \x01(\t\"\xa4\x01\n\x08LogEntry\x12\x11\n\ttimestamp\x18\x01 \x01(\t\x12!\n\x05level\x18\x02 \x01(\x0e\x32\x12.LogEntry.LogLevel\x12\x0f\n\x07message\x18\x03 \x01(\t\x12\x12\n\nmission_id\x18\x04 \x01(\t\"=\n\x08LogLevel\x12\x08\n\x04INFO\x10\x00\x12\x0b\n\x07WARNING\x10\x01\x12\x0c\n\x08\x43RITICAL\x10\x02\x12\x0c\n\x08OPERATOR\x10\x03\x32\x8e\x01\n\x11MissionLogService\x12>\n\rGetMissionLog\x12\x15.GetMissionLogRequest\x1a\x16.GetMissionLogResponse\x12\x39\n\x10StreamMissionLog\x12\x18.StreamMissionLogRequest\x1a\t.LogEntry0\x01\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'backend.grpc_gen.mission_log_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_GETMISSIONLOGREQUEST']._serialized_start=38
+  _globals['_GETMISSIONLOGREQUEST']._serialized_end=80
+  _globals['_GETMISSIONLOGRESPONSE']._serialized_start=82
+  _globals['_GETMISSIONLOGRESPONSE']._serialized_end=133
+  _globals['_STREAMMISSIONLOGREQUEST']._serialized_start=135
+  _globals['_STREAMMISSIONLOGREQUEST']._serialized_end=180
+  _globals['_LOGENTRY']._serialized_start=183
+  _globals['_LOGENTRY']._serialized_end=347
+  _globals['_LOGENTRY_LOGLEVEL']._serialized_start=286
+  _globals['_LOGENTRY_LOGLEVEL']._serialized_end=347
+  _globals['_MISSIONLOGSERVICE']._serialized_start=350
+  _globals['_MISSIONLOGSERVICE']._serialized_end=492
+# @@protoc_insertion_point(module_scope)
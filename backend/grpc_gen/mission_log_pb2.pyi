@@ -0,0 +1,48 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from collections.abc import Iterable as _Iterable, Mapping as _Mapping
+from typing import ClassVar as _ClassVar, Optional as _Optional, Union as _Union
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class GetMissionLogRequest(_message.Message):
+    __slots__ = ("mission_id",)
+    MISSION_ID_FIELD_NUMBER: _ClassVar[int]
+    mission_id: str
+    def __init__(self, mission_id: _Optional[str] = ...) -> None: ...
+
+class GetMissionLogResponse(_message.Message):
+    __slots__ = ("entries",)
+    ENTRIES_FIELD_NUMBER: _ClassVar[int]
+    entries: _containers.RepeatedCompositeFieldContainer[LogEntry]
+    def __init__(self, entries: _Optional[_Iterable[_Union[LogEntry, _Mapping]]] = ...) -> None: ...
+
+class StreamMissionLogRequest(_message.Message):
+    __slots__ = ("mission_id",)
+    MISSION_ID_FIELD_NUMBER: _ClassVar[int]
+    mission_id: str
+    def __init__(self, mission_id: _Optional[str] = ...) -> None: ...
+
+class LogEntry(_message.Message):
+    __slots__ = ("timestamp", "level", "message", "mission_id")
+    class LogLevel(int, metaclass=_enum_type_wrapper.EnumTypeWrapper):
+        __slots__ = ()
+        INFO: _ClassVar[LogEntry.LogLevel]
+        WARNING: _ClassVar[LogEntry.LogLevel]
+        CRITICAL: _ClassVar[LogEntry.LogLevel]
+        OPERATOR: _ClassVar[LogEntry.LogLevel]
+    INFO: LogEntry.LogLevel
+    WARNING: LogEntry.LogLevel
+    CRITICAL: LogEntry.LogLevel
+    OPERATOR: LogEntry.LogLevel
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    LEVEL_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    MISSION_ID_FIELD_NUMBER: _ClassVar[int]
+    timestamp: str
+    level: LogEntry.LogLevel
+    message: str
+    mission_id: str
+    def __init__(self, timestamp: _Optional[str] = ..., level: _Optional[_Union[LogEntry.LogLevel, str]] = ..., message: _Optional[str] = ..., mission_id: _Optional[str] = ...) -> None: ...
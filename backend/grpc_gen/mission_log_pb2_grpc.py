@@ -0,0 +1,143 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from backend.grpc_gen import mission_log_pb2 as backend_dot_grpc__gen_dot_mission__log__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in backend/grpc_gen/mission_log_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class MissionLogServiceStub:
+    """Missing associated documentation comment in .proto file."""
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.GetMissionLog = channel.unary_unary(
+                '/MissionLogService/GetMissionLog',
+                request_serializer=backend_dot_grpc__gen_dot_mission__log__pb2.GetMissionLogRequest.SerializeToString,
+                response_deserializer=backend_dot_grpc__gen_dot_mission__log__pb2.GetMissionLogResponse.FromString,
+                _registered_method=True)
+        self.StreamMissionLog = channel.unary_stream(
+                '/MissionLogService/StreamMissionLog',
+                request_serializer=backend_dot_grpc__gen_dot_mission__log__pb2.StreamMissionLogRequest.SerializeToString,
+                response_deserializer=backend_dot_grpc__gen_dot_mission__log__pb2.LogEntry.FromString,
+                _registered_method=True)
+
+
+class MissionLogServiceServicer:
+    """Missing associated documentation comment in .proto file."""
+
+    def GetMissionLog(self, request, context):
+        """A mission's persisted log (WARNING and CRITICAL entries), oldest first.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamMissionLog(self, request, context):
+        """Entries as running sessions emit them, every level, until the client
+        cancels. Ends with RESOURCE_EXHAUSTED if the client falls too far behind.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_MissionLogServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'GetMissionLog': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetMissionLog,
+                    request_deserializer=backend_dot_grpc__gen_dot_mission__log__pb2.GetMissionLogRequest.FromString,
+                    response_serializer=backend_dot_grpc__gen_dot_mission__log__pb2.GetMissionLogResponse.SerializeToString,
+            ),
+            'StreamMissionLog': grpc.unary_stream_rpc_method_handler(
+                    servicer.StreamMissionLog,
+                    request_deserializer=backend_dot_grpc__gen_dot_mission__log__pb2.StreamMissionLogRequest.FromString,
+                    response_serializer=backend_dot_grpc__gen_dot_mission__log__pb2.LogEntry.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'MissionLogService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('MissionLogService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class MissionLogService:
+    """Missing associated documentation comment in .proto file."""
+
+    @staticmethod
+    def GetMissionLog(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/MissionLogService/GetMissionLog',
+            backend_dot_grpc__gen_dot_mission__log__pb2.GetMissionLogRequest.SerializeToString,
+            backend_dot_grpc__gen_dot_mission__log__pb2.GetMissionLogResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamMissionLog(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/MissionLogService/StreamMissionLog',
+            backend_dot_grpc__gen_dot_mission__log__pb2.StreamMissionLogRequest.SerializeToString,
+            backend_dot_grpc__gen_dot_mission__log__pb2.LogEntry.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,87 @@
+# backend/grpc_server.py
+"""gRPC `MissionLogService` (proto/mission_log.proto), served next to FastAPI.
+
+The server runs on the same event loop as the app, started and stopped by its
+lifespan on GRPC_PORT. `GetMissionLog` reads a mission's persisted entries
+from `event_log`; `StreamMissionLog` subscribes to the manager's
+`MissionLogHub` and pushes entries as the simulators emit them, without ever
+polling the database.
+"""
+import uuid
+
+import grpc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from backend.database import async_session_factory
+from backend.grpc_gen import mission_log_pb2, mission_log_pb2_grpc
+from backend.logs import LogEntry
+from backend.mission_log_hub import MissionLogHub, SubscriberOverflowError
+from backend.repository import EventLogRepository
+
+
+def _entry_message(mission_id: uuid.UUID, entry: LogEntry) -> mission_log_pb2.LogEntry:
+    return mission_log_pb2.LogEntry(
+        timestamp=entry.timestamp.isoformat(),
+        level=mission_log_pb2.LogEntry.LogLevel.Value(entry.level.value),
+        message=entry.message,
+        mission_id=str(mission_id),
+    )
+
+
+async def _parse_mission_id(value: str, context: grpc.aio.ServicerContext) -> uuid.UUID:
+    try:
+        return uuid.UUID(value)
+    except ValueError:
+        await context.abort(grpc.StatusCode.INVALID_ARGUMENT, f"Invalid mission_id: {value!r}")
+        raise  # abort() raises; this only satisfies the type checker
+
+
+class MissionLogServicer(mission_log_pb2_grpc.MissionLogServiceServicer):
+    def __init__(
+        self,
+        hub: MissionLogHub,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+    ):
+        self._hub = hub
+        self._session_factory = session_factory
+
+    async def GetMissionLog(self, request, context):
+        mission_id = await _parse_mission_id(request.mission_id, context)
+        async with self._session_factory() as session:
+            events = await EventLogRepository(session).get_by_mission(mission_id)
+        return mission_log_pb2.GetMissionLogResponse(
+            entries=[
+                mission_log_pb2.LogEntry(
+                    timestamp=event.timestamp.isoformat(),
+                    level=mission_log_pb2.LogEntry.LogLevel.Value(event.severity),
+                    message=event.message,
+                    mission_id=str(event.mission_id),
+                )
+                for event in events
+            ]
+        )
+
+    async def StreamMissionLog(self, request, context):
+        mission_id = None
+        if request.mission_id:
+            mission_id = await _parse_mission_id(request.mission_id, context)
+        subscription = self._hub.subscribe(mission_id)
+        try:
+            async for entry_mission_id, entry in subscription:
+                yield _entry_message(entry_mission_id, entry)
+        except SubscriberOverflowError:
+            await context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                "Subscriber fell too far behind; re-fetch with GetMissionLog and resubscribe",
+            )
+        finally:
+            subscription.close()
+
+
+async def start_grpc_server(hub: MissionLogHub, port: int) -> tuple[grpc.aio.Server, int]:
+    """Start serving on `port` (0 picks a free one); returns the server and bound port."""
+    server = grpc.aio.server()
+    mission_log_pb2_grpc.add_MissionLogServiceServicer_to_server(MissionLogServicer(hub), server)
+    bound_port = server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    return server, bound_port
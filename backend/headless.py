@@ -0,0 +1,135 @@
+# backend/headless.py
+"""Run missions headless, as fast as the CPU allows, on a virtual clock.
+
+No WebSocket, no sleeping: each tick advances a `VirtualClock` by
+1 / ticks_per_second, so log and telemetry timestamps read exactly as they
+would have in a real-time session. A full mission takes milliseconds, which
+makes this the basis for regression runs:
+
+    python -m backend.headless nominal pressure_anomaly power_fault
+    python -m backend.headless --operator passive --count 100 power_fault
+"""
+import argparse
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from backend.clock import VirtualClock
+from backend.config import settings
+from backend.logs import LogEntry
+from backend.simulator import RovSimulator
+
+# An operator policy sees the simulator before each tick and returns the
+# commands a human would have sent at that moment.
+Operator = Callable[[int, RovSimulator], list[dict]]
+
+
+def passive_operator(tick: int, sim: RovSimulator) -> list[dict]:
+    """Never intervenes; scenarios play out to their unattended outcome."""
+    return []
+
+
+def attentive_operator(tick: int, sim: RovSimulator) -> list[dict]:
+    """Responds to each scenario's prompt the way the HMI expects an operator to."""
+    state = sim.state
+    signature_detected = state.alert_active and state.alert_severity == "INFO"
+    if signature_detected and state.arm_status == "stowed":
+        return [{"command": "DEPLOY_ARM"}, {"command": "COLLECT_SAMPLE"}]
+    if state.hull_status == "warning" and state.propulsion_status == "active":
+        return [{"command": "SET_PROPULSION_STATE", "payload": {"status": "inactive"}}]
+    if state.power_status == "fault" and state.package_status == "attached":
+        return [{"command": "JETTISON_PACKAGE"}]
+    return []
+
+
+OPERATORS: dict[str, Operator] = {
+    "passive": passive_operator,
+    "attentive": attentive_operator,
+}
+
+
+@dataclass
+class MissionRun:
+    scenario: str
+    ticks: int
+    final_status: str
+    started_at: datetime
+    ended_at: datetime
+    mission_log: list[LogEntry]
+    frames: list[dict] = field(default_factory=list)
+
+
+def run_mission(
+    scenario: str,
+    operator: Operator = attentive_operator,
+    *,
+    ticks_per_second: int = settings.ticks_per_second,
+    max_ticks: int = 10_000,
+    start: datetime | None = None,
+    record: bool = False,
+) -> MissionRun:
+    """Play one scenario to completion (or `max_ticks`) in simulated time.
+
+    Each tick mirrors the live session loop: apply the operator's commands,
+    `update()`, then take the telemetry frame (kept only when `record`).
+    """
+    clock = VirtualClock(start)
+    started_at = clock()
+    sim = RovSimulator(clock=clock)
+    sim.tick_rate = float(ticks_per_second)
+    sim.handle_command({"command": "START_SIMULATION", "payload": {"scenario": scenario}})
+
+    frames = []
+    ticks = 0
+    while sim.simulation_running and ticks < max_ticks:
+        clock.advance(1 / ticks_per_second)
+        for cmd in operator(ticks, sim):
+            sim.handle_command(cmd)
+        sim.update()
+        ticks += 1
+        if record:
+            frames.append(sim.get_telemetry_dict())
+
+    return MissionRun(
+        scenario=scenario,
+        ticks=ticks,
+        final_status=sim.state.mission_status,
+        started_at=started_at,
+        ended_at=clock(),
+        mission_log=sim.get_mission_log(),
+        frames=frames,
+    )
+
+
+def run_missions(
+    scenarios: list[str], operator: Operator = attentive_operator, **kwargs
+) -> list[MissionRun]:
+    """Run several missions back to back, each on its own virtual clock."""
+    return [run_mission(scenario, operator, **kwargs) for scenario in scenarios]
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("scenarios", nargs="+")
+    parser.add_argument("--operator", choices=sorted(OPERATORS), default="attentive")
+    parser.add_argument("--count", type=int, default=1, help="runs per scenario")
+    parser.add_argument("--tps", type=int, default=settings.ticks_per_second)
+    args = parser.parse_args(argv)
+
+    for scenario in args.scenarios:
+        started = time.perf_counter()
+        runs = run_missions(
+            [scenario] * args.count, OPERATORS[args.operator], ticks_per_second=args.tps
+        )
+        wall_ms = (time.perf_counter() - started) * 1000 / args.count
+        run = runs[-1]
+        simulated = (run.ended_at - run.started_at).total_seconds()
+        print(
+            f"{scenario:<18} {run.final_status:<30} {run.ticks:>6} ticks "
+            f"{simulated:>8.1f}s simulated {wall_ms:>8.2f} ms/run"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,3 +15,6 @@ class LogEntry(BaseModel):
     timestamp: datetime
     level: LogLevel
     message: str
+    # Position in its session's log: starts at 1 and increases by one per
+    # entry for the life of the session, across scenario restarts.
+    seq: int = 0
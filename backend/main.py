@@ -1,30 +1,66 @@
+import json
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime
 
-from fastapi import Depends, FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import (
+    Depends,
+    FastAPI,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    WebSocket,
+    WebSocketDisconnect,
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .config import settings
-from .database import get_db_session
+from .database import async_session_factory, get_db_session
+from .grpc_server import start_grpc_server
 from .logs import LogEntry
-from .repository import EventLogRepository
-from .simulation_manager import SimulationManager, TooManySessionsError
-from .simulator import RovSimulator
+from .metrics import CONTENT_TYPE, render
+from .query_cache import MISSIONS, QueryCache, event_tags, written_tags
+from .repository import EventCursor, EventLogRepository, TelemetryRepository
+from .sharding import ShardedSimulationManager
+from .simulation_manager import (
+    SimulationManager,
+    SimulationUnavailableError,
+    TooManySessionsError,
+    TooManySpectatorsError,
+    UnknownSessionError,
+)
+from .telemetry_encoding import ENCODINGS
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.sim_manager = SimulationManager()
+    cache = app.state.query_cache = QueryCache(
+        max_entries=settings.query_cache_entries, ttl_seconds=settings.query_cache_ttl_seconds
+    )
+
+    def invalidate(events: set[tuple[str, uuid.UUID]]):
+        cache.invalidate(written_tags(events))
+
+    if settings.simulation_workers > 0:
+        app.state.sim_manager = ShardedSimulationManager(
+            settings.simulation_workers, on_persisted=invalidate
+        )
+    else:
+        app.state.sim_manager = SimulationManager(on_persisted=invalidate)
+    app.state.grpc_server, app.state.grpc_port = await start_grpc_server(
+        app.state.sim_manager.log_hub, settings.grpc_port
+    )
     yield
-    for session_id in list(app.state.sim_manager._sessions):
-        await app.state.sim_manager.destroy_session(session_id)
+    # Stop the gRPC server first: ending its streams unsubscribes them.
+    await app.state.grpc_server.stop(grace=1)
+    await app.state.sim_manager.shutdown()
 
 
 app = FastAPI(lifespan=lifespan)
-simulator = RovSimulator()
 
 
 class EventLogOut(BaseModel):
@@ -39,12 +75,50 @@ class EventLogOut(BaseModel):
 
 class MissionSummaryOut(BaseModel):
     mission_id: uuid.UUID
+    started_at: datetime
+    scenario: str | None
+    status: str | None
     event_count: int
-    first_event_at: datetime
-    last_event_at: datetime
+    first_event_at: datetime | None
+    last_event_at: datetime | None
 
     model_config = ConfigDict(from_attributes=True)
 
+
+class TelemetryHistoryOut(BaseModel):
+    session_id: str
+    capacity: int
+    memory_bytes: int
+    timestamps: list[datetime]
+    series: dict[str, list[float]]
+
+
+class MissionTelemetryOut(BaseModel):
+    mission_id: uuid.UUID
+    bucket_seconds: float
+    timestamps: list[datetime]
+    samples: list[int]
+    series: dict[str, list[float]]
+
+
+class SessionOut(BaseModel):
+    session_id: str
+    scenario: str | None
+    mission_status: str
+    # 1 / KEEPALIVE_SECONDS while this idle session hibernates.
+    tick_rate: float
+    spectator_count: int
+    # Operator frame delivery (see OutboundQueue): conflated frames were
+    # replaced by newer telemetry before the link could take them, dropped
+    # ones were lost with the connection; latency is from tick to sent.
+    sent_frames: int
+    conflated_frames: int
+    dropped_frames: int
+    pending_frames: int
+    send_latency_ms_mean: float
+    send_latency_ms_max: float
+
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins,
@@ -64,15 +138,14 @@ async def health():
     return {"status": "ok"}
 
 
-@app.get("/mission-log", response_model=list[LogEntry])
-async def get_mission_log():
-    """Expose mission log over REST (for demo until gRPC is wired).
-
-    TODO(#27): now disconnected from real sessions since each websocket
-    connection has its own RovSimulator (see simulation_manager.py). This
-    always returns []. Needs a session-scoped redesign.
-    """
-    return simulator.get_mission_log()
+@app.get("/metrics")
+async def metrics(request: Request):
+    """Prometheus text exposition of the tick loop, sockets and persistence."""
+    sim_manager: SimulationManager = request.app.state.sim_manager
+    cache: QueryCache = request.app.state.query_cache
+    return Response(
+        render(await sim_manager.metrics() + cache.metrics()), media_type=CONTENT_TYPE
+    )
 
 
 @app.get("/hello")
@@ -82,39 +155,266 @@ async def say_hello():
 
 @app.get("/api/v1/events", response_model=list[EventLogOut])
 async def list_events(
+    request: Request,
+    response: Response,
     severity: str | None = None,
     mission_id: uuid.UUID | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+    cursor: str | None = None,
+    limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db_session),
 ):
-    """List persisted WARNING/CRITICAL mission events, optionally filtered."""
-    repo = EventLogRepository(db)
-    return await repo.list_events(severity=severity, mission_id=mission_id)
+    """List persisted WARNING/CRITICAL mission events, optionally filtered.
+
+    Results are paged in (timestamp, id) order. When more rows match, the
+    `X-Next-Cursor` response header holds the `cursor` for the next page.
+    Pages are served from the query cache until events they could include
+    are written.
+    """
+    try:
+        after = EventCursor.decode(cursor) if cursor is not None else None
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+
+    async def load() -> tuple[list[EventLogOut], str | None]:
+        repo = EventLogRepository(db)
+        events = await repo.list_events(
+            severity=severity,
+            mission_id=mission_id,
+            since=since,
+            until=until,
+            after=after,
+            limit=limit + 1,
+        )
+        next_cursor = None
+        if len(events) > limit:
+            events = events[:limit]
+            last = events[-1]
+            next_cursor = EventCursor(last.timestamp, last.id).encode()
+        return [EventLogOut.model_validate(event) for event in events], next_cursor
+
+    cache: QueryCache = request.app.state.query_cache
+    page, next_cursor = await cache.get_or_load(
+        ("events", severity, mission_id, since, until, cursor, limit),
+        event_tags(severity, mission_id),
+        load,
+    )
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return page
+
+
+@app.get("/api/v1/events/stream")
+async def stream_events(
+    severity: str | None = None,
+    mission_id: uuid.UUID | None = None,
+    since: datetime | None = None,
+    until: datetime | None = None,
+):
+    """Stream every matching event as NDJSON, one `EventLogOut` per line.
+
+    Backed by a server-side cursor, so memory use doesn't grow with the
+    number of rows, unlike a single unpaged `/api/v1/events` response.
+    """
+
+    async def lines():
+        # The session is opened here, not via Depends, so it lives exactly as
+        # long as the response body is being produced.
+        async with async_session_factory() as db:
+            repo = EventLogRepository(db)
+            async for event in repo.stream_events(
+                severity=severity, mission_id=mission_id, since=since, until=until
+            ):
+                yield EventLogOut.model_validate(event).model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @app.get("/api/v1/missions", response_model=list[MissionSummaryOut])
-async def list_missions(db: AsyncSession = Depends(get_db_session)):
-    """List past missions with summary stats derived from persisted events."""
-    repo = EventLogRepository(db)
-    return await repo.list_missions()
+async def list_missions(
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_db_session),
+):
+    """List missions, most recently started first, with their event summary stats."""
+    cache: QueryCache = request.app.state.query_cache
+    return await cache.get_or_load(
+        ("missions", limit),
+        (MISSIONS,),
+        lambda: EventLogRepository(db).list_missions(limit=limit),
+    )
+
+
+@app.get("/api/v1/missions/{mission_id}/telemetry", response_model=MissionTelemetryOut)
+async def get_mission_telemetry(
+    mission_id: uuid.UUID,
+    # Finer than a millisecond is far below any tick period, and below a
+    # microsecond the interval rounds to zero, which date_bin rejects.
+    bucket_seconds: float = Query(5, ge=0.001, le=86_400),
+    since: datetime | None = None,
+    until: datetime | None = None,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Archived telemetry of a mission, averaged over `bucket_seconds` buckets.
+
+    Only populated when the server runs with TELEMETRY_ARCHIVE enabled;
+    `samples` is the number of ticks behind each bucket.
+    """
+    repo = TelemetryRepository(db)
+    telemetry = await repo.downsample(
+        mission_id, bucket_seconds=bucket_seconds, since=since, until=until
+    )
+    return MissionTelemetryOut(
+        mission_id=mission_id,
+        bucket_seconds=bucket_seconds,
+        timestamps=telemetry.timestamps,
+        samples=telemetry.samples,
+        series=telemetry.series,
+    )
+
+
+@app.get("/api/v1/sessions", response_model=list[SessionOut])
+async def list_sessions(request: Request):
+    """List running sessions, e.g. for a control room picking one to spectate."""
+    sim_manager: SimulationManager = request.app.state.sim_manager
+    return [
+        SessionOut(
+            session_id=session.session_id,
+            scenario=session.scenario,
+            mission_status=session.mission_status,
+            tick_rate=session.tick_rate,
+            spectator_count=len(session.spectators),
+            sent_frames=session.outbound.sent_frames,
+            conflated_frames=session.outbound.conflated_frames,
+            dropped_frames=session.outbound.dropped_frames,
+            pending_frames=session.outbound.pending_frames,
+            send_latency_ms_mean=round(session.outbound.mean_send_seconds * 1000, 3),
+            send_latency_ms_max=round(session.outbound.max_send_seconds * 1000, 3),
+        )
+        for session in sim_manager._sessions.values()
+    ]
+
+
+@app.get("/api/v1/sessions/{session_id}/telemetry", response_model=TelemetryHistoryOut)
+async def get_session_telemetry(
+    session_id: str, request: Request, seconds: float = Query(60, gt=0)
+):
+    """Recent telemetry of a running session as columnar series, e.g. to refill
+    charts after an HMI reconnects. Limited to what the session's fixed-size
+    history holds (TELEMETRY_HISTORY_SECONDS); `memory_bytes` is its footprint.
+    """
+    sim_manager: SimulationManager = request.app.state.sim_manager
+    try:
+        window = await sim_manager.telemetry_history(session_id, seconds)
+    except UnknownSessionError:
+        raise HTTPException(status_code=404, detail="Unknown session") from None
+    return TelemetryHistoryOut(session_id=session_id, **window)
+
+
+@app.get("/api/v1/sessions/{session_id}/mission-log", response_model=list[LogEntry])
+async def get_session_mission_log(
+    session_id: str, request: Request, since: int | None = Query(None, ge=0)
+):
+    """A running session's mission log, every level, in order.
+
+    Each entry carries a per-session `seq`. Poll with `since` set to the last
+    seq already received to get only newer entries.
+    """
+    sim_manager: SimulationManager = request.app.state.sim_manager
+    try:
+        return await sim_manager.mission_log(session_id, since)
+    except UnknownSessionError:
+        raise HTTPException(status_code=404, detail="Unknown session") from None
 
 
 @app.websocket("/ws/telemetry")
-async def telemetry_ws(ws: WebSocket):
+async def telemetry_ws(
+    ws: WebSocket,
+    encoding: str = "full",
+    resumable: bool = False,
+    resume_token: str | None = None,
+):
+    """Stream telemetry for a new session and feed it the client's commands.
+
+    `encoding=delta` opts into keyframe + patch frames (see telemetry_encoding).
+
+    `resumable=true` makes the first message a handshake,
+    `{"type": "session", "session_id", "resume_token", "resumed"}`, and keeps
+    the session for RESUME_GRACE_SECONDS after the connection drops.
+    Reconnecting with `resume_token` (implies `resumable`) carries the mission
+    on where it left off, under the same session id; each connection gets a
+    new token. An unknown or expired token is refused with close code 1008.
+    """
     await ws.accept()
     sim_manager: SimulationManager = ws.app.state.sim_manager
 
+    if encoding not in ENCODINGS:
+        await ws.close(code=1008, reason=f"Unsupported encoding: {encoding}")
+        return
+
+    resumable = resumable or resume_token is not None
     try:
-        session = await sim_manager.create_session(ws)
+        if resume_token is None:
+            session = await sim_manager.create_session(ws, encoding=encoding)
+        else:
+            session = await sim_manager.resume_session(ws, resume_token, encoding=encoding)
     except TooManySessionsError:
         await ws.close(code=1013, reason="Server at capacity")
         return
+    except SimulationUnavailableError:
+        await ws.close(code=1011, reason="Simulation unavailable")
+        return
+    except UnknownSessionError:
+        await ws.close(code=1008, reason="Unknown or expired resume token")
+        return
+
+    if resumable:
+        # Queued before the first tick can queue a frame, so it is sent first.
+        handshake = {
+            "type": "session",
+            "session_id": session.session_id,
+            "resume_token": session.resume_token,
+            "resumed": resume_token is not None,
+        }
+        session.outbound.put(json.dumps(handshake, separators=(",", ":")), conflate=False)
 
     try:
         while True:
             msg = await ws.receive_json()
-            await session.command_queue.put(msg)
+            if msg.get("command") == "RESYNC":
+                session.request_resync()
+                continue
+            await session.submit_command(msg)
     except WebSocketDisconnect:
         print("WebSocket disconnected")
     finally:
-        await sim_manager.destroy_session(session.session_id)
-        await ws.close()
+        await sim_manager.destroy_session(session.session_id, park=resumable)
+        try:
+            await ws.close()
+        except RuntimeError:
+            pass  # client already closed the connection
+
+
+@app.websocket("/ws/telemetry/{session_id}/spectate")
+async def spectate_ws(ws: WebSocket, session_id: str):
+    """Read-only view of another client's session: full telemetry frames, no commands."""
+    await ws.accept()
+    sim_manager: SimulationManager = ws.app.state.sim_manager
+
+    try:
+        spectator = sim_manager.add_spectator(session_id, ws)
+    except UnknownSessionError:
+        await ws.close(code=1008, reason="Unknown session")
+        return
+    except TooManySpectatorsError:
+        await ws.close(code=1013, reason="Session at spectator capacity")
+        return
+
+    try:
+        while True:
+            await ws.receive_text()  # spectators are read-only; ignore input
+    except WebSocketDisconnect:
+        pass
+    finally:
+        await sim_manager.remove_spectator(spectator)
@@ -0,0 +1,106 @@
+# backend/metrics.py
+"""Prometheus text exposition for GET /metrics, without a client library.
+
+Most counters and gauges already live on the objects that own them
+(`EventWriter.persisted_events`, a session's command queue, ...), so they are
+read when /metrics is scraped rather than updated on the tick path. The only
+instrumentation that runs per tick or per frame is `Histogram.observe`: a
+bisect and three increments, no locks, since everything that observes runs on
+the event loop thread.
+
+Each component reports a list of `Metric` families; `render` merges families
+that share a name (e.g. one sample per sharding worker) into one block.
+"""
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Literal
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds, spanning a sub-millisecond tick pass up to a stalled DB write.
+TIME_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0
+)
+
+
+class Histogram:
+    """Cumulative-on-render histogram: `counts[i]` holds observations in bucket i only."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...] = TIME_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+Value = float | int | Histogram
+
+
+@dataclass
+class Metric:
+    name: str
+    kind: Literal["counter", "gauge", "histogram"]
+    help: str
+    samples: list[tuple[dict[str, str], Value]] = field(default_factory=list)
+
+    def add(self, value: Value, **labels: str) -> "Metric":
+        self.samples.append((labels, value))
+        return self
+
+
+def with_labels(metrics: Iterable[Metric], **labels: str) -> list[Metric]:
+    """Copies of `metrics` with `labels` added to every sample (e.g. worker="0")."""
+    return [
+        Metric(m.name, m.kind, m.help, [({**labels, **own}, v) for own, v in m.samples])
+        for m in metrics
+    ]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + "}"
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return "+Inf" if value == float("inf") else repr(value)
+
+
+def render(metrics: Iterable[Metric]) -> str:
+    families: dict[str, Metric] = {}
+    for metric in metrics:
+        if metric.name in families:
+            families[metric.name].samples.extend(metric.samples)
+        else:
+            families[metric.name] = Metric(metric.name, metric.kind, metric.help, [*metric.samples])
+
+    lines = []
+    for metric in families.values():
+        lines.append(f"# HELP {metric.name} {metric.help}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for labels, value in metric.samples:
+            if not isinstance(value, Histogram):
+                lines.append(f"{metric.name}{_labels(labels)} {_number(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip((*value.buckets, float("inf")), value.counts, strict=True):
+                cumulative += count
+                bucket_labels = _labels({**labels, "le": _number(float(bound))})
+                lines.append(f"{metric.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{metric.name}_sum{_labels(labels)} {_number(value.sum)}")
+            lines.append(f"{metric.name}_count{_labels(labels)} {value.count}")
+    return "\n".join(lines) + "\n"
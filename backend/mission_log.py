@@ -0,0 +1,113 @@
+# backend/mission_log.py
+"""A session's mission log, bounded in memory however long the session runs.
+
+The newest `capacity` entries are kept as compact tuples (seq, POSIX
+timestamp, level, message) rather than pydantic `LogEntry` models; level
+and message objects are shared with the scenario that logged them, so an
+entry costs a tuple, an int and a float. Older entries are spilled, one JSON
+array per line, to an append-only file that is only created once the first
+entry overflows, and deleted when the log is cleared for a new mission or
+garbage collected with its session. Iterating the log reads the spilled
+entries back before the in-memory ones, so callers still see the whole log,
+oldest first, as `LogEntry` objects.
+"""
+import bisect
+import itertools
+import json
+import os
+import tempfile
+import weakref
+from collections import deque
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import IO
+
+from backend.config import settings
+from backend.logs import LogEntry, LogLevel
+
+# (seq, timestamp, level, message)
+Record = tuple[int, float, LogLevel, str]
+
+
+def _entry(seq: int, timestamp: float, level: LogLevel, message: str) -> LogEntry:
+    return LogEntry(
+        timestamp=datetime.fromtimestamp(timestamp, UTC), level=level, message=message, seq=seq
+    )
+
+
+def _discard(file: IO[str], path: str):
+    file.close()
+    os.unlink(path)
+
+
+class MissionLog:
+    """The log of one session: the last `capacity` entries in memory, the rest on disk."""
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._records: deque[Record] = deque()
+        self._spill: IO[str] | None = None
+        self._spill_path = ""
+        self._finalizer: weakref.finalize | None = None
+        self.spilled_entries = 0
+        self._last_spilled_seq = 0
+
+    def __len__(self) -> int:
+        return self.spilled_entries + len(self._records)
+
+    def __iter__(self) -> Iterator[LogEntry]:
+        return self.since(None)
+
+    def append(self, entry: LogEntry):
+        if len(self._records) == self.capacity:
+            self._write_spill(self._records.popleft())
+        self._records.append(
+            (entry.seq, entry.timestamp.timestamp(), entry.level, entry.message)
+        )
+
+    def since(self, seq: int | None) -> Iterator[LogEntry]:
+        """Entries with a seq after `seq` (all of them for None), oldest first.
+
+        Seqs only grow, so the in-memory entries are found by bisection and a
+        poll for recent entries costs only what it returns. The spill file is
+        read only when `seq` is older than the last entry spilled to it.
+        """
+        after = 0 if seq is None else seq
+        if self._spill is not None and after < self._last_spilled_seq:
+            self._spill.flush()
+            with open(self._spill_path, encoding="utf-8") as spilled:
+                for line in spilled:
+                    record_seq, timestamp, level, message = json.loads(line)
+                    if record_seq > after:
+                        yield _entry(record_seq, timestamp, LogLevel(level), message)
+        records = self._records
+        count = len(records) - bisect.bisect_right(records, after, key=lambda r: r[0])
+        # Walk back from the newest end: islice from the front would step
+        # over every older entry.
+        newest = list(itertools.islice(reversed(records), count))
+        for record in reversed(newest):
+            yield _entry(*record)
+
+    def clear(self):
+        """Forget every entry, deleting the spill file (a new mission starts)."""
+        self._records.clear()
+        self.spilled_entries = 0
+        self._last_spilled_seq = 0
+        if self._finalizer is not None:
+            self._finalizer()
+            self._spill = self._finalizer = None
+
+    def _write_spill(self, record: Record):
+        if self._spill is None:
+            fd, self._spill_path = tempfile.mkstemp(
+                prefix="mission-log-", suffix=".jsonl", dir=settings.mission_log_dir
+            )
+            self._spill = os.fdopen(fd, "a", encoding="utf-8")
+            # The file goes when the log does, e.g. once its session ends.
+            self._finalizer = weakref.finalize(self, _discard, self._spill, self._spill_path)
+        seq, timestamp, level, message = record
+        self._spill.write(json.dumps([seq, timestamp, level.value, message]) + "\n")
+        self.spilled_entries += 1
+        self._last_spilled_seq = seq
@@ -0,0 +1,98 @@
+# backend/mission_log_hub.py
+"""In-process fan-out of mission log entries to live subscribers.
+
+`SimulationManager` publishes each tick's new `LogEntry`s here (the ones its
+simulators passed to `on_event`), and streaming consumers such as the gRPC
+`StreamMissionLog` RPC subscribe, either to one mission or to all of them.
+Nothing touches the database: entries go straight from the tick loop to
+each subscriber's queue.
+
+Publishing is a dict lookup when nobody is listening, and one
+`put_nowait` per matching subscriber otherwise, so thousands of idle
+subscribers cost nothing per tick. A subscriber that stops reading is not
+allowed to grow memory: once `max_pending` entries are waiting it is marked
+overflowed and dropped from the hub, and its iterator raises
+`SubscriberOverflowError` so the consumer can re-fetch and resubscribe.
+"""
+import asyncio
+import uuid
+from collections.abc import AsyncIterator, Callable
+
+from backend.logs import LogEntry
+
+
+class SubscriberOverflowError(Exception):
+    """Raised to a subscriber that fell more than `max_pending` entries behind."""
+
+
+class LogSubscription:
+    """One consumer's view of the hub; iterate it to receive (mission_id, entry)."""
+
+    def __init__(self, mission_id: uuid.UUID | None, max_pending: int, on_close: Callable):
+        self.mission_id = mission_id
+        self.max_pending = max_pending
+        self.overflowed = False
+        self._queue: asyncio.Queue[tuple[uuid.UUID, LogEntry] | None] = asyncio.Queue()
+        self._on_close = on_close
+
+    def _deliver(self, mission_id: uuid.UUID, entry: LogEntry) -> bool:
+        if self._queue.qsize() >= self.max_pending:
+            self.overflowed = True
+            self._queue.put_nowait(None)
+            return False
+        self._queue.put_nowait((mission_id, entry))
+        return True
+
+    def close(self):
+        self._on_close(self)
+
+    def __aiter__(self) -> AsyncIterator[tuple[uuid.UUID, LogEntry]]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[tuple[uuid.UUID, LogEntry]]:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                raise SubscriberOverflowError()
+            yield item
+
+
+class MissionLogHub:
+    def __init__(self):
+        self._by_mission: dict[uuid.UUID, set[LogSubscription]] = {}
+        self._all: set[LogSubscription] = set()
+
+    def subscribe(
+        self, mission_id: uuid.UUID | None = None, *, max_pending: int = 1000
+    ) -> LogSubscription:
+        """Follow one mission's entries, or every mission's when `mission_id` is None."""
+        subscription = LogSubscription(mission_id, max_pending, self._unsubscribe)
+        if mission_id is None:
+            self._all.add(subscription)
+        else:
+            self._by_mission.setdefault(mission_id, set()).add(subscription)
+        return subscription
+
+    def publish(self, mission_id: uuid.UUID, entries: list[LogEntry]):
+        if not self._all and mission_id not in self._by_mission:
+            return
+        subscriptions = self._all | self._by_mission.get(mission_id, set())
+        for subscription in subscriptions:
+            for entry in entries:
+                if not subscription._deliver(mission_id, entry):
+                    self._unsubscribe(subscription)
+                    break
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._all) + sum(len(subs) for subs in self._by_mission.values())
+
+    def _unsubscribe(self, subscription: LogSubscription):
+        if subscription.mission_id is None:
+            self._all.discard(subscription)
+            return
+        subscriptions = self._by_mission.get(subscription.mission_id)
+        if subscriptions is not None:
+            subscriptions.discard(subscription)
+            if not subscriptions:
+                del self._by_mission[subscription.mission_id]
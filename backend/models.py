@@ -69,6 +69,9 @@ class RovState(BaseModel):
 
 class TelemetryMessage(BaseModel):
     timestamp: str
+    # Ticks per second this session currently runs at; lower than the
+    # configured rate while the server slows idle sessions under load.
+    tick_rate: float
     rov_state: RovState
     mission_state: MissionState
     alert: ActiveAlert
\ No newline at end of file
@@ -0,0 +1,153 @@
+# backend/outbound_queue.py
+"""Per-connection send buffer between the tick loop and an operator's socket.
+
+The scheduler never awaits a client. Each tick it puts the session's frame
+here and moves on, and a sender task per connection writes frames out at
+whatever pace the link allows, so a slow client can't stall its session's
+simulation clock.
+
+Plain telemetry frames are conflated, latest wins: while one is waiting, a
+newer frame replaces it, so a slow client sees fewer frames but always the
+current state. Event frames (those from a tick that wrote to the mission log,
+which includes every alert raised or cleared) are never conflated: they queue
+in order, and a client more than `max_pending` of them behind is disconnected
+rather than silently missing one.
+
+With `encoder` set (the delta protocol) frames are queued as dicts and
+encoded only when sent, against the last frame actually sent, so conflation
+never breaks the delta chain. Text frames (such as the session handshake)
+are always sent as they are.
+"""
+import asyncio
+import json
+import logging
+from collections import deque
+from collections.abc import Callable
+
+from fastapi import WebSocket
+
+from backend.metrics import Histogram
+from backend.telemetry_encoding import DeltaEncoder
+
+logger = logging.getLogger(__name__)
+
+Frame = str | dict
+
+
+class OutboundQueue:
+    """Bounded outbound frames for one socket, drained by its own sender task.
+
+    Counters: `sent_frames`; `conflated_frames`, replaced by a newer frame
+    before they were sent; `dropped_frames`, discarded unsent because the
+    connection failed, overflowed or closed; and the time frames spent between
+    `put` and the end of their send (`send_seconds_total`, `max_send_seconds`),
+    also observed into `send_latency` when given (shared by a manager's sessions).
+    """
+
+    def __init__(
+        self,
+        ws: WebSocket,
+        *,
+        encoder: DeltaEncoder | None = None,
+        max_pending: int = 256,
+        on_conflate: Callable[[], None] | None = None,
+        send_latency: Histogram | None = None,
+    ):
+        self.ws = ws
+        self.encoder = encoder
+        self.max_pending = max_pending
+        self.closed = False
+        self.sent_frames = 0
+        self.conflated_frames = 0
+        self.dropped_frames = 0
+        self.send_seconds_total = 0.0
+        self.max_send_seconds = 0.0
+        self._events: deque[tuple[Frame, float]] = deque()
+        self._latest: tuple[Frame, float] | None = None
+        self._on_conflate = on_conflate
+        self._send_latency = send_latency
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def pending_frames(self) -> int:
+        return len(self._events) + (self._latest is not None)
+
+    @property
+    def mean_send_seconds(self) -> float:
+        return self.send_seconds_total / self.sent_frames if self.sent_frames else 0.0
+
+    def put(self, frame: Frame, *, conflate: bool = True):
+        """Queue a frame; `conflate=False` for event frames, which are never dropped."""
+        if self.closed:
+            self.dropped_frames += 1
+            return
+        if self._latest is not None:
+            # The waiting telemetry frame is older than this one either way.
+            self._latest = None
+            self.conflated_frames += 1
+            if self._on_conflate:
+                self._on_conflate()
+        item = (frame, asyncio.get_running_loop().time())
+        if conflate:
+            self._latest = item
+        elif len(self._events) < self.max_pending:
+            self._events.append(item)
+        else:
+            logger.info("Disconnecting client %d event frames behind", len(self._events))
+            self.dropped_frames += 1
+            self.close()
+            asyncio.create_task(self._close_socket())
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        self._ready.set()
+
+    def close(self):
+        """Stop sending; frames still waiting are counted as dropped."""
+        self.closed = True
+        self.dropped_frames += self.pending_frames
+        self._events.clear()
+        self._latest = None
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _close_socket(self):
+        try:
+            await self.ws.close(code=1013, reason="Client too slow")
+        except Exception:
+            pass  # already gone
+
+    def _next(self) -> tuple[Frame, float] | None:
+        # `_latest` is always newer than every queued event frame.
+        if self._events:
+            return self._events.popleft()
+        item, self._latest = self._latest, None
+        return item
+
+    def _render(self, frame: Frame) -> str:
+        if isinstance(frame, str):
+            return frame
+        assert self.encoder is not None
+        return json.dumps(self.encoder.encode(frame), separators=(",", ":"), ensure_ascii=False)
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                while (item := self._next()) is not None:
+                    frame, queued_at = item
+                    await self.ws.send_text(self._render(frame))
+                    elapsed = loop.time() - queued_at
+                    self.sent_frames += 1
+                    self.send_seconds_total += elapsed
+                    self.max_send_seconds = max(self.max_send_seconds, elapsed)
+                    if self._send_latency is not None:
+                        self._send_latency.observe(elapsed)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # Client disconnected mid-send; its endpoint calls destroy_session.
+            self.closed = True
@@ -0,0 +1,146 @@
+# backend/query_cache.py
+"""In-process read-through cache for the history endpoints.
+
+`/api/v1/events` and `/api/v1/missions` only change when the `EventWriter`
+persists a batch, but the HMI polls them. `QueryCache` keeps each query's
+result, keyed by its parameters, until one of three things happens:
+
+- a write it depends on: each entry carries tags, and `invalidate(tags)`
+  drops every entry holding one of them. Event queries are tagged with
+  their (severity, mission_id) filters (None for "any"), so a batch of
+  WARNING events for one mission leaves other missions' and CRITICAL-only
+  queries cached (see `event_tags`).
+- `ttl_seconds` passing, which bounds staleness from writes this process
+  doesn't see (another API instance, `python -m backend.backfill_missions`).
+- eviction: past `max_entries`, the least recently used entry goes.
+
+`get_or_load` runs the query on a miss. A result is not stored if a
+matching invalidation happened while it was being loaded, since it may
+predate the write.
+"""
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+
+from backend.metrics import Metric
+
+# Tag of every `/api/v1/missions` result: any write changes a mission's
+# status or event stats.
+MISSIONS = ("missions",)
+
+
+def event_tags(severity: str | None, mission_id: uuid.UUID | None) -> tuple[Hashable, ...]:
+    """The tag of an events query filtered on `severity` and `mission_id`."""
+    return (("events", severity, mission_id),)
+
+
+def written_tags(events: Iterable[tuple[str, uuid.UUID]]) -> set[Hashable]:
+    """Tags of the queries a write of these (severity, mission_id) events affects."""
+    tags: set[Hashable] = {MISSIONS}
+    for severity, mission_id in events:
+        for s in (severity, None):
+            for m in (mission_id, None):
+                tags.add(("events", s, m))
+    return tags
+
+
+class _Load:
+    """A miss being loaded; marked stale by an invalidation of one of its tags."""
+
+    __slots__ = ("tags", "stale")
+
+    def __init__(self, tags: tuple[Hashable, ...]):
+        self.tags = tags
+        self.stale = False
+
+
+class QueryCache:
+    """Query results by key, with TTL and LRU eviction and tag invalidation."""
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires at, tags, value), least recently used first.
+        self._entries: OrderedDict[Hashable, tuple[float, tuple[Hashable, ...], object]] = (
+            OrderedDict()
+        )
+        self._keys_by_tag: dict[Hashable, set[Hashable]] = {}
+        self._loads: set[_Load] = set()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evicted = 0
+        self.invalidated = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get_or_load(
+        self, key: Hashable, tags: tuple[Hashable, ...], load: Callable[[], Awaitable]
+    ):
+        """The cached result for `key`, or `await load()`'s, cached under `tags`."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self._remove(key)
+            self.expired += 1
+        self.misses += 1
+        if self.max_entries <= 0:
+            return await load()
+
+        pending = _Load(tags)
+        self._loads.add(pending)
+        try:
+            value = await load()
+        finally:
+            self._loads.discard(pending)
+        if not pending.stale:
+            self._put(key, tags, value)
+        return value
+
+    def invalidate(self, tags: Iterable[Hashable]):
+        """Drop every entry, and discard every load in progress, with one of `tags`."""
+        tags = set(tags)
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+                self.invalidated += 1
+        for pending in self._loads:
+            if not tags.isdisjoint(pending.tags):
+                pending.stale = True
+
+    def metrics(self) -> list[Metric]:
+        """Metric families for GET /metrics (see backend/metrics.py)."""
+        return [
+            Metric("odyssey_query_cache_entries", "gauge", "Query results cached.")
+            .add(len(self._entries)),
+            Metric("odyssey_query_cache_requests_total", "counter", "Cached queries by outcome.")
+            .add(self.hits, outcome="hit")
+            .add(self.misses, outcome="miss"),
+            Metric("odyssey_query_cache_removals_total", "counter", "Cache entries dropped.")
+            .add(self.expired, reason="expired")
+            .add(self.evicted, reason="evicted")
+            .add(self.invalidated, reason="invalidated"),
+        ]
+
+    def _put(self, key: Hashable, tags: tuple[Hashable, ...], value: object):
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, tags, value)
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evicted += 1
+
+    def _remove(self, key: Hashable):
+        _, tags, _ = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag[tag]
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_tag[tag]
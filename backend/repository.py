@@ -1,24 +1,78 @@
 # backend/repository.py
+import base64
+import binascii
 import uuid
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import func, select
+from sqlalchemy import Interval, Select, and_, bindparam, func, insert, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.db_models import EventLog
+from backend.db_models import EventLog, Mission, telemetry_sample
 
 
 @dataclass
 class MissionSummary:
     mission_id: uuid.UUID
+    started_at: datetime
+    scenario: str | None
+    status: str | None
     event_count: int
-    first_event_at: datetime
-    last_event_at: datetime
+    first_event_at: datetime | None
+    last_event_at: datetime | None
+
+
+@dataclass
+class TelemetrySeries:
+    """Downsampled archived telemetry: one entry per time bucket, columnar."""
+
+    timestamps: list[datetime]
+    samples: list[int]
+    series: dict[str, list[float]]
+
+
+@dataclass(frozen=True)
+class MissionUpdate:
+    """The current scenario/status of a running mission, for `upsert_missions`."""
+
+    mission_id: uuid.UUID
+    started_at: datetime
+    scenario: str | None
+    status: str
+
+
+@dataclass(frozen=True)
+class EventCursor:
+    """Keyset position in the (timestamp, id) ordering of `event_log`.
+
+    Clients get it as an opaque token; the next page starts strictly after it.
+    """
+
+    timestamp: datetime
+    id: uuid.UUID
+
+    def encode(self) -> str:
+        raw = f"{self.timestamp.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "EventCursor":
+        """Parse a token from `encode`; raises ValueError if it is malformed."""
+        try:
+            timestamp, event_id = base64.urlsafe_b64decode(token).decode().split("|")
+            return cls(datetime.fromisoformat(timestamp), uuid.UUID(event_id))
+        except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+            raise ValueError(f"invalid cursor: {token!r}") from exc
 
 
 class EventLogRepository:
-    """Persistence for `event_log` rows (WARNING/CRITICAL+ mission events)."""
+    """Persistence for `event_log` rows (WARNING/CRITICAL+ mission events).
+
+    Every insert also bumps the event stats on the matching `mission` row in
+    the same transaction, so the summary table never lags the log.
+    """
 
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -30,10 +84,125 @@ class EventLogRepository:
             timestamp=timestamp, severity=severity, message=message, mission_id=mission_id
         )
         self.session.add(event)
+        await self._bump_mission_stats([{"timestamp": timestamp, "mission_id": mission_id}])
         await self.session.commit()
         await self.session.refresh(event)
         return event
 
+    async def insert_many(self, rows: list[dict]) -> int:
+        """Insert many events in a single multi-row INSERT and one commit.
+
+        Each row is a dict with `timestamp`, `severity`, `message` and
+        `mission_id` keys. Unlike `insert`, the new rows are not refreshed
+        back into ORM objects; only the row count is returned.
+        """
+        if not rows:
+            return 0
+        await self.session.execute(insert(EventLog), rows)
+        await self._bump_mission_stats(rows)
+        await self.session.commit()
+        return len(rows)
+
+    async def _bump_mission_stats(self, rows: list[dict]):
+        """Add newly inserted events to their missions' count and time range.
+
+        Missions that have no row yet (e.g. their start was never recorded)
+        get one, started at their first event.
+        """
+        stats: dict[uuid.UUID, tuple[int, datetime, datetime]] = {}
+        for row in rows:
+            mission_id, timestamp = row["mission_id"], row["timestamp"]
+            if mission_id in stats:
+                count, first, last = stats[mission_id]
+                stats[mission_id] = (count + 1, min(first, timestamp), max(last, timestamp))
+            else:
+                stats[mission_id] = (1, timestamp, timestamp)
+
+        stmt = pg_insert(Mission).values(
+            [
+                {
+                    "id": mission_id,
+                    "started_at": first,
+                    "event_count": count,
+                    "first_event_at": first,
+                    "last_event_at": last,
+                }
+                # Sorted so concurrent writers lock mission rows in the same order.
+                for mission_id, (count, first, last) in sorted(stats.items())
+            ]
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Mission.id],
+                set_={
+                    "event_count": Mission.event_count + stmt.excluded.event_count,
+                    # LEAST/GREATEST ignore NULLs, covering a mission's first events.
+                    "first_event_at": func.least(
+                        Mission.first_event_at, stmt.excluded.first_event_at
+                    ),
+                    "last_event_at": func.greatest(
+                        Mission.last_event_at, stmt.excluded.last_event_at
+                    ),
+                },
+            )
+        )
+
+    async def upsert_missions(self, updates: list[MissionUpdate]) -> int:
+        """Create missions or record their latest scenario/status, in one statement."""
+        # One row per mission: ON CONFLICT can't touch the same row twice.
+        latest = {update.mission_id: update for update in updates}
+        if not latest:
+            return 0
+        stmt = pg_insert(Mission).values(
+            [
+                {
+                    "id": update.mission_id,
+                    "started_at": update.started_at,
+                    "scenario": update.scenario,
+                    "status": update.status,
+                }
+                for _, update in sorted(latest.items())
+            ]
+        )
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Mission.id],
+                set_={"scenario": stmt.excluded.scenario, "status": stmt.excluded.status},
+            )
+        )
+        await self.session.commit()
+        return len(latest)
+
+    async def backfill_missions(self) -> int:
+        """Rebuild every mission's event stats from `event_log` in one pass.
+
+        Creates rows for missions that only exist in the log and overwrites the
+        counts of existing ones, so it is safe to re-run. Returns the number of
+        missions written.
+        """
+        aggregate = select(
+            EventLog.mission_id,
+            func.min(EventLog.timestamp),
+            func.count(EventLog.id),
+            func.min(EventLog.timestamp),
+            func.max(EventLog.timestamp),
+        ).group_by(EventLog.mission_id)
+        stmt = pg_insert(Mission).from_select(
+            ["id", "started_at", "event_count", "first_event_at", "last_event_at"], aggregate
+        )
+        result = await self.session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[Mission.id],
+                set_={
+                    "event_count": stmt.excluded.event_count,
+                    "first_event_at": stmt.excluded.first_event_at,
+                    "last_event_at": stmt.excluded.last_event_at,
+                },
+            )
+        )
+        await self.session.commit()
+        return result.rowcount  # type: ignore[attr-defined]
+
     async def get_by_severity(self, severity: str) -> list[EventLog]:
         result = await self.session.execute(
             select(EventLog)
@@ -51,34 +220,159 @@ class EventLogRepository:
         return list(result.scalars().all())
 
     async def list_events(
-        self, *, severity: str | None = None, mission_id: uuid.UUID | None = None
+        self,
+        *,
+        severity: str | None = None,
+        mission_id: uuid.UUID | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        after: EventCursor | None = None,
+        limit: int | None = None,
     ) -> list[EventLog]:
-        query = select(EventLog).order_by(EventLog.timestamp)
+        """Events in (timestamp, id) order, optionally one keyset page at a time.
+
+        `since` is inclusive and `until` exclusive. Pass the cursor of the last
+        row of a page as `after` to get the next one.
+        """
+        query = self._events_query(
+            severity=severity, mission_id=mission_id, since=since, until=until, after=after
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def stream_events(
+        self,
+        *,
+        severity: str | None = None,
+        mission_id: uuid.UUID | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        batch_size: int = 500,
+    ) -> AsyncIterator[EventLog]:
+        """Yield matching events through a server-side cursor.
+
+        Rows are fetched `batch_size` at a time, so memory stays flat however
+        many rows match. The session must stay open while iterating.
+        """
+        query = self._events_query(
+            severity=severity, mission_id=mission_id, since=since, until=until
+        ).execution_options(yield_per=batch_size)
+        result = await self.session.stream_scalars(query)
+        async for event in result:
+            yield event
+
+    @staticmethod
+    def _events_query(
+        *,
+        severity: str | None,
+        mission_id: uuid.UUID | None,
+        since: datetime | None,
+        until: datetime | None,
+        after: EventCursor | None = None,
+    ) -> Select[EventLog]:
+        # `id` breaks timestamp ties so the order (and therefore the keyset) is total.
+        query = select(EventLog).order_by(EventLog.timestamp, EventLog.id)
         if severity is not None:
             query = query.where(EventLog.severity == severity)
         if mission_id is not None:
             query = query.where(EventLog.mission_id == mission_id)
-        result = await self.session.execute(query)
-        return list(result.scalars().all())
-
-    async def list_missions(self) -> list[MissionSummary]:
-        """Summarize past missions by grouping persisted events by mission_id."""
-        result = await self.session.execute(
-            select(
-                EventLog.mission_id,
-                func.count(EventLog.id),
-                func.min(EventLog.timestamp),
-                func.max(EventLog.timestamp),
+        if since is not None:
+            query = query.where(EventLog.timestamp >= since)
+        if until is not None:
+            query = query.where(EventLog.timestamp < until)
+        if after is not None:
+            # Spelled out rather than as a row comparison so the planner can
+            # use ix_event_log_timestamp for the leading `timestamp >=` bound.
+            query = query.where(
+                EventLog.timestamp >= after.timestamp,
+                or_(
+                    EventLog.timestamp > after.timestamp,
+                    and_(EventLog.timestamp == after.timestamp, EventLog.id > after.id),
+                ),
             )
-            .group_by(EventLog.mission_id)
-            .order_by(func.max(EventLog.timestamp).desc())
-        )
+        return query
+
+    async def list_missions(self, *, limit: int | None = None) -> list[MissionSummary]:
+        """Most recently started missions first, read from the `mission` table."""
+        query = select(Mission).order_by(Mission.started_at.desc(), Mission.id.desc())
+        if limit is not None:
+            query = query.limit(limit)
+        result = await self.session.execute(query)
         return [
             MissionSummary(
-                mission_id=mission_id,
-                event_count=event_count,
-                first_event_at=first_event_at,
-                last_event_at=last_event_at,
+                mission_id=mission.id,
+                started_at=mission.started_at,
+                scenario=mission.scenario,
+                status=mission.status,
+                event_count=mission.event_count,
+                first_event_at=mission.first_event_at,
+                last_event_at=mission.last_event_at,
             )
-            for mission_id, event_count, first_event_at, last_event_at in result.all()
+            for mission in result.scalars()
         ]
+
+
+# Archived numeric fields and the decimals TelemetryMessage rounds each to.
+TELEMETRY_FIELDS = {
+    "charge_percent": 2,
+    "power_level_percent": 2,
+    "hull_pressure_kpa": 0,
+    "depth_meters": 1,
+    "water_temp_celsius": 1,
+}
+# Buckets are aligned to this instant, so the same mission always buckets
+# the same way regardless of the requested time range.
+BUCKET_ORIGIN = datetime(2000, 1, 1, tzinfo=UTC)
+
+
+class TelemetryRepository:
+    """Reads from the `telemetry_sample` archive (written by TelemetryArchiver)."""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def downsample(
+        self,
+        mission_id: uuid.UUID,
+        *,
+        bucket_seconds: float,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> TelemetrySeries:
+        """Average each field over fixed `bucket_seconds` buckets, oldest first.
+
+        Served by the (mission_id, timestamp) index of each day partition;
+        `since`/`until` also prune whole partitions.
+        """
+        columns = telemetry_sample.c
+        bucket = func.date_bin(
+            bindparam("bucket", timedelta(seconds=bucket_seconds), type_=Interval),
+            columns.timestamp,
+            bindparam("origin", BUCKET_ORIGIN),
+        ).label("bucket")
+        query = (
+            select(
+                bucket,
+                func.count(),
+                *(func.avg(columns[name]) for name in TELEMETRY_FIELDS),
+            )
+            .where(columns.mission_id == mission_id)
+            .group_by(bucket)
+            .order_by(bucket)
+        )
+        if since is not None:
+            query = query.where(columns.timestamp >= since)
+        if until is not None:
+            query = query.where(columns.timestamp < until)
+
+        result = await self.session.execute(query)
+        timestamps, samples = [], []
+        series: dict[str, list[float]] = {name: [] for name in TELEMETRY_FIELDS}
+        for bucket_start, count, *averages in result.all():
+            timestamps.append(bucket_start)
+            samples.append(count)
+            for (name, decimals), value in zip(TELEMETRY_FIELDS.items(), averages, strict=True):
+                series[name].append(round(float(value), decimals))
+        return TelemetrySeries(timestamps=timestamps, samples=samples, series=series)
@@ -0,0 +1,438 @@
+# backend/scenario_engine.py
+"""Scenarios as data, compiled into per-state transition tables.
+
+A scenario is a TOML file in backend/scenarios/ (or in SCENARIOS_DIR, for
+scenarios that aren't shipped with the app). Its file name is the name
+clients pass to START_SIMULATION, and it is an ordered list of rules:
+
+    [[rule]]
+    when.mission_status = "en_route"              # conditions, all must hold
+    when.depth_meters.ge = "TARGET_DEPTH"         # eq/ne/lt/le/gt/ge/in
+    set.mission_status = "searching"              # actions...
+    reset_timer = true
+    log = [{ level = "INFO", message = "Mission status changed to 'searching'." }]
+
+Rules run in file order once per tick, each seeing the effects of the ones
+before it. A rule with `on = "<COMMAND>"` runs instead right after that
+operator command is applied. Conditions and `set` use the names in `FIELDS`.
+Comparison operands may also name a `RovSimulator` constant such as
+`TARGET_DEPTH`. Other actions are `alert = { severity, message }`,
+`clear_alert`, `reset_timer`, `normalize_pressure` (ticks to ease hull
+pressure back to the depth's value), `switch_to` (another scenario) and
+`stop` (end the simulation).
+
+Each file is validated and compiled once. A rule that requires a mission
+status is filed under that status only, so a tick evaluates just the rules
+that can apply in the current state, with conditions pre-resolved to getters,
+operators and constant operands. If a rule changes the status, evaluation
+carries on with the new state's rules that come after it in the file.
+
+Rules are compiled by building a Python syntax tree node by node, never by
+parsing text, and the tree is checked against a whitelist (`_check_tree`)
+before it is compiled: a scenario file can only pick field names from
+`FIELDS` and operators from `OPERATORS`, and every value it holds is data.
+"""
+import ast
+import tomllib
+from collections.abc import Callable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, get_args
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from backend.logs import LogLevel
+from backend.models import (
+    HullIntegrity,
+    ManipulatorArm,
+    MissionState,
+    Power,
+    Propulsion,
+    SciencePackage,
+)
+
+if TYPE_CHECKING:
+    from backend.simulator import RovSimulator
+
+BUILTIN_DIR = Path(__file__).parent / "scenarios"
+
+
+def _statuses(model: type[BaseModel], field: str = "status") -> tuple:
+    return get_args(model.model_fields[field].annotation)
+
+
+# Name usable in scenario files -> (attribute path on RovSimulator, allowed
+# values or None if any value of the right type goes).
+FIELDS: dict[str, tuple[str, tuple | None]] = {
+    "mission_status": ("state.mission_status", _statuses(MissionState)),
+    "propulsion_status": ("state.propulsion_status", _statuses(Propulsion)),
+    "hull_status": ("state.hull_status", _statuses(HullIntegrity)),
+    "power_status": ("state.power_status", _statuses(Power)),
+    "arm_status": ("state.arm_status", _statuses(ManipulatorArm)),
+    "package_status": ("state.package_status", _statuses(SciencePackage)),
+    "sample_collected": ("state.sample_collected", (True, False)),
+    "charge_percent": ("state.charge_percent", None),
+    "hull_pressure_kpa": ("state.hull_pressure_kpa", None),
+    "depth_meters": ("state.depth_meters", None),
+    "alert_active": ("state.alert_active", (True, False)),
+    "operator_override": ("operator_override", (True, False)),
+    "scenario_timer": ("scenario_timer", None),
+}
+
+# Commands a rule can react to with `on`.
+COMMANDS = ("SET_PROPULSION_STATE", "DEPLOY_ARM", "COLLECT_SAMPLE", "JETTISON_PACKAGE")
+
+# Condition operators and the comparison node each compiles to.
+OPERATORS: dict[str, type[ast.cmpop]] = {
+    "eq": ast.Eq,
+    "ne": ast.NotEq,
+    "lt": ast.Lt,
+    "le": ast.LtE,
+    "gt": ast.Gt,
+    "ge": ast.GtE,
+    "in": ast.In,
+}
+
+
+class ScenarioError(ValueError):
+    """Raised for a scenario file that doesn't parse or validate."""
+
+
+def _comparisons(condition: Any) -> list[tuple[str, Any]]:
+    """`when.<field> = value` means equality; `when.<field>.<op> = value` anything else."""
+    return list(condition.items()) if isinstance(condition, dict) else [("eq", condition)]
+
+
+# --- File format ---
+
+
+class AlertSpec(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    severity: Literal["INFO", "WARNING", "CRITICAL"]
+    message: str
+
+
+class LogSpec(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    level: LogLevel
+    message: str
+
+
+class RuleSpec(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    on: Literal[COMMANDS] | None = None  # type: ignore[valid-type]
+    when: dict[str, Any] = {}
+    set: dict[str, Any] = {}
+    alert: AlertSpec | None = None
+    clear_alert: bool = False
+    reset_timer: bool = False
+    normalize_pressure: int | None = Field(None, gt=0)
+    switch_to: str | None = None
+    stop: bool = False
+    log: list[LogSpec] = []
+
+    @model_validator(mode="after")
+    def _check_fields(self):
+        for name, value in self.set.items():
+            if isinstance(value, dict):
+                raise ValueError(f"set.{name} takes a value, not {value!r}")
+        for name, value in [*self.when.items(), *self.set.items()]:
+            if name not in FIELDS:
+                raise ValueError(f"unknown field {name!r}; expected one of {sorted(FIELDS)}")
+            allowed = FIELDS[name][1]
+            for op, operand in _comparisons(value):
+                if op not in OPERATORS:
+                    raise ValueError(f"unknown operator {op!r} for {name!r}")
+                if op == "in" and not isinstance(operand, list):
+                    raise ValueError(f"{name}.in takes a list, not {operand!r}")
+                operands = operand if op == "in" else [operand]
+                if allowed is not None and any(v not in allowed for v in operands):
+                    raise ValueError(f"{name!r} must be one of {allowed}, got {operand!r}")
+        if self.alert is not None and self.clear_alert:
+            raise ValueError("a rule can't both raise and clear the alert")
+        return self
+
+
+class ScenarioSpec(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    # Shown in "Scenario Started: <title>."; defaults to the file name, titled.
+    title: str | None = None
+    rule: list[RuleSpec] = []
+
+
+# --- Compiled form ---
+
+# Returned by a compiled state function once a rule has switched scenarios.
+SWITCHED = -1
+
+
+# Methods and attributes the compiled actions use besides those in `FIELDS`.
+_ACTION_ATTRIBUTES = {
+    "raise_alert",
+    "clear_alert",
+    "switch_scenario",
+    "_add_log_entry",
+    "simulation_running",
+    "pressure_normalization_target",
+    "pressure_normalization_ticks",
+    "PRESSURE_PER_METER",
+}
+_ATTRIBUTES = {
+    part for path, _ in FIELDS.values() for part in path.split(".")
+} | _ACTION_ATTRIBUTES
+# Every kind of node `_Compiler` builds.
+_NODES = (
+    ast.Module,
+    ast.FunctionDef,
+    ast.arguments,
+    ast.arg,
+    ast.If,
+    ast.Return,
+    ast.Assign,
+    ast.Expr,
+    ast.Pass,
+    ast.Call,
+    ast.Attribute,
+    ast.Name,
+    ast.Constant,
+    ast.Compare,
+    ast.BoolOp,
+    ast.And,
+    ast.BinOp,
+    ast.Mult,
+    ast.Load,
+    ast.Store,
+    *OPERATORS.values(),
+)
+
+
+def _attribute(path: str, ctx: ast.expr_context | None = None) -> ast.expr:
+    """`sim.<path>`, e.g. `sim.state.depth_meters`."""
+    node: ast.expr = ast.Name("sim", ast.Load())
+    *owners, last = path.split(".")
+    for name in owners:
+        node = ast.Attribute(node, name, ast.Load())
+    return ast.Attribute(node, last, ctx or ast.Load())
+
+
+def _assign(path: str, value: ast.expr) -> ast.stmt:
+    return ast.Assign([_attribute(path, ast.Store())], value)
+
+
+def _call(path: str, *args: ast.expr) -> ast.stmt:
+    return ast.Expr(ast.Call(_attribute(path), list(args), []))
+
+
+class _Compiler:
+    """Builds one Python function per mission status out of syntax tree nodes.
+
+    Every value taken from a scenario file (operands, alert and log text) is
+    bound as a variable in the function's namespace, so the tree only ever
+    holds names from `FIELDS`, fixed operators and small int constants, and
+    `_check_tree` rejects anything else before it is compiled.
+    """
+
+    def __init__(self, scenario: str, constants: dict[str, Any]):
+        self._scenario = scenario
+        self._constants = constants
+        self.namespace: dict[str, Any] = {}
+
+    def bind(self, value: Any) -> ast.expr:
+        name = f"_v{len(self.namespace)}"
+        self.namespace[name] = value
+        return ast.Name(name, ast.Load())
+
+    def operand(self, op: str, value: Any) -> ast.expr:
+        if op == "in":
+            return self.bind(frozenset(value))
+        if op in ("lt", "le", "gt", "ge") and isinstance(value, str):
+            if value not in self._constants:
+                raise ScenarioError(f"unknown constant {value!r}")
+            return self.bind(self._constants[value])
+        return self.bind(value)
+
+    def condition(self, rule: RuleSpec, *, skip_state: bool) -> list[ast.expr]:
+        terms: list[ast.expr] = []
+        for name, value in rule.when.items():
+            for op, operand in _comparisons(value):
+                if skip_state and name == "mission_status" and op in ("eq", "in"):
+                    # Guaranteed by the table this function is filed under
+                    # (see _states, which also uses only the first one).
+                    skip_state = False
+                    continue
+                terms.append(
+                    ast.Compare(
+                        _attribute(FIELDS[name][0]),
+                        [OPERATORS[op]()],
+                        [self.operand(op, operand)],
+                    )
+                )
+        return terms
+
+    def actions(self, rule: RuleSpec) -> list[ast.stmt]:
+        body = [_assign(FIELDS[name][0], self.bind(value)) for name, value in rule.set.items()]
+        if rule.reset_timer:
+            body.append(_assign("scenario_timer", ast.Constant(0)))
+        if rule.alert is not None:
+            severity, message = self.bind(rule.alert.severity), self.bind(rule.alert.message)
+            body.append(_call("state.raise_alert", severity, message))
+        elif rule.clear_alert:
+            body.append(_call("state.clear_alert"))
+        if rule.normalize_pressure is not None:
+            target = ast.BinOp(
+                _attribute("state.depth_meters"), ast.Mult(), _attribute("PRESSURE_PER_METER")
+            )
+            body.append(_assign("pressure_normalization_target", target))
+            ticks = ast.Constant(rule.normalize_pressure)
+            body.append(_assign("pressure_normalization_ticks", ticks))
+        if rule.switch_to is not None:
+            body.append(_call("switch_scenario", self.bind(rule.switch_to)))
+        if rule.stop:
+            body.append(_assign("simulation_running", ast.Constant(False)))
+        for entry in rule.log:
+            level, message = self.bind(entry.level), self.bind(entry.message)
+            body.append(_call("_add_log_entry", level, message))
+        return body
+
+    def when(self, terms: list[ast.expr], body: list[ast.stmt]) -> ast.stmt:
+        """`if <all terms>: <body>`."""
+        test: ast.expr
+        if not terms:
+            test = ast.Constant(True)
+        elif len(terms) == 1:
+            test = terms[0]
+        else:
+            test = ast.BoolOp(ast.And(), terms)
+        return ast.If(test, body or [ast.Pass()], [])
+
+    def function(self, name: str, body: list[ast.stmt]) -> Callable:
+        args = ast.arguments(
+            posonlyargs=[],
+            args=[ast.arg("sim"), ast.arg("start")],
+            kwonlyargs=[],
+            kw_defaults=[],
+            defaults=[],
+        )
+        function = ast.FunctionDef(
+            name=name,
+            args=args,
+            body=[*body, ast.Return(ast.Constant(None))],
+            decorator_list=[],
+        )
+        tree = ast.fix_missing_locations(ast.Module([function], []))
+        self._check_tree(tree)
+        code = compile(tree, f"<scenario {self._scenario}: {name}>", "exec")
+        exec(code, self.namespace)
+        return self.namespace[name]
+
+    def _check_tree(self, tree: ast.Module):
+        """Reject any node the compiler isn't meant to produce."""
+        names = {"sim", "start", *self.namespace}
+        for node in ast.walk(tree):
+            if not isinstance(node, _NODES):
+                raise ScenarioError(f"unexpected {type(node).__name__} node")
+            if isinstance(node, ast.Name) and node.id not in names:
+                raise ScenarioError(f"unexpected name {node.id!r}")
+            if isinstance(node, ast.Attribute) and node.attr not in _ATTRIBUTES:
+                raise ScenarioError(f"unexpected attribute {node.attr!r}")
+            if isinstance(node, ast.Constant) and not (
+                node.value is None or isinstance(node.value, int)
+            ):
+                raise ScenarioError(f"unexpected constant {node.value!r}")
+
+
+def _states(rule: RuleSpec) -> tuple[str, ...] | None:
+    """Mission statuses a rule requires (via `when.mission_status` eq/in), if any."""
+    condition = rule.when.get("mission_status")
+    for op, operand in _comparisons(condition) if condition is not None else []:
+        if op == "eq":
+            return (operand,)
+        if op == "in":
+            return tuple(operand)
+    return None
+
+
+class Scenario:
+    """A compiled scenario.
+
+    `table` maps each mission status to a function holding, in file order,
+    the tick rules that can fire in that status. It is called with the index
+    of the first rule to consider, and returns the index of a rule that
+    changed the mission status (evaluation carries on with the new status's
+    function after that index), `SWITCHED`, or None once done.
+    """
+
+    def __init__(self, name: str, spec: ScenarioSpec, constants: dict[str, Any]):
+        self.name = name
+        self.title = spec.title or name.replace("_", " ").title()
+        self.switches_to = {r.switch_to for r in spec.rule if r.switch_to is not None}
+        compiler = _Compiler(name, constants)
+
+        self.table: dict[str, Callable[[Any, int], int | None]] = {}
+        for status in FIELDS["mission_status"][1] or ():
+            body = []
+            for index, rule in enumerate(spec.rule):
+                states = _states(rule)
+                if rule.on is not None or (states is not None and status not in states):
+                    continue
+                start = ast.Name("start", ast.Load())
+                in_order = ast.Compare(start, [ast.LtE()], [ast.Constant(index)])
+                actions = compiler.actions(rule)
+                if rule.switch_to is not None:
+                    actions.append(ast.Return(ast.Constant(SWITCHED)))
+                elif "mission_status" in rule.set:
+                    changed = ast.Compare(
+                        _attribute("state.mission_status"), [ast.NotEq()], [compiler.bind(status)]
+                    )
+                    actions.append(ast.If(changed, [ast.Return(ast.Constant(index))], []))
+                terms = [in_order, *compiler.condition(rule, skip_state=True)]
+                body.append(compiler.when(terms, actions))
+            self.table[status] = compiler.function(f"tick_{status}", body)
+
+        self.on_command: dict[str, Callable[[Any, int], int | None]] = {}
+        for command in COMMANDS:
+            body = [
+                compiler.when(compiler.condition(rule, skip_state=False), compiler.actions(rule))
+                for rule in spec.rule
+                if rule.on == command
+            ]
+            if body:
+                self.on_command[command] = compiler.function(f"on_{command.lower()}", body)
+
+    def tick(self, sim: "RovSimulator"):
+        """Evaluate this tick's rules in order, following status changes."""
+        changed_at = self.table[sim.state.mission_status](sim, 0)
+        while changed_at is not None and changed_at != SWITCHED:
+            changed_at = self.table[sim.state.mission_status](sim, changed_at + 1)
+
+    def command(self, sim: "RovSimulator", command: str):
+        """Run the rules that react to an operator command just applied."""
+        handler = self.on_command.get(command)
+        if handler is not None:
+            handler(sim, 0)
+
+
+def load_scenario(path: Path, constants: dict[str, Any]) -> Scenario:
+    try:
+        spec = ScenarioSpec.model_validate(tomllib.loads(path.read_text()))
+        return Scenario(path.stem, spec, constants)
+    except (tomllib.TOMLDecodeError, ValueError) as exc:
+        raise ScenarioError(f"{path}: {exc}") from exc
+
+
+def load_scenarios(
+    constants: dict[str, Any], extra_dir: str | Path | None = None
+) -> dict[str, Scenario]:
+    """Compile the built-in scenarios and those in `extra_dir`, which may add
+    scenarios or replace built-in ones of the same name."""
+    paths = sorted(BUILTIN_DIR.glob("*.toml"))
+    if extra_dir is not None:
+        paths += sorted(Path(extra_dir).glob("*.toml"))
+    scenarios = {path.stem: load_scenario(path, constants) for path in paths}
+    for scenario in scenarios.values():
+        for target in scenario.switches_to - scenarios.keys():
+            raise ScenarioError(f"{scenario.name}: switch_to unknown scenario {target!r}")
+    return scenarios
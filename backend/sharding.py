@@ -0,0 +1,599 @@
+# backend/sharding.py
+"""Run simulation sessions in a pool of worker processes.
+
+With `SIMULATION_WORKERS=N` (N > 0) the FastAPI process no longer ticks any
+simulations itself. Each worker process runs an ordinary `SimulationManager`
+on its own event loop (and core), whose sessions write their frames to a
+`_PipeSocket` instead of a WebSocket. The FastAPI process keeps a
+`ShardedSimulationManager` with the same interface the endpoints use: it
+assigns each new session to the least-loaded worker still running, forwards
+commands over a pipe, and relays the serialized frames that come back to the
+real sockets. A worker that dies takes its sessions with it (their sockets
+are closed with 1011) and gets no new ones.
+Capacity limits and close codes are enforced here, so clients can't tell the
+difference. Parked sessions are held here too: the worker sends back a
+resumable session's snapshot as it destroys it, and the snapshot goes to
+whichever worker gets the resumed session.
+
+Pipe messages are pickled tuples. Parent to worker:
+    ("create", session_id, encoding, snapshot or None)
+    ("command", session_id, command)
+    ("resync", session_id)            ("destroy", session_id, park)
+    ("spectate", session_id, bool)    ("stop",)
+    ("call", request_id, method, session_id, args)
+    ("metrics", request_id)
+Worker to parent, batched once per loop iteration:
+    ("out", [(session_id, kind, text), ...], {session_id: (scenario, status, tick_rate)})
+where kind is "frame" or "event" (operator frames, which the parent's
+OutboundQueue may or may never conflate), "spectator" (full frame for
+spectators, sent only while the parent has some attached), "log" (a
+LogEntry as JSON, republished on the parent's MissionLogHub) or "close"
+(the session crashed, or its "create" failed, and is gone; text is the close
+reason); and in reply to "call", which runs one of the manager's per-session
+queries (CALLS), or to "metrics", with the worker manager's metric families:
+    ("reply", request_id, result or None if the session is gone or it failed)
+and in reply to a "destroy" with park set, the session's snapshot:
+    ("parked", session_id, snapshot or None if it crashed)
+and after each batch the worker's EventWriter persists, its events:
+    ("persisted", {(severity, mission_id), ...})
+A message whose handling raises is logged and answered as failed (see
+`_fail`); the worker carries on with its other sessions.
+"""
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import secrets
+import sys
+import uuid
+from collections.abc import Callable
+from multiprocessing.connection import Connection
+
+from fastapi import WebSocket
+
+from backend.logs import LogEntry
+from backend.metrics import Histogram, Metric, with_labels
+from backend.mission_log_hub import MissionLogHub
+from backend.outbound_queue import Frame, OutboundQueue
+from backend.simulation_manager import (
+    ParkedSessions,
+    SimulationManager,
+    SimulationUnavailableError,
+    Spectator,
+    TooManySessionsError,
+    TooManySpectatorsError,
+    UnknownSessionError,
+)
+from backend.simulator import RovSimulator
+from backend.telemetry_encoding import DeltaEncoder
+
+logger = logging.getLogger(__name__)
+
+# Per-session queries the parent may run in a worker: `await
+# manager.<method>(session_id, *args)`.
+CALLS = ("telemetry_history", "mission_log")
+
+# --- Worker process side ---
+
+
+class _Outbox:
+    """Collects frames written during one loop iteration and pipes them as one message."""
+
+    def __init__(self, conn: Connection, manager: SimulationManager):
+        self._conn = conn
+        self._manager = manager
+        self._items: list[tuple[str, str, str]] = []
+
+    def put(self, session_id: str, kind: str, text: str):
+        if not self._items:
+            asyncio.get_running_loop().call_soon(self._flush)
+        self._items.append((session_id, kind, text))
+
+    def reply(self, message: tuple):
+        self._send(message)
+
+    def _flush(self):
+        items, self._items = self._items, []
+        statuses = {}
+        for session_id, kind, _ in items:
+            session = self._manager._sessions.get(session_id)
+            if kind in ("frame", "event") and session is not None:
+                sim = session.simulator
+                statuses[session_id] = (
+                    sim.active_scenario, sim.state.mission_status, sim.tick_rate
+                )
+        self._send(("out", items, statuses))
+
+    def _send(self, message: tuple):
+        try:
+            self._conn.send(message)
+        except (BrokenPipeError, EOFError, OSError):
+            pass  # parent is gone; the worker exits on its next read
+
+
+class _PipeSocket:
+    """Stands in for a WebSocket inside a worker: frames go to the parent."""
+
+    def __init__(self, outbox: _Outbox, session_id: str, kind: str):
+        self._outbox = outbox
+        self._session_id = session_id
+        self._kind = kind
+
+    async def send_text(self, text: str):
+        self._outbox.put(self._session_id, self._kind, text)
+
+    async def close(self, code: int = 1000, reason: str | None = None):
+        # Only a crashed session closes its operator socket; viewers are the
+        # parent's to close.
+        if self._kind == "frame":
+            self._outbox.put(self._session_id, "close", reason or "")
+
+
+class _PipeOutbound(OutboundQueue):
+    """Worker-side outbound queue: frames are encoded and piped right away.
+
+    The pipe never blocks, so there is nothing to conflate here; frames are
+    tagged so the parent's queue, which faces the real socket, knows which
+    ones it may conflate.
+    """
+
+    def __init__(self, outbox: _Outbox, session_id: str, encoder: DeltaEncoder | None):
+        super().__init__(None, encoder=encoder)  # type: ignore[arg-type]
+        self._outbox = outbox
+        self._session_id = session_id
+
+    def put(self, frame: Frame, *, conflate: bool = True):
+        self._outbox.put(self._session_id, "frame" if conflate else "event", self._render(frame))
+
+
+class _WorkerManager(SimulationManager):
+    """The worker's manager: sessions send their frames through the pipe."""
+
+    def __init__(self, conn: Connection):
+        super().__init__(on_persisted=self._on_persisted)
+        self.outbox = _Outbox(conn, self)
+
+    def _on_persisted(self, events: set[tuple[str, uuid.UUID]]):
+        self.outbox.reply(("persisted", events))
+
+    def _open_outbound(
+        self, session_id: str, ws: WebSocket, encoder: DeltaEncoder | None
+    ) -> OutboundQueue:
+        return _PipeOutbound(self.outbox, session_id, encoder)
+
+
+async def _handle(manager: _WorkerManager, taps: dict[str, Spectator], message: tuple):
+    """Apply one message from the parent (see the module docstring)."""
+    outbox = manager.outbox
+    match message:
+        case ("create", session_id, encoding, snapshot):
+            await manager.create_session(
+                _PipeSocket(outbox, session_id, "frame"),  # type: ignore[arg-type]
+                encoding=encoding,
+                session_id=session_id,
+                snapshot=snapshot,
+            )
+        case ("command", session_id, command):
+            if session := manager._sessions.get(session_id):
+                await session.submit_command(command)
+        case ("resync", session_id):
+            if session := manager._sessions.get(session_id):
+                session.request_resync()
+        case ("spectate", session_id, True):
+            if session_id in manager._sessions and session_id not in taps:
+                taps[session_id] = manager.add_spectator(
+                    session_id,
+                    _PipeSocket(outbox, session_id, "spectator"),  # type: ignore[arg-type]
+                )
+        case ("spectate", session_id, False):
+            if tap := taps.pop(session_id, None):
+                await manager.remove_spectator(tap)
+        case ("call", request_id, method, session_id, args) if method in CALLS:
+            try:
+                result = await getattr(manager, method)(session_id, *args)
+            except UnknownSessionError:
+                result = None
+            outbox.reply(("reply", request_id, result))
+        case ("metrics", request_id):
+            outbox.reply(("reply", request_id, await manager.metrics()))
+        case ("destroy", session_id, park):
+            taps.pop(session_id, None)
+            if park:
+                try:
+                    blob = await manager.snapshot(session_id)
+                except UnknownSessionError:
+                    blob = None  # it crashed: nothing to resume
+                outbox.reply(("parked", session_id, blob))
+            await manager.destroy_session(session_id)
+
+
+def _fail(outbox: _Outbox, message: tuple):
+    """Answer a message whose handling raised, so the parent isn't left waiting."""
+    match message:
+        case ("create", session_id, *_):
+            outbox.put(session_id, "close", "Simulation error")
+        case ("call", request_id, *_) | ("metrics", request_id):
+            outbox.reply(("reply", request_id, None))
+        case ("destroy", session_id, True):
+            outbox.reply(("parked", session_id, None))
+
+
+async def _serve(conn: Connection):
+    manager = _WorkerManager(conn)
+    outbox = manager.outbox
+    # The parent enforces the real limit across all workers.
+    manager.MAX_CONCURRENT_SESSIONS = sys.maxsize
+    taps: dict[str, Spectator] = {}
+    inbox: asyncio.Queue[tuple] = asyncio.Queue()
+    loop = asyncio.get_running_loop()
+
+    def on_readable():
+        try:
+            while conn.poll():
+                inbox.put_nowait(conn.recv())
+        except (EOFError, OSError):
+            loop.remove_reader(conn.fileno())
+            inbox.put_nowait(("stop",))
+
+    async def forward_log():
+        # Every entry goes to the parent, which fans it out to its own
+        # subscribers; entries are rare next to frames.
+        async for mission_id, entry in manager.log_hub.subscribe(max_pending=sys.maxsize):
+            outbox.put(str(mission_id), "log", entry.model_dump_json())
+
+    log_forwarder = asyncio.create_task(forward_log())
+    loop.add_reader(conn.fileno(), on_readable)
+    while True:
+        # Handled strictly in order, so a command never overtakes its "create".
+        message = await inbox.get()
+        if message == ("stop",):
+            break
+        try:
+            await _handle(manager, taps, message)
+        except Exception:
+            # Bad input (say, a corrupt snapshot) fails its own request, not
+            # the worker and every other session on it.
+            logger.exception("Simulation worker failed to handle %r", message[0])
+            _fail(outbox, message)
+
+    loop.remove_reader(conn.fileno())
+    await manager.shutdown()
+    log_forwarder.cancel()
+
+
+def _worker_main(conn: Connection, ticks_per_second: int):
+    RovSimulator.TICKS_PER_SECOND = ticks_per_second
+    asyncio.run(_serve(conn))
+
+
+# --- FastAPI process side ---
+
+
+class _Worker:
+    def __init__(self, index: int, ticks_per_second: int):
+        self.index = index
+        self.conn, child_conn = multiprocessing.get_context("spawn").Pipe()
+        # Spawned rather than forked: the parent has a running event loop and
+        # open sockets that must not be duplicated into the child.
+        self.process = multiprocessing.get_context("spawn").Process(
+            target=_worker_main,
+            args=(child_conn, ticks_per_second),
+            name=f"simulation-worker-{index}",
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        self.session_ids: set[str] = set()
+        # In-flight "call" requests, resolved by request id.
+        self.requests: dict[int, asyncio.Future] = {}
+        # Resume tokens of destroyed sessions whose snapshots are on their way.
+        self.parking: dict[str, str] = {}
+        # Cleared once the pipe breaks: no new sessions are placed here.
+        self.alive = True
+
+    def send(self, message: tuple):
+        """Send `message`, or drop it if the worker has exited."""
+        if not self.alive:
+            return
+        try:
+            self.conn.send(message)
+        except (BrokenPipeError, OSError):
+            # Its sessions are ended when the parent reads the pipe's EOF.
+            self.alive = False
+
+
+class RemoteSession:
+    """The FastAPI-process handle for a session simulated in a worker process."""
+
+    def __init__(
+        self,
+        session_id: str,
+        ws: WebSocket,
+        worker: _Worker,
+        encoding: str,
+        send_latency: Histogram | None = None,
+    ):
+        self.session_id = session_id
+        self.mission_id = uuid.UUID(session_id)
+        self.ws = ws
+        self.worker = worker
+        # Delta frames arrive already encoded, so conflating one leaves the
+        # client a seq gap; ask the worker for a keyframe to close it.
+        self.outbound = OutboundQueue(
+            ws,
+            on_conflate=self.request_resync if encoding == "delta" else None,
+            send_latency=send_latency,
+        )
+        self.resume_token = secrets.token_urlsafe(16)
+        self.spectators: set[Spectator] = set()
+        # Newest spectator frame, handed to viewers that join a stream already
+        # relayed (a hibernating session may not send another for a while).
+        self.spectator_frame: str | None = None
+        self.scenario: str | None = None
+        self.mission_status = "standby"
+        self.tick_rate = float(RovSimulator.TICKS_PER_SECOND)
+        self.closed = False
+
+    async def submit_command(self, command: dict):
+        self.worker.send(("command", self.session_id, command))
+
+    def request_resync(self):
+        self.worker.send(("resync", self.session_id))
+
+
+class ShardedSimulationManager:
+    """Drop-in replacement for `SimulationManager` backed by worker processes."""
+
+    MAX_CONCURRENT_SESSIONS = SimulationManager.MAX_CONCURRENT_SESSIONS
+    MAX_SPECTATORS_PER_SESSION = SimulationManager.MAX_SPECTATORS_PER_SESSION
+    # Reported by this process; the workers' own families of these names
+    # (always zero or empty there) are left out of `metrics()`.
+    PARENT_METRICS = {
+        "odyssey_active_sessions",
+        "odyssey_spectators",
+        "odyssey_outbound_pending_frames",
+        "odyssey_rejected_sessions_total",
+        "odyssey_send_seconds",
+        "odyssey_parked_sessions",
+        "odyssey_resumed_sessions_total",
+    }
+
+    def __init__(
+        self,
+        workers: int,
+        on_persisted: Callable[[set[tuple[str, uuid.UUID]]], None] | None = None,
+    ):
+        self._sessions: dict[str, RemoteSession] = {}
+        self.on_persisted = on_persisted
+        self.log_hub = MissionLogHub()
+        self._request_ids = itertools.count()
+        self.parked = ParkedSessions(
+            SimulationManager.RESUME_GRACE_SECONDS, SimulationManager.MAX_PARKED_SESSIONS
+        )
+        self.rejected_sessions = 0
+        self.resumed_sessions = 0
+        self.send_latency = Histogram()
+        self._workers = [_Worker(i, RovSimulator.TICKS_PER_SECOND) for i in range(workers)]
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            loop.add_reader(worker.conn.fileno(), self._on_readable, worker)
+
+    async def create_session(
+        self,
+        ws: WebSocket,
+        *,
+        encoding: str = "full",
+        session_id: str | None = None,
+        snapshot: bytes | None = None,
+    ) -> RemoteSession:
+        if len(self._sessions) >= self.MAX_CONCURRENT_SESSIONS:
+            self.rejected_sessions += 1
+            raise TooManySessionsError()
+
+        live = [worker for worker in self._workers if worker.alive]
+        if not live:
+            raise SimulationUnavailableError()
+        session_id = session_id or str(uuid.uuid4())
+        worker = min(live, key=lambda w: len(w.session_ids))
+        session = RemoteSession(session_id, ws, worker, encoding, self.send_latency)
+        worker.session_ids.add(session_id)
+        self._sessions[session_id] = session
+        worker.send(("create", session_id, encoding, snapshot))
+        return session
+
+    async def resume_session(
+        self, ws: WebSocket, token: str, *, encoding: str = "full"
+    ) -> RemoteSession:
+        parked = self.parked.claim(token)
+        if parked is None:
+            raise UnknownSessionError(token)
+        session_id, blob = parked
+        try:
+            session = await self.create_session(
+                ws, encoding=encoding, session_id=session_id, snapshot=blob
+            )
+        except (TooManySessionsError, SimulationUnavailableError):
+            self.parked.park(token, session_id, blob)
+            raise
+        self.resumed_sessions += 1
+        return session
+
+    async def destroy_session(self, session_id: str, *, park: bool = False):
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return
+        session.closed = True
+        session.outbound.close()
+        session.worker.session_ids.discard(session_id)
+        if park:
+            # Parked when the worker's snapshot comes back (see `_on_readable`).
+            session.worker.parking[session_id] = session.resume_token
+        session.worker.send(("destroy", session_id, park))
+        for spectator in list(session.spectators):
+            await self._detach_spectator(spectator, close_reason="Session ended")
+
+    def add_spectator(self, session_id: str, ws: WebSocket) -> Spectator:
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise UnknownSessionError(session_id)
+        if len(session.spectators) >= self.MAX_SPECTATORS_PER_SESSION:
+            raise TooManySpectatorsError()
+        spectator = Spectator(session, ws)
+        session.spectators.add(spectator)
+        if len(session.spectators) == 1:
+            session.worker.send(("spectate", session_id, True))
+        elif session.spectator_frame is not None:
+            spectator.publish(session.spectator_frame)
+        return spectator
+
+    async def remove_spectator(self, spectator: Spectator):
+        await self._detach_spectator(spectator)
+
+    async def _detach_spectator(self, spectator: Spectator, close_reason: str | None = None):
+        session = spectator.session
+        assert isinstance(session, RemoteSession)
+        if spectator in session.spectators:
+            session.spectators.discard(spectator)
+            if not session.spectators and not session.closed:
+                session.spectator_frame = None
+                session.worker.send(("spectate", session.session_id, False))
+        spectator.task.cancel()
+        if close_reason is not None:
+            try:
+                await spectator.ws.close(code=1001, reason=close_reason)
+            except RuntimeError:
+                pass  # viewer already gone
+
+    async def telemetry_history(self, session_id: str, seconds: float) -> dict:
+        return await self._call("telemetry_history", session_id, seconds)
+
+    async def mission_log(self, session_id: str, since: int | None = None) -> list[LogEntry]:
+        return await self._call("mission_log", session_id, since)
+
+    async def _call(self, method: str, session_id: str, *args):
+        """Run `SimulationManager.<method>` for a session in its worker."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise UnknownSessionError(session_id)
+        result = await self._request(session.worker, "call", method, session_id, args)
+        if result is None:
+            raise UnknownSessionError(session_id)
+        return result
+
+    async def _request(self, worker: _Worker, kind: str, *args):
+        """Send `(kind, request_id, *args)` and wait for the worker's reply."""
+        if not worker.alive:
+            return None
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        worker.requests[request_id] = future
+        try:
+            worker.send((kind, request_id, *args))
+            return await future
+        finally:
+            worker.requests.pop(request_id, None)
+
+    async def metrics(self) -> list[Metric]:
+        """This process's metric families plus each live worker's, labelled worker="N"."""
+        sessions = self._sessions.values()
+        metrics = [
+            Metric("odyssey_active_sessions", "gauge", "Operator sessions running.")
+            .add(len(self._sessions)),
+            Metric("odyssey_spectators", "gauge", "Spectators attached to sessions.")
+            .add(sum(len(s.spectators) for s in sessions)),
+            Metric("odyssey_outbound_pending_frames", "gauge", "Frames waiting to be sent.")
+            .add(sum(s.outbound.pending_frames for s in sessions)),
+            Metric("odyssey_rejected_sessions_total", "counter", "Sessions refused at capacity.")
+            .add(self.rejected_sessions),
+            Metric("odyssey_send_seconds", "histogram", "Operator frame latency, tick to sent.")
+            .add(self.send_latency),
+            Metric("odyssey_parked_sessions", "gauge", "Dropped sessions awaiting resume.")
+            .add(len(self.parked)),
+            Metric("odyssey_resumed_sessions_total", "counter", "Sessions resumed by token.")
+            .add(self.resumed_sessions),
+        ]
+        live = [worker for worker in self._workers if worker.alive]
+        replies = await asyncio.gather(*(self._request(worker, "metrics") for worker in live))
+        for worker, worker_metrics in zip(live, replies, strict=True):
+            if worker_metrics is None:
+                continue  # died while we asked
+            own = [m for m in worker_metrics if m.name not in self.PARENT_METRICS]
+            metrics += with_labels(own, worker=str(worker.index))
+        return metrics
+
+    async def shutdown(self):
+        """Destroy every session, then let each worker flush its events and exit."""
+        for session_id in list(self._sessions):
+            await self.destroy_session(session_id)
+        loop = asyncio.get_running_loop()
+        for worker in self._workers:
+            loop.remove_reader(worker.conn.fileno())
+            worker.send(("stop",))
+        for worker in self._workers:
+            await asyncio.to_thread(worker.process.join, 10)
+            if worker.process.is_alive():
+                worker.process.kill()
+            worker.conn.close()
+
+    def _on_readable(self, worker: _Worker):
+        try:
+            while worker.conn.poll():
+                match worker.conn.recv():
+                    case ("out", items, statuses):
+                        self._dispatch(items, statuses)
+                    case ("reply", request_id, result):
+                        future = worker.requests.get(request_id)
+                        if future is not None and not future.done():
+                            future.set_result(result)
+                    case ("persisted", events):
+                        if self.on_persisted is not None:
+                            self.on_persisted(events)
+                    case ("parked", session_id, blob):
+                        token = worker.parking.pop(session_id, None)
+                        if token is not None and blob is not None:
+                            self.parked.park(token, session_id, blob)
+        except (EOFError, OSError):
+            # The worker died: its sessions are gone with it, and new ones go
+            # to the workers left.
+            worker.alive = False
+            asyncio.get_running_loop().remove_reader(worker.conn.fileno())
+            worker.parking.clear()
+            for future in worker.requests.values():
+                if not future.done():
+                    future.set_result(None)
+            for session_id in list(worker.session_ids):
+                if session := self._sessions.get(session_id):
+                    asyncio.create_task(self._end_crashed(session, "Simulation lost"))
+
+    def _dispatch(self, items: list[tuple[str, str, str]], statuses: dict):
+        for session_id, kind, text in items:
+            if kind == "log":
+                # Published even if the session just ended: it's still its log.
+                self.log_hub.publish(uuid.UUID(session_id), [LogEntry.model_validate_json(text)])
+                continue
+            session = self._sessions.get(session_id)
+            if session is None:
+                continue
+            if kind in ("frame", "event"):
+                session.outbound.put(text, conflate=kind == "frame")
+            elif kind == "close":
+                asyncio.create_task(self._end_crashed(session, text))
+            else:
+                session.spectator_frame = text
+                for spectator in session.spectators:
+                    spectator.publish(text)
+        for session_id, (scenario, status, tick_rate) in statuses.items():
+            if session := self._sessions.get(session_id):
+                session.scenario, session.mission_status = scenario, status
+                session.tick_rate = tick_rate
+
+    async def _end_crashed(self, session: RemoteSession, reason: str):
+        await self.destroy_session(session.session_id)
+        try:
+            await session.ws.close(code=1011, reason=reason)
+        except RuntimeError:
+            pass  # client already gone
+
+    @property
+    def active_session_count(self) -> int:
+        return len(self._sessions)
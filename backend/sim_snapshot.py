@@ -0,0 +1,139 @@
+# backend/sim_snapshot.py
+"""Compact binary snapshots of a simulator, for resuming a dropped session.
+
+`snapshot` packs everything a mission needs to carry on where it left off:
+the `SimState` fields, the scenario and its timer, `operator_override`, the
+pressure normalization in progress and the log cursor (`log_seq`, so
+resumed entries keep counting up). It does not include the mission log
+itself or the telemetry history; WARNING/CRITICAL entries are in the
+event_log table.
+
+The layout is one fixed `struct` record followed by the two free-text fields
+(scenario name and alert message) as length-prefixed UTF-8. Statuses are
+stored as their index in the schema's Literal values (`FIELDS` in
+backend/scenario_engine.py), so a blob is about 90 bytes and packing or
+unpacking one is a single `struct` call. The numeric fields keep whether
+they were ints (the physics writes `0` at the surface and whole kPa outside a
+normalization), so a restored simulator renders exactly the same frames.
+"""
+import math
+import struct
+
+from backend.clock import Clock, utc_now
+from backend.scenario_engine import FIELDS
+from backend.simulator import SCENARIOS, RovSimulator
+
+VERSION = 1
+
+_STATUSES = (
+    "power_status",
+    "propulsion_status",
+    "hull_status",
+    "arm_status",
+    "package_status",
+    "mission_status",
+)
+_STATUS_VALUES: dict[str, tuple] = {
+    name: values for name in _STATUSES if (values := FIELDS[name][1]) is not None
+}
+_NUMBERS = (
+    "charge_percent",
+    "power_level_percent",
+    "hull_pressure_kpa",
+    "depth_meters",
+    "water_temp_celsius",
+)
+_SEVERITIES = (None, "INFO", "WARNING", "CRITICAL")
+
+# version, flags, six statuses, severity, scenario_timer,
+# pressure_normalization_ticks, log_seq, five numbers, normalization target,
+# then the lengths of the scenario name and alert message.
+_RECORD = struct.Struct("<BH6BBIIQ5ddHI")
+
+# Flag bits; the numbers' "is an int" bits follow from _INT_FLAG.
+_RUNNING, _OVERRIDE, _SAMPLE, _ALERT, _HAS_SCENARIO, _HAS_MESSAGE = (1 << i for i in range(6))
+_INT_FLAG = 1 << 6
+
+
+def snapshot(sim: RovSimulator) -> bytes:
+    """Pack `sim`'s mission state into a blob `restore` accepts."""
+    state = sim.state
+    flags = (
+        _RUNNING * sim.simulation_running
+        | _OVERRIDE * sim.operator_override
+        | _SAMPLE * state.sample_collected
+        | _ALERT * state.alert_active
+        | _HAS_SCENARIO * (sim.active_scenario is not None)
+        | _HAS_MESSAGE * (state.alert_message is not None)
+    )
+    numbers = [getattr(state, name) for name in _NUMBERS]
+    for i, value in enumerate(numbers):
+        if isinstance(value, int):
+            flags |= _INT_FLAG << i
+    scenario = (sim.active_scenario or "").encode()
+    message = (state.alert_message or "").encode()
+    target = sim.pressure_normalization_target
+    return (
+        _RECORD.pack(
+            VERSION,
+            flags,
+            *(_STATUS_VALUES[name].index(getattr(state, name)) for name in _STATUSES),
+            _SEVERITIES.index(state.alert_severity),
+            sim.scenario_timer,
+            sim.pressure_normalization_ticks,
+            sim.log_seq,
+            *numbers,
+            math.nan if target is None else target,
+            len(scenario),
+            len(message),
+        )
+        + scenario
+        + message
+    )
+
+
+def restore(blob: bytes, clock: Clock = utc_now) -> RovSimulator:
+    """A new simulator in the state `blob` was taken in.
+
+    Raises ValueError for a blob of another version, a truncated one, or one
+    naming a scenario this server doesn't have.
+    """
+    try:
+        (
+            version, flags, *fields, timer, ticks, log_seq,
+            charge, power_level, pressure, depth, temp, target,
+            scenario_len, message_len,
+        ) = _RECORD.unpack_from(blob)
+    except struct.error as exc:
+        raise ValueError(f"Invalid simulator snapshot: {exc}") from None
+    if version != VERSION:
+        raise ValueError(f"Unsupported simulator snapshot version {version}")
+    offset = _RECORD.size
+    if len(blob) != offset + scenario_len + message_len:
+        raise ValueError("Invalid simulator snapshot: wrong length")
+    scenario = blob[offset:offset + scenario_len].decode()
+    message = blob[offset + scenario_len:].decode()
+
+    sim = RovSimulator(clock)
+    state = sim.state
+    for name, index in zip(_STATUSES, fields[:-1], strict=True):
+        setattr(state, name, _STATUS_VALUES[name][index])
+    for i, (name, value) in enumerate(
+        zip(_NUMBERS, (charge, power_level, pressure, depth, temp), strict=True)
+    ):
+        setattr(state, name, int(value) if flags & (_INT_FLAG << i) else value)
+    state.sample_collected = bool(flags & _SAMPLE)
+    state.alert_active = bool(flags & _ALERT)
+    state.alert_severity = _SEVERITIES[fields[-1]]
+    state.alert_message = message if flags & _HAS_MESSAGE else None
+    if flags & _HAS_SCENARIO:
+        if scenario not in SCENARIOS:
+            raise ValueError(f"Snapshot names unknown scenario {scenario!r}")
+        sim.switch_scenario(scenario)
+    sim.simulation_running = bool(flags & _RUNNING)
+    sim.operator_override = bool(flags & _OVERRIDE)
+    sim.scenario_timer = timer
+    sim.pressure_normalization_ticks = ticks
+    sim.pressure_normalization_target = None if math.isnan(target) else target
+    sim.log_seq = log_seq
+    return sim
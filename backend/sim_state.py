@@ -0,0 +1,80 @@
+# backend/sim_state.py
+"""The live state of one simulated ROV, as flat slots instead of nested models.
+
+`RovSimulator` mutates its state every tick. Kept in the `RovState` /
+`MissionState` / `ActiveAlert` pydantic models, that is nine model
+instances, each with its own `__dict__` and pydantic's `__setattr__` on
+every write. `SimState` holds the same fields in one `__slots__` object, named
+as in scenario files (`FIELDS` in backend/scenario_engine.py); the simulator
+builds the models from it only when an API asks for them. Values are stored
+unrounded; rounding to the schema's precision happens when a frame is
+serialized.
+"""
+
+
+class SimState:
+    """One ROV's telemetry fields and alert, reset to standby on construction."""
+
+    __slots__ = (
+        "charge_percent",
+        "power_status",
+        "power_level_percent",
+        "propulsion_status",
+        "hull_pressure_kpa",
+        "hull_status",
+        "arm_status",
+        "sample_collected",
+        "package_status",
+        "depth_meters",
+        "water_temp_celsius",
+        "mission_status",
+        "alert_active",
+        "alert_severity",
+        "alert_message",
+    )
+
+    charge_percent: float
+    power_status: str
+    power_level_percent: float
+    propulsion_status: str
+    # An int, except while the scenario eases pressure back to the depth's value.
+    hull_pressure_kpa: float
+    hull_status: str
+    arm_status: str
+    sample_collected: bool
+    package_status: str
+    depth_meters: float
+    water_temp_celsius: float
+    mission_status: str
+    alert_active: bool
+    alert_severity: str | None
+    alert_message: str | None
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Back to standby at the surface, fully charged."""
+        self.charge_percent = 100.0
+        self.power_status = "discharging"
+        self.power_level_percent = 0.0
+        self.propulsion_status = "inactive"
+        self.hull_pressure_kpa = 0
+        self.hull_status = "nominal"
+        self.arm_status = "stowed"
+        self.sample_collected = False
+        self.package_status = "attached"
+        self.depth_meters = 0.0
+        self.water_temp_celsius = 18.0
+        self.mission_status = "standby"
+        self.clear_alert()
+
+    def raise_alert(self, severity: str, message: str):
+        self.alert_active = True
+        self.alert_severity = severity
+        self.alert_message = message
+
+    def clear_alert(self):
+        self.alert_active = False
+        self.alert_severity = None
+        self.alert_message = None
@@ -1,13 +1,28 @@
 # backend/simulation_manager.py
 import asyncio
+import logging
+import secrets
+import time
 import uuid
+from collections.abc import Callable
+from typing import Protocol
 
 from fastapi import WebSocket
 
-from backend.database import async_session_factory
+from backend import sim_snapshot
+from backend.config import settings
+from backend.event_writer import EventWriter
 from backend.logs import LogEntry, LogLevel
-from backend.repository import EventLogRepository
+from backend.metrics import Histogram, Metric
+from backend.mission_log_hub import MissionLogHub
+from backend.outbound_queue import OutboundQueue
+from backend.repository import MissionUpdate
 from backend.simulator import RovSimulator
+from backend.telemetry_archive import TelemetryArchiver
+from backend.telemetry_encoding import DeltaEncoder
+from backend.telemetry_history import TelemetryHistory
+
+logger = logging.getLogger(__name__)
 
 # Severities that get persisted to the event_log table.
 PERSISTED_SEVERITIES = {LogLevel.WARNING, LogLevel.CRITICAL}
@@ -17,91 +32,550 @@ class TooManySessionsError(Exception):
     """Raised when the server is already running MAX_CONCURRENT_SESSIONS sessions."""
 
 
+class TooManySpectatorsError(Exception):
+    """Raised when a session already has MAX_SPECTATORS_PER_SESSION viewers attached."""
+
+
+class SimulationUnavailableError(Exception):
+    """Raised when no simulation worker process is left to run a new session."""
+
+
+class UnknownSessionError(Exception):
+    """Raised for a session id that isn't running, or a resume token that isn't parked."""
+
+
+class _Spectated(Protocol):
+    spectators: set["Spectator"]
+
+
+class Spectator:
+    """A read-only viewer attached to another client's session.
+
+    Frames are handed over already serialized, and each spectator has its own
+    sender task that only ever holds the newest unsent frame: a viewer on a
+    slow link silently skips frames instead of delaying the session or the
+    other viewers.
+    """
+
+    def __init__(self, session: _Spectated, ws: WebSocket):
+        self.session = session
+        self.ws = ws
+        self.conflated_frames = 0
+        self._latest: str | None = None
+        self._ready = asyncio.Event()
+        self.task = asyncio.create_task(self._run())
+
+    def publish(self, frame: str):
+        if self._latest is not None:
+            self.conflated_frames += 1
+        self._latest = frame
+        self._ready.set()
+
+    async def _run(self):
+        try:
+            while True:
+                await self._ready.wait()
+                self._ready.clear()
+                frame, self._latest = self._latest, None
+                if frame is not None:
+                    await self.ws.send_text(frame)
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            # Viewer disconnected mid-send; its endpoint calls remove_spectator.
+            pass
+
+
+class ParkedSessions:
+    """Snapshots of dropped sessions, held by resume token for a grace period.
+
+    Every entry gets the same grace period, so insertion order is expiry
+    order: expired entries are dropped from the front whenever one is parked
+    or claimed, and past `max_entries` the oldest go first.
+    """
+
+    def __init__(self, grace_seconds: float, max_entries: int):
+        self.grace_seconds = grace_seconds
+        self.max_entries = max_entries
+        self._entries: dict[str, tuple[float, str, bytes]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def park(self, token: str, session_id: str, blob: bytes):
+        now = time.monotonic()
+        self._expire(now)
+        self._entries[token] = (now + self.grace_seconds, session_id, blob)
+        while len(self._entries) > self.max_entries:
+            del self._entries[next(iter(self._entries))]
+
+    def claim(self, token: str) -> tuple[str, bytes] | None:
+        """Take the (session_id, snapshot) parked under `token`, if it hasn't expired."""
+        self._expire(time.monotonic())
+        entry = self._entries.pop(token, None)
+        return None if entry is None else (entry[1], entry[2])
+
+    def _expire(self, now: float):
+        while self._entries:
+            token = next(iter(self._entries))
+            if self._entries[token][0] > now:
+                break
+            del self._entries[token]
+
+
 class SimulationSession:
-    """One visitor's isolated simulation: its own simulator, its own tick task."""
+    """One visitor's isolated simulation, advanced by the manager's shared scheduler."""
 
-    def __init__(self, session_id: str, simulator: RovSimulator, ws: WebSocket):
+    def __init__(
+        self, session_id: str, simulator: RovSimulator, ws: WebSocket, outbound: OutboundQueue
+    ):
         self.session_id = session_id
         self.mission_id = uuid.UUID(session_id)
+        # Spreads slowed-down sessions evenly over the passes they skip.
+        self.phase = self.mission_id.int
         self.simulator = simulator
         self.ws = ws
-        self.task: asyncio.Task | None = None
+        # Frames waiting to be sent to the operator, drained by its own task.
+        self.outbound = outbound
         self.command_queue: asyncio.Queue = asyncio.Queue()
         self.pending_events: list[LogEntry] = []
+        self.closed: bool = False
+        # Set after a tick that left the session idle; it then only sends
+        # keepalive frames until a command (or a resync request) arrives.
+        self.hibernating: bool = False
+        self.spectators: set[Spectator] = set()
+        self.history = TelemetryHistory(
+            settings.telemetry_history_seconds * RovSimulator.TICKS_PER_SECOND
+        )
+        self.started_at = simulator.clock()
+        # Lets a client that opted in pick the session up again after a drop.
+        self.resume_token = secrets.token_urlsafe(16)
+        # (scenario, status) last handed to the writer for the mission table;
+        # None until a scenario has started.
+        self.recorded_mission_state: tuple[str | None, str] | None = None
+
+    @property
+    def encoder(self) -> DeltaEncoder | None:
+        """Set for clients that opted into the delta protocol (?encoding=delta)."""
+        return self.outbound.encoder
+
+    @property
+    def scenario(self) -> str | None:
+        return self.simulator.active_scenario
+
+    @property
+    def mission_status(self) -> str:
+        return self.simulator.state.mission_status
+
+    @property
+    def tick_rate(self) -> float:
+        return self.simulator.tick_rate
+
+    @property
+    def idle(self) -> bool:
+        """No mission running and no command waiting: nothing changes between ticks."""
+        return not self.simulator.simulation_running and self.command_queue.empty()
+
+    async def submit_command(self, command: dict):
+        """Queue a client command; it is applied at the start of the next tick."""
+        await self.command_queue.put(command)
+
+    def request_resync(self):
+        """Client lost track of the delta stream: send a keyframe next."""
+        if self.encoder:
+            self.encoder.request_keyframe()
+            self.hibernating = False
 
 
 class SimulationManager:
-    """Owns the lifecycle of all active simulation sessions."""
+    """Owns the lifecycle of all active simulation sessions.
+
+    A single scheduler task advances every session once per tick against a
+    monotonic deadline, instead of one sleeping task per session. Sleeping
+    until the next deadline (rather than for a fixed period after the work)
+    keeps tick spacing constant regardless of how long a pass takes.
+
+    Idle sessions (no mission running, no command waiting) hibernate: their
+    state can't change, so after the tick that left them idle they are not
+    ticked at all, only sent the unchanged state as a keepalive frame every
+    KEEPALIVE_SECONDS. A queued command wakes them on the next pass.
+
+    The rate adapts to load. While the tick budget used (how late a pass
+    starts plus its own work, over the period) averages OVERLOAD_RATIO or
+    more, the slowdown level goes up one step; under RECOVER_RATIO it comes
+    back down. At level n, spectators get a frame only once every 2**n
+    passes; operators are never slowed. Each frame reports the rate its
+    receiver gets in `tick_rate`, so the HMI can interpolate between frames.
 
-    MAX_CONCURRENT_SESSIONS = 50
+    A resumable session whose client drops is parked rather than lost: its
+    simulator is snapshotted (backend/sim_snapshot.py) and held under its
+    resume token for RESUME_GRACE_SECONDS, and `resume_session` restores it
+    under the same session id.
+    """
 
-    def __init__(self):
+    MAX_CONCURRENT_SESSIONS = 200
+    # Spectators share their session's simulation and serialized frames, so
+    # they are capped per session rather than counted as sessions.
+    MAX_SPECTATORS_PER_SESSION = 50
+    # A pass this many ticks late resynchronizes the schedule instead of
+    # burst-ticking to catch up.
+    MAX_CATCH_UP_TICKS = 5
+    OVERLOAD_RATIO = 0.8
+    RECOVER_RATIO = 0.4
+    MAX_SLOWDOWN_LEVEL = 3
+    # The load is averaged over about this many seconds, and a new slowdown
+    # level is kept at least this long, so a few slow passes can't make it flap.
+    LOAD_AVERAGE_SECONDS = 1.0
+    SLOWDOWN_HOLD_SECONDS = 2.0
+    KEEPALIVE_SECONDS = 5.0
+    RESUME_GRACE_SECONDS = 60.0
+    MAX_PARKED_SESSIONS = 1000
+
+    def __init__(
+        self, on_persisted: Callable[[set[tuple[str, uuid.UUID]]], None] | None = None
+    ):
         self._sessions: dict[str, SimulationSession] = {}
+        self._tick_task: asyncio.Task | None = None
+        self._tick_count: int = 0
+        # Passes between keepalive frames of hibernating sessions.
+        self._keepalive_every = max(
+            1, round(self.KEEPALIVE_SECONDS * RovSimulator.TICKS_PER_SECOND)
+        )
+        self.slowdown_level = 0
+        # Moving average of the share of the tick period each pass used up.
+        self.tick_load = 0.0
+        self._slowdown_hold = 0
+        # Told which (severity, mission_id) pairs each written batch held.
+        self.event_writer = EventWriter(on_write=on_persisted)
+        self.log_hub = MissionLogHub()
+        self.parked = ParkedSessions(self.RESUME_GRACE_SECONDS, self.MAX_PARKED_SESSIONS)
+        self.telemetry_archiver = TelemetryArchiver() if settings.telemetry_archive else None
+        # Instrumentation, exported by `metrics()`.
+        self.rejected_sessions = 0
+        self.crashed_sessions = 0
+        self.resumed_sessions = 0
+        self.tick_seconds = Histogram()
+        self.send_latency = Histogram()
 
-    async def create_session(self, ws: WebSocket) -> SimulationSession:
+    async def create_session(
+        self,
+        ws: WebSocket,
+        *,
+        encoding: str = "full",
+        session_id: str | None = None,
+        snapshot: bytes | None = None,
+    ) -> SimulationSession:
+        """Start a session, in standby or in the state `snapshot` was taken in."""
         if len(self._sessions) >= self.MAX_CONCURRENT_SESSIONS:
+            self.rejected_sessions += 1
             raise TooManySessionsError()
 
-        session_id = str(uuid.uuid4())
-        sim = RovSimulator()
-        session = SimulationSession(session_id, sim, ws)
+        session_id = session_id or str(uuid.uuid4())
+        sim = RovSimulator() if snapshot is None else sim_snapshot.restore(snapshot)
+        encoder = DeltaEncoder() if encoding == "delta" else None
+        outbound = self._open_outbound(session_id, ws, encoder)
+        session = SimulationSession(session_id, sim, ws, outbound)
         sim.on_event = session.pending_events.append
-        session.task = asyncio.create_task(self._run_loop(session))
         self._sessions[session_id] = session
+        self.event_writer.start()
+        if self.telemetry_archiver:
+            self.telemetry_archiver.start()
+        self._persist_events(session)
+        if self._tick_task is None:
+            self._tick_task = asyncio.create_task(self._tick_loop())
         return session
 
-    async def destroy_session(self, session_id: str):
+    async def resume_session(
+        self, ws: WebSocket, token: str, *, encoding: str = "full"
+    ) -> SimulationSession:
+        """Restore the session parked under `token`; it gets a new token."""
+        parked = self.parked.claim(token)
+        if parked is None:
+            raise UnknownSessionError(token)
+        session_id, blob = parked
+        try:
+            session = await self.create_session(
+                ws, encoding=encoding, session_id=session_id, snapshot=blob
+            )
+        except TooManySessionsError:
+            self.parked.park(token, session_id, blob)
+            raise
+        self.resumed_sessions += 1
+        return session
+
+    async def destroy_session(self, session_id: str, *, park: bool = False):
+        """End a session; with `park`, keep a snapshot to resume it from (not if it crashed)."""
+        if park and (session := self._sessions.get(session_id)) and not session.closed:
+            self.parked.park(session.resume_token, session_id, await self.snapshot(session_id))
         session = self._sessions.pop(session_id, None)
-        if session and session.task:
-            session.task.cancel()
+        if session:
+            session.closed = True
+            session.outbound.close()
+            for spectator in list(session.spectators):
+                await self._detach_spectator(spectator, close_reason="Session ended")
+        if not self._sessions and self._tick_task:
+            # Nothing left to drive; don't keep waking the loop while idle.
+            self._tick_task.cancel()
+            self._tick_task = None
 
-    async def _run_loop(self, session: SimulationSession):
-        """Tick loop for a single session: drain commands, advance sim, send telemetry."""
-        sim = session.simulator
+    def add_spectator(self, session_id: str, ws: WebSocket) -> Spectator:
+        """Attach a read-only viewer to a running session."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise UnknownSessionError(session_id)
+        if len(session.spectators) >= self.MAX_SPECTATORS_PER_SESSION:
+            raise TooManySpectatorsError()
+        spectator = Spectator(session, ws)
+        session.spectators.add(spectator)
+        # Don't leave a new viewer of a hibernating session waiting for a keepalive.
+        spectator.publish(session.simulator.get_telemetry_json())
+        return spectator
+
+    async def remove_spectator(self, spectator: Spectator):
+        await self._detach_spectator(spectator)
+
+    async def _detach_spectator(self, spectator: Spectator, close_reason: str | None = None):
+        spectator.session.spectators.discard(spectator)
+        spectator.task.cancel()
+        if close_reason is not None:
+            try:
+                await spectator.ws.close(code=1001, reason=close_reason)
+            except RuntimeError:
+                pass  # viewer already gone
+
+    def _open_outbound(
+        self, session_id: str, ws: WebSocket, encoder: DeltaEncoder | None
+    ) -> OutboundQueue:
+        """The queue a new session's frames go through to its socket."""
+        return OutboundQueue(ws, encoder=encoder, send_latency=self.send_latency)
+
+    async def telemetry_history(self, session_id: str, seconds: float) -> dict:
+        """The session's telemetry from the last `seconds` (see TelemetryHistory.window)."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise UnknownSessionError(session_id)
+        return session.history.window(seconds)
+
+    async def mission_log(self, session_id: str, since: int | None = None) -> list[LogEntry]:
+        """The session's log, or only entries with a seq after `since`."""
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise UnknownSessionError(session_id)
+        return session.simulator.get_mission_log(since)
+
+    async def snapshot(self, session_id: str) -> bytes:
+        """A snapshot of the session's simulator (see backend/sim_snapshot.py)."""
+        session = self._sessions.get(session_id)
+        if session is None or session.closed:
+            raise UnknownSessionError(session_id)
+        return sim_snapshot.snapshot(session.simulator)
+
+    async def shutdown(self):
+        """Destroy every session and flush events still waiting to be persisted."""
+        for session_id in list(self._sessions):
+            await self.destroy_session(session_id)
+        await self.event_writer.stop()
+        if self.telemetry_archiver:
+            await self.telemetry_archiver.stop()
+
+    async def _tick_loop(self):
+        """Advance every live session once per tick, paced by a monotonic deadline."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         try:
             while True:
-                while not session.command_queue.empty():
-                    cmd = session.command_queue.get_nowait()
-                    sim.handle_command(cmd)
+                self._tick_count += 1
+                started = loop.time()
+                for session in list(self._sessions.values()):
+                    self._advance(session)
+                work = loop.time() - started
+                self.tick_seconds.observe(work)
 
-                sim.update()
-                telemetry = sim.get_telemetry()
-                await session.ws.send_json(telemetry.model_dump())
-                await self._persist_events(session)
-
-                await asyncio.sleep(1 / sim.TICKS_PER_SECOND)
+                period = 1 / RovSimulator.TICKS_PER_SECOND
+                # A pass that starts late lost its budget to other work on the
+                # loop (sending frames, requests), so that counts as load too.
+                self._adapt((max(started - deadline, 0) + work) / period)
+                deadline += period
+                delay = deadline - loop.time()
+                if delay < -period * self.MAX_CATCH_UP_TICKS:
+                    # The whole pass is hopelessly behind (e.g. the process was
+                    # suspended); resynchronize rather than burst-ticking.
+                    deadline = loop.time()
+                    delay = 0
+                await asyncio.sleep(max(delay, 0))
         except asyncio.CancelledError:
             pass
+
+    def _adapt(self, load: float):
+        """Move the slowdown level by one step when the pass load calls for it."""
+        ticks_per_second = RovSimulator.TICKS_PER_SECOND
+        self.tick_load += (load - self.tick_load) * min(
+            1.0, 1 / (self.LOAD_AVERAGE_SECONDS * ticks_per_second)
+        )
+        if self._slowdown_hold > 0:
+            self._slowdown_hold -= 1
+            return
+        if self.tick_load >= self.OVERLOAD_RATIO and self.slowdown_level < self.MAX_SLOWDOWN_LEVEL:
+            self.slowdown_level += 1
+        elif self.tick_load < self.RECOVER_RATIO and self.slowdown_level > 0:
+            self.slowdown_level -= 1
+        else:
+            return
+        self._slowdown_hold = round(self.SLOWDOWN_HOLD_SECONDS * ticks_per_second)
+        logger.info("Tick load %.2f: slowdown level %d", self.tick_load, self.slowdown_level)
+
+    def _advance(self, session: SimulationSession):
+        """Run one tick of this session and queue the resulting frame for sending."""
+        if session.closed or session.outbound.closed:
+            return
+        if session.hibernating and session.command_queue.empty():
+            if (self._tick_count + session.phase) % self._keepalive_every == 0:
+                self._keepalive(session)
+            return
+
+        # Passes per spectator frame.
+        every = 1 << self.slowdown_level
+        due = (self._tick_count + session.phase) % every == 0
+        sim = session.simulator
+        archiver = self.telemetry_archiver
+        try:
+            logged = len(session.pending_events)
+            while not session.command_queue.empty():
+                cmd = session.command_queue.get_nowait()
+                sim.handle_command(cmd)
+
+            sim.update()
+            session.history.record(sim)
+            if archiver:
+                archiver.record(session.mission_id, sim)
+            session.hibernating = session.idle
+            # The rate this session's frames come at from now on.
+            sim.tick_rate = (
+                1 / self.KEEPALIVE_SECONDS
+                if session.hibernating
+                else float(RovSimulator.TICKS_PER_SECOND)
+            )
+            # Delta frames are encoded by the queue at send time.
+            frame = sim.get_telemetry_dict() if session.encoder else sim.get_telemetry_json()
+            spectator_frame = None
+            if session.spectators and (due or session.hibernating):
+                # Spectators always get full frames: one serialization per tick,
+                # shared with the operator's frame when it is full-encoded at
+                # the same rate.
+                rate = min(sim.tick_rate, RovSimulator.TICKS_PER_SECOND / every)
+                if isinstance(frame, str) and sim.tick_rate == rate:
+                    spectator_frame = frame
+                else:
+                    spectator_frame = sim.get_telemetry_json(tick_rate=rate)
         except Exception:
-            # Client disconnected mid-send; the receive loop (dish #1) will
-            # detect this independently and call destroy_session.
-            pass
+            # A faulty simulation must not take the shared scheduler down with it.
+            logger.exception("Session %s crashed; it will no longer tick", session.session_id)
+            self.crashed_sessions += 1
+            session.closed = True
+            asyncio.create_task(self._end_crashed(session))
+            return
+
+        # A tick that logged anything (including every alert change) is an
+        # event frame: the client must see it, so it is never conflated.
+        session.outbound.put(frame, conflate=len(session.pending_events) == logged)
+        self._persist_events(session)
+        if spectator_frame is not None:
+            for spectator in session.spectators:
+                spectator.publish(spectator_frame)
+
+    async def _end_crashed(self, session: SimulationSession):
+        """Free a crashed session's slot and close its socket, so the client can reconnect."""
+        await self.destroy_session(session.session_id)
+        try:
+            await session.ws.close(code=1011, reason="Simulation error")
+        except RuntimeError:
+            pass  # client already gone
+
+    def _keepalive(self, session: SimulationSession):
+        """Resend a hibernating session's unchanged state, freshly timestamped."""
+        sim = session.simulator
+        frame = sim.get_telemetry_json()
+        session.outbound.put(sim.get_telemetry_dict() if session.encoder else frame)
+        for spectator in session.spectators:
+            spectator.publish(frame)
+
+    def _persist_events(self, session: SimulationSession):
+        """Hand mission state changes and new WARNING/CRITICAL events to the writer,
+        and publish every new event to live log subscribers.
+
+        The mission row is only created once a scenario starts, so connections
+        that never leave standby don't show up in `/api/v1/missions`.
+        """
+        mission_state = (session.scenario, session.mission_status)
+        started = session.scenario is not None or session.recorded_mission_state is not None
+        if started and mission_state != session.recorded_mission_state:
+            session.recorded_mission_state = mission_state
+            self.event_writer.submit_mission(
+                MissionUpdate(session.mission_id, session.started_at, *mission_state)
+            )
 
-    async def _persist_events(self, session: SimulationSession):
-        """Persist any newly emitted WARNING/CRITICAL events to the event_log table."""
         if not session.pending_events:
             return
 
-        events = list(session.pending_events)
+        self.log_hub.publish(session.mission_id, session.pending_events)
+        for entry in session.pending_events:
+            if entry.level in PERSISTED_SEVERITIES:
+                self.event_writer.submit(session.mission_id, entry)
         session.pending_events.clear()
-        to_persist = [e for e in events if e.level in PERSISTED_SEVERITIES]
-        if not to_persist:
-            return
 
-        # Shielded so a session cancellation (tab closed mid-write) can't abort
-        # an in-flight commit and leave the connection in an open transaction.
-        await asyncio.shield(self._write_events(session.mission_id, to_persist))
-
-    async def _write_events(self, mission_id: uuid.UUID, entries: list[LogEntry]):
-        async with async_session_factory() as db_session:
-            repo = EventLogRepository(db_session)
-            for entry in entries:
-                await repo.insert(
-                    timestamp=entry.timestamp,
-                    severity=entry.level.value,
-                    message=entry.message,
-                    mission_id=mission_id,
-                )
+    async def metrics(self) -> list[Metric]:
+        """This manager's metric families for GET /metrics (see backend/metrics.py)."""
+        sessions = self._sessions.values()
+        writer = self.event_writer
+        metrics = [
+            Metric("odyssey_active_sessions", "gauge", "Operator sessions running.")
+            .add(len(self._sessions)),
+            Metric("odyssey_spectators", "gauge", "Spectators attached to sessions.")
+            .add(sum(len(s.spectators) for s in sessions)),
+            Metric("odyssey_command_queue_depth", "gauge", "Commands waiting for the next tick.")
+            .add(sum(s.command_queue.qsize() for s in sessions)),
+            Metric("odyssey_outbound_pending_frames", "gauge", "Frames waiting to be sent.")
+            .add(sum(s.outbound.pending_frames for s in sessions)),
+            Metric("odyssey_event_queue_depth", "gauge", "Events waiting to be persisted.")
+            .add(writer.queue_depth),
+            Metric("odyssey_rejected_sessions_total", "counter", "Sessions refused at capacity.")
+            .add(self.rejected_sessions),
+            Metric("odyssey_session_crashes_total", "counter", "Sessions stopped by an error.")
+            .add(self.crashed_sessions),
+            Metric("odyssey_tick_load", "gauge", "Moving average of tick budget used.")
+            .add(self.tick_load),
+            Metric("odyssey_slowdown_level", "gauge", "Spectators get every 2**level passes.")
+            .add(self.slowdown_level),
+            Metric("odyssey_hibernating_sessions", "gauge", "Idle sessions not being ticked.")
+            .add(sum(s.hibernating for s in sessions)),
+            Metric("odyssey_parked_sessions", "gauge", "Dropped sessions awaiting resume.")
+            .add(len(self.parked)),
+            Metric("odyssey_resumed_sessions_total", "counter", "Sessions resumed by token.")
+            .add(self.resumed_sessions),
+            Metric("odyssey_events_total", "counter", "WARNING/CRITICAL events by outcome.")
+            .add(writer.persisted_events, outcome="persisted")
+            .add(writer.dropped_events, outcome="dropped")
+            .add(writer.failed_events, outcome="failed"),
+            Metric("odyssey_tick_seconds", "histogram", "Duration of each scheduler pass.")
+            .add(self.tick_seconds),
+            Metric("odyssey_send_seconds", "histogram", "Operator frame latency, tick to sent.")
+            .add(self.send_latency),
+            Metric("odyssey_db_write_seconds", "histogram", "Duration of each batch write.")
+            .add(writer.write_seconds, writer="events"),
+        ]
+        if archiver := self.telemetry_archiver:
+            metrics[-1].add(archiver.copy_seconds, writer="telemetry")
+            metrics += [
+                Metric(
+                    "odyssey_telemetry_archive_pending_samples", "gauge",
+                    "Telemetry samples waiting to be archived.",
+                ).add(archiver.pending_samples),
+                Metric("odyssey_telemetry_samples_total", "counter", "Samples by outcome.")
+                .add(archiver.archived_samples, outcome="archived")
+                .add(archiver.dropped_samples, outcome="dropped")
+                .add(archiver.failed_samples, outcome="failed"),
+            ]
+        return metrics
 
     @property
     def active_session_count(self) -> int:
@@ -1,9 +1,10 @@
 # backend/simulator.py
 from collections.abc import Callable
-from datetime import UTC, datetime
 
+from backend.clock import Clock, utc_now
 from backend.config import settings
 from backend.logs import LogEntry, LogLevel
+from backend.mission_log import MissionLog
 from backend.models import (
     ActiveAlert,
     Environment,
@@ -16,11 +17,21 @@ from backend.models import (
     SciencePackage,
     TelemetryMessage,
 )
+from backend.scenario_engine import Scenario, load_scenarios
+from backend.sim_state import SimState
+from backend.telemetry_json import telemetry_dict, telemetry_json
 
 
 class RovSimulator:
     """
-    Manages the state and scenario logic for the Odyssey ROV simulation.
+    Manages the state of the Odyssey ROV simulation and runs its scenario.
+
+    Scenario logic is data: each scenario in `SCENARIOS` is compiled from a
+    file in backend/scenarios/ (see backend/scenario_engine.py); this class
+    applies commands, evaluates the active scenario's rules and runs the
+    physics every tick. The ROV's state lives in a slotted `SimState`
+    (`self.state`); `rov_state`, `mission_state` and `alert` build pydantic
+    snapshots of it for the API, with values passed through exactly as stored.
 
     Key behavior changes vs prior version:
     - Pressure Anomaly 'All Stop': no depth snap; we keep current depth but
@@ -41,11 +52,20 @@ class RovSimulator:
     # Ticks-per-second (used by the websocket loop)
     TICKS_PER_SECOND = settings.ticks_per_second
 
-    def __init__(self):
+    def __init__(self, clock: Clock = utc_now):
+        # Source of log and telemetry timestamps; swap in a VirtualClock to run
+        # missions in simulated time (see backend/headless.py).
+        self.clock = clock
+        # Rate this simulator's frames are sent at, reported in every frame;
+        # the manager lowers it while an idle session hibernates.
+        self.tick_rate: float = float(self.TICKS_PER_SECOND)
         self.active_scenario: str | None = None
+        self.compiled_scenario: Scenario | None = None
         self.scenario_timer: int = 0
         self.simulation_running: bool = False
-        self.mission_log: list[LogEntry] = []
+        self.mission_log = MissionLog(settings.mission_log_memory_entries)
+        # Last LogEntry.seq handed out; not reset with the mission state.
+        self.log_seq: int = 0
         self.operator_override: bool = (
             False  # set when operator issues a propulsion command
         )
@@ -53,34 +73,28 @@ class RovSimulator:
         self.pressure_normalization_ticks: int = 0
         # Optional hook invoked with each new LogEntry (e.g. to persist to a DB).
         self.on_event: Callable[[LogEntry], None] | None = None
+        self.state = SimState()
         self._reset_state()
 
     # --- Setup & Logging ---
 
     def _reset_state(self):
         """Reset simulator to standby state."""
-        self.rov_state = RovState(
-            power=Power(charge_percent=100.0, status="discharging"),
-            propulsion=Propulsion(power_level_percent=0.0, status="inactive"),
-            hull_integrity=HullIntegrity(hull_pressure_kpa=0, status="nominal"),
-            manipulator_arm=ManipulatorArm(status="stowed", sample_collected=False),
-            science_package=SciencePackage(status="attached"),
-            environment=Environment(depth_meters=0.0, water_temp_celsius=18.0),
-        )
-        self.mission_state = MissionState(status="standby")
-        self.alert = ActiveAlert(active=False)
+        self.state.reset()
         self.active_scenario = None
+        self.compiled_scenario = None
         self.scenario_timer = 0
         self.simulation_running = False
-        self.mission_log = []
+        self.mission_log.clear()
         self.operator_override = False
         self.pressure_normalization_target = None
         self.pressure_normalization_ticks = 0
 
     def _add_log_entry(self, level: LogLevel, message: str):
         """Record a new mission log entry."""
+        self.log_seq += 1
         entry = LogEntry(
-            timestamp=datetime.now(UTC), level=level, message=message
+            timestamp=self.clock(), level=level, message=message, seq=self.log_seq
         )
         self.mission_log.append(entry)
         if self.on_event:
@@ -88,24 +102,75 @@ class RovSimulator:
 
     # --- Public API ---
 
+    @property
+    def rov_state(self) -> RovState:
+        """A snapshot of the ROV's state; changing it doesn't change the simulation."""
+        state = self.state
+        return RovState.model_construct(
+            power=Power.model_construct(
+                charge_percent=state.charge_percent, status=state.power_status
+            ),
+            propulsion=Propulsion.model_construct(
+                power_level_percent=state.power_level_percent, status=state.propulsion_status
+            ),
+            hull_integrity=HullIntegrity.model_construct(
+                hull_pressure_kpa=state.hull_pressure_kpa, status=state.hull_status
+            ),
+            manipulator_arm=ManipulatorArm.model_construct(
+                status=state.arm_status, sample_collected=state.sample_collected
+            ),
+            science_package=SciencePackage.model_construct(status=state.package_status),
+            environment=Environment.model_construct(
+                depth_meters=state.depth_meters, water_temp_celsius=state.water_temp_celsius
+            ),
+        )
+
+    @property
+    def mission_state(self) -> MissionState:
+        return MissionState.model_construct(status=self.state.mission_status)
+
+    @property
+    def alert(self) -> ActiveAlert:
+        state = self.state
+        return ActiveAlert.model_construct(
+            active=state.alert_active, severity=state.alert_severity, message=state.alert_message
+        )
+
     def get_telemetry(self) -> TelemetryMessage:
         """Return a snapshot of current telemetry."""
         return TelemetryMessage(
-            timestamp=datetime.now(UTC).isoformat(),
+            timestamp=self.clock().isoformat(),
+            tick_rate=self.tick_rate,
             rov_state=self.rov_state,
             mission_state=self.mission_state,
             alert=self.alert,
         )
 
-    def get_mission_log(self) -> list[LogEntry]:
-        """Return all mission log entries so far."""
-        return self.mission_log
+    def get_telemetry_json(self, tick_rate: float | None = None) -> str:
+        """Return the current telemetry frame as JSON text, skipping validation.
+
+        Used on the per-tick WebSocket path; see backend/telemetry_json.py.
+        `tick_rate` overrides the reported rate, for a viewer that is sent
+        only some of the frames.
+        """
+        return telemetry_json(
+            self.clock().isoformat(), self.tick_rate if tick_rate is None else tick_rate, self.state
+        )
+
+    def get_telemetry_dict(self) -> dict:
+        """Plain-dict equivalent of `get_telemetry_json`, for post-processing."""
+        return telemetry_dict(self.clock().isoformat(), self.tick_rate, self.state)
+
+    def get_mission_log(self, since: int | None = None) -> list[LogEntry]:
+        """Return the mission log, or only the entries with a seq after `since`."""
+        return list(self.mission_log.since(since))
 
     def handle_command(self, command: dict):
         """Handle commands from the frontend."""
         command_name = command.get("command")
         payload = command.get("payload", {})
 
+        applied = False
         match command_name:
             case "START_SIMULATION":
                 self._handle_start_simulation(payload.get("scenario"))
@@ -114,18 +179,18 @@ class RovSimulator:
                     LogLevel.OPERATOR,
                     f"Command Sent: SET_PROPULSION_STATE({payload.get('status')}).",
                 )
-                self._handle_set_propulsion(payload.get("status"))
+                applied = self._handle_set_propulsion(payload.get("status"))
             case "DEPLOY_ARM":
                 self._add_log_entry(LogLevel.OPERATOR, "Command Sent: DEPLOY_ARM.")
-                self._handle_deploy_arm()
+                applied = self._handle_deploy_arm()
             case "COLLECT_SAMPLE":
                 self._add_log_entry(LogLevel.OPERATOR, "Command Sent: COLLECT_SAMPLE.")
-                self._handle_collect_sample()
+                applied = self._handle_collect_sample()
             case "JETTISON_PACKAGE":
                 self._add_log_entry(
                     LogLevel.OPERATOR, "Command Sent: JETTISON_PACKAGE."
                 )
-                self._handle_jettison_package()
+                applied = self._handle_jettison_package()
             case "RESET_SIMULATION":
                 self._reset_state()
                 self._add_log_entry(LogLevel.INFO, "Simulation reset to standby.")
@@ -134,6 +199,10 @@ class RovSimulator:
                     LogLevel.WARNING, f"Unknown command: {command_name}"
                 )
 
+        # Scenario rules reacting to the command (`on = "<COMMAND>"`).
+        if applied and self.compiled_scenario is not None:
+            self.compiled_scenario.command(self, str(command_name))
+
     def update(self):
         """Advance simulation by one tick (called by websocket loop)."""
         if not self.simulation_running:
@@ -141,282 +210,86 @@ class RovSimulator:
 
         self.scenario_timer += 1
 
-        updater = getattr(self, f"_update_{self.active_scenario}_scenario", None)
-        if updater:
-            updater()
+        if self.compiled_scenario is not None:
+            self.compiled_scenario.tick(self)
 
         self._update_physics()
 
+    def switch_scenario(self, name: str):
+        """Hand the running mission over to another scenario's rules, keeping its state."""
+        self.compiled_scenario = SCENARIOS[name]
+        self.active_scenario = name
+
     # --- Command Handlers ---
 
-    def _handle_start_simulation(self, scenario: str | None):
-        if scenario in ["nominal", "pressure_anomaly", "power_fault"]:
+    def _handle_start_simulation(self, name: str | None):
+        scenario = SCENARIOS.get(name) if name is not None else None
+        if scenario is not None:
             self._reset_state()
-            self.active_scenario = scenario
+            self.switch_scenario(scenario.name)
             self.simulation_running = True
-            self.mission_state.status = "en_route"
-            self._add_log_entry(
-                LogLevel.INFO,
-                f"Scenario Started: {scenario.replace('_', ' ').title()}.",
-            )
+            self.state.mission_status = "en_route"
+            self._add_log_entry(LogLevel.INFO, f"Scenario Started: {scenario.title}.")
             self._add_log_entry(LogLevel.INFO, "Mission status changed to 'en_route'.")
         else:
             self._add_log_entry(
-                LogLevel.WARNING, f"Attempted to start unknown scenario: {scenario}"
+                LogLevel.WARNING, f"Attempted to start unknown scenario: {name}"
             )
 
-    def _handle_set_propulsion(self, status: str):
+    def _handle_set_propulsion(self, status: str) -> bool:
         if status not in ["active", "inactive"]:
-            return
+            return False
 
-        self.rov_state.propulsion.status = status
+        self.state.propulsion_status = status
         self.operator_override = True  # operator is in control from now on
+        return True
 
-        # Special handling for Pressure Anomaly: clear the condition without snapping depth
-        if self.active_scenario == "pressure_anomaly" and status == "inactive":
-            if self.rov_state.hull_integrity.status in ["warning", "critical"]:
-                # Keep current depth (no snap), but clear the anomaly and alert.
-                self.rov_state.hull_integrity.status = "nominal"
-                self.alert = ActiveAlert(active=False)
-                self.scenario_timer = 0
-                self._add_log_entry(LogLevel.INFO, "Hull pressure returned to nominal.")
-                self._add_log_entry(LogLevel.INFO, "Operator intervention successful.")
-
-                # FIX 1: Kick off the pressure normalization effect over 5 ticks.
-                self.pressure_normalization_target = (
-                    self.rov_state.environment.depth_meters * self.PRESSURE_PER_METER
-                )
-                self.pressure_normalization_ticks = 5  # Decrease over 5 ticks
-
-                # FIX 2 (from previous step): Transition to the nominal searching phase.
-                self.active_scenario = "nominal"
-                self.mission_state.status = "searching"
-                self._add_log_entry(
-                    LogLevel.INFO,
-                    "Anomaly resolved. Resuming mission: searching for sample.",
-                )
-
-    def _handle_deploy_arm(self):
-        if self.rov_state.manipulator_arm.status == "stowed":
-            self.rov_state.manipulator_arm.status = "deployed"
+    def _handle_deploy_arm(self) -> bool:
+        if self.state.arm_status == "stowed":
+            self.state.arm_status = "deployed"
             self._add_log_entry(
                 LogLevel.INFO, "Manipulator arm status changed to 'deployed'."
             )
+            return True
+        return False
 
-    def _handle_collect_sample(self):
-        if self.rov_state.manipulator_arm.status == "deployed":
-            self.rov_state.manipulator_arm.status = "gripping"
-            self.rov_state.manipulator_arm.sample_collected = True
+    def _handle_collect_sample(self) -> bool:
+        if self.state.arm_status == "deployed":
+            self.state.arm_status = "gripping"
+            self.state.sample_collected = True
             self._add_log_entry(LogLevel.INFO, "Sample collected successfully.")
+            return True
+        return False
 
-    def _handle_jettison_package(self):
-        if self.rov_state.science_package.status == "attached":
-            self.rov_state.science_package.status = "jettisoned"
-            if self.rov_state.power.status == "fault":
-                self.rov_state.power.status = "discharging"
-                self.alert = ActiveAlert(active=False)
-                self.mission_state.status = "emergency_ascent"
-                # Force propulsion on for ascent, but still mark as operator override
-                self.rov_state.propulsion.status = "active"
-                self.operator_override = True
-                self._add_log_entry(
-                    LogLevel.INFO, "Science package jettisoned. Power drain stabilized."
-                )
-                self._add_log_entry(
-                    LogLevel.INFO, "Mission status changed to 'emergency_ascent'."
-                )
-
-    # --- Scenario Logic ---
-
-    def _update_nominal_scenario(self):
-        # Respect operator override: do not force propulsion if the operator has intervened.
-        if self.mission_state.status == "en_route":
-            if (
-                not self.operator_override
-                and self.rov_state.environment.depth_meters < self.TARGET_DEPTH
-            ):
-                self.rov_state.propulsion.status = "active"
-            elif self.rov_state.environment.depth_meters >= self.TARGET_DEPTH:
-                self.mission_state.status = "searching"
-                if not self.operator_override:
-                    self.rov_state.propulsion.status = "inactive"
-                self.scenario_timer = 0
-                self._add_log_entry(
-                    LogLevel.INFO, "Mission status changed to 'searching'."
-                )
-
-        # Searching prompt
-        if (
-            self.mission_state.status == "searching"
-            and self.scenario_timer > 30
-            and not self.alert.active
-        ):
-            self.alert = ActiveAlert(
-                active=True,
-                severity="INFO",
-                message="Bioluminescent signature detected. Ready to deploy manipulator arm.",
-            )
-            self._add_log_entry(
-                LogLevel.INFO,
-                "Bioluminescent signature detected. Awaiting operator action.",
-            )
-
-        # Collect sample → return
-        if (
-            self.rov_state.manipulator_arm.sample_collected
-            and self.mission_state.status != "returning"
-        ):
-            self.mission_state.status = "returning"
-            # If operator hasn't explicitly stopped propulsion, turn it on for ascent
-            if self.rov_state.propulsion.status != "inactive":
-                self.rov_state.propulsion.status = "active"
-            self.alert = ActiveAlert(active=False)
-            self._add_log_entry(LogLevel.INFO, "Mission status changed to 'returning'.")
-
-        # Surface
-        if (
-            self.mission_state.status == "returning"
-            and self.rov_state.environment.depth_meters <= 0
-        ):
-            self.mission_state.status = "mission_success"
-            self.rov_state.propulsion.status = "inactive"
-            self.simulation_running = False
-            self._add_log_entry(
-                LogLevel.INFO, "Mission status changed to 'mission_success'."
-            )
-
-    def _update_pressure_anomaly_scenario(self):
-        # If operator has intervened, do not force propulsion or escalate the anomaly any further.
-        if self.operator_override:
-            return
-
-        if self.mission_state.status == "en_route":
-            self.rov_state.propulsion.status = "active"
-
-        # Escalation logic only active if not overridden by operator
-        if (
-            self.rov_state.hull_integrity.status == "nominal"
-            and self.rov_state.hull_integrity.hull_pressure_kpa
-            > self.PRESSURE_WARNING_THRESHOLD
-        ):
-            self.rov_state.hull_integrity.status = "warning"
-            self.scenario_timer = 0
-            self.alert = ActiveAlert(
-                active=True,
-                severity="WARNING",
-                message="Hull pressure exceeds nominal limits. Halt descent.",
-            )
-            self._add_log_entry(
-                LogLevel.WARNING, "Hull pressure exceeds nominal limits."
-            )
-
-        if (
-            self.rov_state.hull_integrity.status == "warning"
-            and self.scenario_timer > 30
-        ):
-            self.rov_state.hull_integrity.status = "critical"
-            self.scenario_timer = 0
-            self.alert = ActiveAlert(
-                active=True,
-                severity="CRITICAL",
-                message="CRITICAL: Hull pressure at dangerous levels!",
-            )
-            self._add_log_entry(
-                LogLevel.CRITICAL, "Hull pressure has reached a critical level!"
-            )
-
-        if (
-            self.rov_state.hull_integrity.status == "critical"
-            and self.scenario_timer > 15
-        ):
-            self.mission_state.status = "mission_failure_hull_breach"
-            self.simulation_running = False
-            self._add_log_entry(
-                LogLevel.CRITICAL,
-                "Mission status changed to 'mission_failure_hull_breach'.",
-            )
-
-    def _update_power_fault_scenario(self):
-        if (
-            self.mission_state.status == "en_route"
-            and self.rov_state.environment.depth_meters < self.TARGET_DEPTH
-        ):
-            # Respect operator override: don't force if they've stopped it.
-            if not self.operator_override:
-                self.rov_state.propulsion.status = "active"
-        elif (
-            self.mission_state.status == "en_route"
-            and self.rov_state.environment.depth_meters >= self.TARGET_DEPTH
-        ):
-            self.mission_state.status = "searching"
-            if not self.operator_override:
-                self.rov_state.propulsion.status = "inactive"
-            self.scenario_timer = 0
-            self._add_log_entry(LogLevel.INFO, "Mission status changed to 'searching'.")
-
-        if (
-            self.mission_state.status == "searching"
-            and self.scenario_timer > 10
-            and self.rov_state.power.status != "fault"
-        ):
-            self.rov_state.power.status = "fault"
-            self.scenario_timer = 0
-            self.alert = ActiveAlert(
-                active=True,
-                severity="CRITICAL",
-                message="Power system fault! Catastrophic drain. Jettison package to save ROV.",
-            )
-            self._add_log_entry(
-                LogLevel.CRITICAL,
-                "Power system fault detected. Catastrophic battery drain.",
-            )
-
-        if (
-            self.rov_state.power.status == "fault"
-            and self.rov_state.power.charge_percent <= 0
-        ):
-            self.mission_state.status = "mission_failure_lost_signal"
-            self.simulation_running = False
-            self.alert = ActiveAlert(
-                active=True, severity="CRITICAL", message="Battery at 0%. Signal lost."
-            )
-            self._add_log_entry(LogLevel.CRITICAL, "Battery at 0%. Signal lost.")
-            self._add_log_entry(
-                LogLevel.CRITICAL,
-                "Mission status changed to 'mission_failure_lost_signal'.",
-            )
-
-        if (
-            self.mission_state.status == "emergency_ascent"
-            and self.rov_state.environment.depth_meters <= 0
-        ):
-            self.mission_state.status = "mission_success"
-            self.simulation_running = False
-            self.alert = ActiveAlert(active=False)
-            self._add_log_entry(LogLevel.INFO, "ROV returned to surface successfully.")
+    def _handle_jettison_package(self) -> bool:
+        if self.state.package_status == "attached":
+            self.state.package_status = "jettisoned"
+            return True
+        return False
 
     # --- General Physics ---
 
     def _update_physics(self):
         """Update depth, pressure, and battery drain each tick."""
-        current_depth = self.rov_state.environment.depth_meters
+        state = self.state
+        current_depth = state.depth_meters
 
         # --- Autopilot enforcement ---
         # Ensure propulsion stays on during ascent phases
-        if self.mission_state.status in ["returning", "emergency_ascent"]:
-            self.rov_state.propulsion.status = "active"
+        if state.mission_status in ["returning", "emergency_ascent"]:
+            state.propulsion_status = "active"
 
         # --- Depth updates ---
-        if self.rov_state.propulsion.status == "active":
-            if self.mission_state.status in ["en_route", "searching"]:
+        if state.propulsion_status == "active":
+            if state.mission_status in ["en_route", "searching"]:
                 # Descend, but never beyond 150% target depth
-                self.rov_state.environment.depth_meters = min(
+                state.depth_meters = min(
                     self.TARGET_DEPTH * 1.5,
                     current_depth + self.DESCENT_RATE,
                 )
-            elif self.mission_state.status in ["returning", "emergency_ascent"]:
+            elif state.mission_status in ["returning", "emergency_ascent"]:
                 # Ascend, but never above surface
-                self.rov_state.environment.depth_meters = max(
+                state.depth_meters = max(
                     0,
                     current_depth - self.ASCENT_RATE,
                 )
@@ -424,38 +297,42 @@ class RovSimulator:
         # --- Pressure updates ---
         # Always consistent with depth; anomaly "status" may be cleared by override
         if self.pressure_normalization_ticks > 0:
-            current_pressure = self.rov_state.hull_integrity.hull_pressure_kpa
+            current_pressure = state.hull_pressure_kpa
             # Calculate the amount to decrease in this step
             step = (
                 current_pressure - self.pressure_normalization_target
             ) / self.pressure_normalization_ticks
-            self.rov_state.hull_integrity.hull_pressure_kpa -= step
+            state.hull_pressure_kpa -= step
             self.pressure_normalization_ticks -= 1
             # When finished, snap to the exact target to avoid float errors
             if self.pressure_normalization_ticks == 0:
-                self.rov_state.hull_integrity.hull_pressure_kpa = int(
-                    self.pressure_normalization_target
-                )
+                state.hull_pressure_kpa = int(self.pressure_normalization_target)
                 self.pressure_normalization_target = None  # Clean up
         else:
             # Original behavior: pressure is always consistent with depth
-            self.rov_state.hull_integrity.hull_pressure_kpa = int(
-                self.rov_state.environment.depth_meters * self.PRESSURE_PER_METER
-            )
+            state.hull_pressure_kpa = int(state.depth_meters * self.PRESSURE_PER_METER)
 
-        if self.rov_state.propulsion.status == "active":
-            self.rov_state.propulsion.power_level_percent = 75.0  # some nominal thrust
+        if state.propulsion_status == "active":
+            state.power_level_percent = 75.0  # some nominal thrust
         else:
-            self.rov_state.propulsion.power_level_percent = 0.0
+            state.power_level_percent = 0.0
 
         # --- Battery drain ---
         drain_rate = 0.03
-        if self.rov_state.power.status == "fault":
+        if state.power_status == "fault":
             drain_rate += 1.5
-        elif self.rov_state.propulsion.status == "active":
+        elif state.propulsion_status == "active":
             drain_rate += 0.3
 
-        self.rov_state.power.charge_percent = max(
+        state.charge_percent = max(
             0,
-            self.rov_state.power.charge_percent - drain_rate,
+            state.charge_percent - drain_rate,
         )
+
+
+# Constants scenario files may compare against by name, e.g. "TARGET_DEPTH".
+SCENARIO_CONSTANTS = {name: value for name, value in vars(RovSimulator).items() if name.isupper()}
+
+# Every known scenario, compiled once at import: the built-in ones plus any
+# in SCENARIOS_DIR.
+SCENARIOS: dict[str, Scenario] = load_scenarios(SCENARIO_CONSTANTS, settings.scenarios_dir)
@@ -0,0 +1,195 @@
+# backend/telemetry_archive.py
+"""Optional per-tick telemetry archive (`TELEMETRY_ARCHIVE=true`).
+
+Every tick of every session becomes one `telemetry_sample` row. At that rate
+even batched INSERTs cost more than the tick itself, so `TelemetryArchiver`
+buffers samples in a plain list (`record` is a tuple build and an append, no
+await) and a background task bulk-loads them with asyncpg's binary COPY,
+once a second or as soon as `batch_size` samples are waiting.
+
+`telemetry_sample` is range-partitioned by UTC day. Before copying a batch the
+archiver creates the day partitions it needs (once per day per process);
+rows for a day whose partition couldn't be created land in the default
+partition instead of being lost. A day the default partition already holds
+rows for stays there (attaching its partition would fail the same way every
+time); other failures are retried with exponential backoff.
+"""
+import asyncio
+import logging
+import time
+import uuid
+from datetime import UTC, date, datetime, timedelta
+
+import asyncpg
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from backend.database import engine as default_engine
+from backend.metrics import Histogram
+from backend.simulator import RovSimulator
+
+logger = logging.getLogger(__name__)
+
+# Backoff between attempts to create a day partition after an error.
+PARTITION_RETRY_SECONDS = 5.0
+PARTITION_RETRY_MAX_SECONDS = 300.0
+
+COLUMNS = (
+    "mission_id",
+    "timestamp",
+    "charge_percent",
+    "power_level_percent",
+    "hull_pressure_kpa",
+    "depth_meters",
+    "water_temp_celsius",
+    "mission_status",
+)
+
+
+def partition_name(day: date) -> str:
+    return f"telemetry_sample_{day:%Y%m%d}"
+
+
+class TelemetryArchiver:
+    """Write-behind COPY loader for `telemetry_sample`.
+
+    Like `EventWriter`, memory is bounded: once `max_pending` samples are
+    waiting (e.g. the database is down), new samples are dropped and counted.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_pending: int = 100_000,
+        batch_size: int = 5_000,
+        flush_interval: float = 1.0,
+        engine: AsyncEngine = default_engine,
+    ):
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._engine = engine
+        self._pending: list[tuple] = []
+        self._wakeup = asyncio.Event()
+        self._stopping = False
+        self._task: asyncio.Task | None = None
+        self._partitions: set[date] = set()
+        # Days whose rows stay in the default partition (see `_create_partition`).
+        self._default_days: set[date] = set()
+        # day -> (monotonic time of the next attempt, backoff) after a failure.
+        self._partition_retries: dict[date, tuple[float, float]] = {}
+        self.archived_samples = 0
+        self.dropped_samples = 0
+        self.failed_samples = 0
+        # Duration of each batch's COPY, failed ones included.
+        self.copy_seconds = Histogram()
+
+    def start(self):
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Copy everything already recorded, then stop the background task."""
+        if self._task is None:
+            return
+        self._stopping = True
+        self._wakeup.set()
+        await self._task
+        self._task = None
+
+    def record(self, mission_id: uuid.UUID, sim: RovSimulator) -> bool:
+        """Buffer the simulator's current readings; returns False if dropped."""
+        if len(self._pending) >= self.max_pending:
+            self.dropped_samples += 1
+            return False
+        state = sim.state
+        self._pending.append(
+            (
+                mission_id,
+                sim.clock(),
+                state.charge_percent,
+                state.power_level_percent,
+                int(state.hull_pressure_kpa),
+                state.depth_meters,
+                state.water_temp_celsius,
+                state.mission_status,
+            )
+        )
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+        return True
+
+    @property
+    def pending_samples(self) -> int:
+        return len(self._pending)
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except TimeoutError:
+                pass
+            self._wakeup.clear()
+            if self._pending:
+                batch, self._pending = self._pending, []
+                await self._copy(batch)
+            if self._stopping:
+                return
+
+    async def _copy(self, batch: list[tuple]):
+        started = time.perf_counter()
+        try:
+            async with self._engine.connect() as conn:
+                raw = await conn.get_raw_connection()
+                driver = raw.driver_connection
+                assert driver is not None
+                days = {timestamp.astimezone(UTC).date() for _, timestamp, *_ in batch}
+                now = time.monotonic()
+                for day in sorted(days - self._partitions - self._default_days):
+                    retry = self._partition_retries.get(day)
+                    if retry is None or retry[0] <= now:
+                        await self._create_partition(driver, day)
+                await driver.copy_records_to_table(
+                    "telemetry_sample", records=batch, columns=COLUMNS
+                )
+        except Exception:
+            self.failed_samples += len(batch)
+            logger.exception("Failed to archive %d telemetry samples", len(batch))
+            return
+        finally:
+            self.copy_seconds.observe(time.perf_counter() - started)
+        self.archived_samples += len(batch)
+
+    async def _create_partition(self, driver: asyncpg.Connection, day: date):
+        start = datetime.combine(day, datetime.min.time(), UTC)
+        end = start + timedelta(days=1)
+        try:
+            await driver.execute(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(day)} PARTITION OF telemetry_sample "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        except asyncpg.DuplicateTableError:
+            pass  # another worker process created it first
+        except asyncpg.CheckViolationError:
+            # The default partition already holds rows for this day, so every
+            # attempt would fail: leave the day's rows there for good.
+            logger.warning(
+                "Default partition holds rows for %s; archiving that day there", day.isoformat()
+            )
+            self._default_days.add(day)
+            return
+        except asyncpg.PostgresError:
+            # Keep copying (into the default partition) rather than failing,
+            # and try again once the backoff has passed.
+            _, backoff = self._partition_retries.get(day, (0.0, PARTITION_RETRY_SECONDS / 2))
+            backoff = min(backoff * 2, PARTITION_RETRY_MAX_SECONDS)
+            self._partition_retries[day] = (time.monotonic() + backoff, backoff)
+            logger.warning(
+                "Could not create partition %s; retrying in %.0f s",
+                partition_name(day),
+                backoff,
+                exc_info=True,
+            )
+            return
+        self._partition_retries.pop(day, None)
+        self._partitions.add(day)
@@ -0,0 +1,60 @@
+# backend/telemetry_encoding.py
+"""Opt-in delta encoding for the /ws/telemetry stream.
+
+Clients connecting with `?encoding=delta` receive wrapped frames instead of
+bare `TelemetryMessage` dicts:
+
+    {"type": "keyframe", "seq": 0, "telemetry": {...full TelemetryMessage...}}
+    {"type": "delta", "seq": 1, "changes": {"timestamp": "...",
+        "rov_state": {"environment": {"depth_meters": 50.0}}}}
+
+`changes` holds only the leaves that differ from the previous frame, nested
+the same way as the full message; apply it by deep-merging into the last
+state. `seq` increases by one per frame, so a client that sees a gap (or
+otherwise loses track) sends `{"command": "RESYNC"}` and the next frame is a
+keyframe. Keyframes are also sent on connect and every `KEYFRAME_INTERVAL`
+frames so a client never drifts for long.
+"""
+
+ENCODINGS = ("full", "delta")
+
+
+def diff_frames(previous: dict, current: dict) -> dict:
+    """Return the nested subset of `current` whose leaves differ from `previous`."""
+    changes = {}
+    for key, value in current.items():
+        old = previous.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            nested = diff_frames(old, value)
+            if nested:
+                changes[key] = nested
+        elif key not in previous or old != value:
+            changes[key] = value
+    return changes
+
+
+class DeltaEncoder:
+    """Per-connection state for the delta protocol: last frame sent and sequence."""
+
+    KEYFRAME_INTERVAL = 100
+
+    def __init__(self):
+        self.seq = -1
+        self._last: dict | None = None
+        self._frames_since_keyframe = 0
+
+    def request_keyframe(self):
+        """Make the next encoded frame a full keyframe (client resync)."""
+        self._last = None
+
+    def encode(self, frame: dict) -> dict:
+        self.seq += 1
+        if self._last is None or self._frames_since_keyframe >= self.KEYFRAME_INTERVAL:
+            self._last = frame
+            self._frames_since_keyframe = 1
+            return {"type": "keyframe", "seq": self.seq, "telemetry": frame}
+
+        changes = diff_frames(self._last, frame)
+        self._last = frame
+        self._frames_since_keyframe += 1
+        return {"type": "delta", "seq": self.seq, "changes": changes}
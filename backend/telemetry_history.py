@@ -0,0 +1,86 @@
+# backend/telemetry_history.py
+"""Recent telemetry for a session, kept in a fixed-size ring buffer.
+
+Each numeric field lives in its own preallocated NumPy array (float32 for
+readings, int32 for pressure, float64 POSIX seconds for timestamps), so a
+sample costs 28 bytes instead of a graph of pydantic models, and a session's
+history never grows past `capacity` samples: the oldest sample is overwritten.
+Status fields aren't kept; charts only need the numbers.
+"""
+from datetime import UTC, datetime
+
+import numpy as np
+
+from backend.simulator import RovSimulator
+
+# (field, dtype, decimals TelemetryMessage rounds it to; None for integers)
+FIELDS: tuple[tuple[str, type[np.generic], int | None], ...] = (
+    ("charge_percent", np.float32, 2),
+    ("power_level_percent", np.float32, 2),
+    ("hull_pressure_kpa", np.int32, None),
+    ("depth_meters", np.float32, 1),
+    ("water_temp_celsius", np.float32, 1),
+)
+
+
+class TelemetryHistory:
+    """The last `capacity` telemetry samples of one session, oldest overwritten first."""
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._timestamps = np.zeros(capacity, dtype=np.float64)
+        self._columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype, _ in FIELDS}
+        self._next = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the sample arrays; fixed at construction."""
+        return self._timestamps.nbytes + sum(column.nbytes for column in self._columns.values())
+
+    def record(self, sim: RovSimulator):
+        """Append the simulator's current readings (called once per tick)."""
+        i = self._next
+        state = sim.state
+        columns = self._columns
+        self._timestamps[i] = sim.clock().timestamp()
+        columns["charge_percent"][i] = state.charge_percent
+        columns["power_level_percent"][i] = state.power_level_percent
+        columns["hull_pressure_kpa"][i] = state.hull_pressure_kpa
+        columns["depth_meters"][i] = state.depth_meters
+        columns["water_temp_celsius"][i] = state.water_temp_celsius
+        self._next = (i + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def window(self, seconds: float) -> dict:
+        """Samples from the last `seconds` of simulated time, oldest first.
+
+        The window ends at the newest sample, so it is measured on the
+        session's own clock. Series are columnar (one list per field), rounded
+        as in the live telemetry frames.
+        """
+        order = np.arange(self._count)
+        if self._count == self.capacity:
+            order = (order + self._next) % self.capacity
+        timestamps = self._timestamps[order]
+        if len(timestamps):
+            start = np.searchsorted(timestamps, timestamps[-1] - seconds, side="right")
+            order, timestamps = order[start:], timestamps[start:]
+
+        series = {}
+        for name, _, decimals in FIELDS:
+            values = self._columns[name][order]
+            if decimals is not None:
+                values = np.round(values.astype(np.float64), decimals)
+            series[name] = values.tolist()
+        return {
+            "capacity": self.capacity,
+            "memory_bytes": self.nbytes,
+            "timestamps": [datetime.fromtimestamp(t, UTC) for t in timestamps.tolist()],
+            "series": series,
+        }
@@ -0,0 +1,85 @@
+# backend/telemetry_json.py
+"""Fast-path telemetry serialization for the per-tick WebSocket frame.
+
+Building a `TelemetryMessage` every tick re-runs pydantic validation only to
+dump it straight back to a dict, which `send_json` then encodes again. These
+functions read the simulator's live `SimState` directly and produce the frame
+without any validation: `telemetry_json` renders the JSON text from a fixed
+template, and `telemetry_dict` returns the equivalent plain dict for callers
+that need to post-process it (e.g. delta encoding).
+
+`TelemetryMessage` stays the schema of record: the rounding its validators
+declare (2 dp for percentages, 1 dp for environment readings, whole kPa) is
+applied here once per frame, so every frame validates against the model and
+round-trips through it unchanged. Field order and value formatting match
+`json.dumps(..., separators=(",", ":"))` of the equivalent dict.
+"""
+import json
+
+from backend.sim_state import SimState
+
+
+def telemetry_dict(timestamp: str, tick_rate: float, state: SimState) -> dict:
+    return {
+        "timestamp": timestamp,
+        "tick_rate": tick_rate,
+        "rov_state": {
+            "power": {
+                "charge_percent": round(state.charge_percent, 2),
+                "status": state.power_status,
+            },
+            "propulsion": {
+                "power_level_percent": round(state.power_level_percent, 2),
+                "status": state.propulsion_status,
+            },
+            "hull_integrity": {
+                "hull_pressure_kpa": int(state.hull_pressure_kpa),
+                "status": state.hull_status,
+            },
+            "manipulator_arm": {
+                "status": state.arm_status,
+                "sample_collected": state.sample_collected,
+            },
+            "science_package": {"status": state.package_status},
+            "environment": {
+                "depth_meters": round(state.depth_meters, 1),
+                "water_temp_celsius": round(state.water_temp_celsius, 1),
+            },
+        },
+        "mission_state": {"status": state.mission_status},
+        "alert": {
+            "active": state.alert_active,
+            "severity": state.alert_severity,
+            "message": state.alert_message,
+        },
+    }
+
+
+def telemetry_json(timestamp: str, tick_rate: float, state: SimState) -> str:
+    # Status and severity fields are fixed Literal values and the timestamp is
+    # an ISO string, so none of them need escaping; only the free-text alert
+    # message goes through json.dumps.
+    severity = "null" if state.alert_severity is None else f'"{state.alert_severity}"'
+    message = (
+        "null"
+        if state.alert_message is None
+        else json.dumps(state.alert_message, ensure_ascii=False)
+    )
+    return (
+        f'{{"timestamp":"{timestamp}","tick_rate":{tick_rate!r},'
+        f'"rov_state":{{'
+        f'"power":{{"charge_percent":{round(state.charge_percent, 2)!r},'
+        f'"status":"{state.power_status}"}},'
+        f'"propulsion":{{"power_level_percent":{round(state.power_level_percent, 2)!r},'
+        f'"status":"{state.propulsion_status}"}},'
+        f'"hull_integrity":{{"hull_pressure_kpa":{int(state.hull_pressure_kpa)},'
+        f'"status":"{state.hull_status}"}},'
+        f'"manipulator_arm":{{"status":"{state.arm_status}",'
+        f'"sample_collected":{"true" if state.sample_collected else "false"}}},'
+        f'"science_package":{{"status":"{state.package_status}"}},'
+        f'"environment":{{"depth_meters":{round(state.depth_meters, 1)!r},'
+        f'"water_temp_celsius":{round(state.water_temp_celsius, 1)!r}}}}},'
+        f'"mission_state":{{"status":"{state.mission_status}"}},'
+        f'"alert":{{"active":{"true" if state.alert_active else "false"},'
+        f'"severity":{severity},"message":{message}}}}}'
+    )
@@ -5,6 +5,8 @@ import os
 # constructed at import time, switching the engine to NullPool so connections
 # are never reused across the per-test event loops TestClient creates.
 os.environ.setdefault("TESTING", "1")
+# Bind the gRPC server to a free port so tests don't clash with a dev server.
+os.environ.setdefault("GRPC_PORT", "0")
 
 import asyncio  # noqa: E402
 
@@ -43,7 +45,7 @@ def fast_mode():
 
 @pytest.fixture(autouse=True)
 def _clean_event_log():
-    """Ensure each test starts with an empty event_log table."""
+    """Ensure each test starts with empty event_log, mission and telemetry tables."""
     asyncio.run(_truncate_event_log())
     yield
 
@@ -54,6 +56,6 @@ async def _truncate_event_log():
     engine = create_async_engine(settings.database_url, poolclass=NullPool)
     try:
         async with engine.begin() as conn:
-            await conn.execute(text("TRUNCATE TABLE event_log"))
+            await conn.execute(text("TRUNCATE TABLE event_log, mission, telemetry_sample"))
     finally:
         await engine.dispose()
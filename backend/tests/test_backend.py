@@ -1,9 +1,12 @@
 # backend/tests/test_backend.py
+import asyncio
+import json
 import time
 
 import pytest
 from fastapi import WebSocketDisconnect
 
+from backend.headless import attentive_operator, passive_operator, run_mission
 from backend.simulation_manager import SimulationManager
 
 # ---------- Helpers ----------
@@ -61,9 +64,39 @@ def test_hello(client):
 
 
 def test_mission_log_empty_start(client):
-    resp = client.get("/mission-log")
-    assert resp.status_code == 200
-    assert resp.json() == []
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        session_id = _only_session(client).session_id
+        resp = client.get(f"/api/v1/sessions/{session_id}/mission-log")
+        assert resp.status_code == 200
+        assert resp.json() == []
+
+
+def test_mission_log_unknown_session(client):
+    resp = client.get("/api/v1/sessions/not-a-session/mission-log")
+    assert resp.status_code == 404
+
+
+def test_mission_log_since_returns_only_new_entries(client):
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        session_id = _only_session(client).session_id
+        url = f"/api/v1/sessions/{session_id}/mission-log"
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        _recv_until(ws, lambda d: d["mission_state"]["status"] == "en_route")
+
+        first = client.get(url).json()
+        assert [e["seq"] for e in first] == list(range(1, len(first) + 1))
+        assert client.get(url, params={"since": first[-1]["seq"]}).json() == []
+        assert client.get(url, params={"since": 1}).json() == first[1:]
+
+        # Restarting resets the mission log, but seq keeps increasing, so a
+        # client polling with `since` never misses or repeats an entry.
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "power_fault"}})
+        _recv_n(ws, 3)
+        newer = client.get(url, params={"since": first[-1]["seq"]}).json()
+        assert newer[0]["seq"] == first[-1]["seq"] + 1
+        assert newer[0]["message"] == "Scenario Started: Power Fault."
 
 
 def test_mission_log_after_command(client):
@@ -81,181 +114,114 @@ def test_mission_log_after_command(client):
     assert any("Mission status changed to 'en_route'" in log.message for log in logs)
 
 
-# ---------- WEBSOCKET TESTS ----------
-
-
-def test_nominal_mission_success(client):
-    with client.websocket_connect("/ws/telemetry") as ws:
-        ws.receive_json()
-        ws.send_json(
-            {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
-        )
-        _recv_until(ws, lambda d: d["mission_state"]["status"] == "searching")
+# ---------- SCENARIO TESTS ----------
+# Scenario progression runs headless on a virtual clock (backend/headless.py):
+# the same ticks a session would run, without waiting on real time. The
+# WebSocket tests below only cover the transport.
 
-        ws.send_json({"command": "DEPLOY_ARM"})
-        ws.send_json({"command": "COLLECT_SAMPLE"})
+ALL_STOP = {"command": "SET_PROPULSION_STATE", "payload": {"status": "inactive"}}
 
-        # First confirm it enters returning phase
-        returning = _recv_until(
-            ws,
-            lambda d: d["mission_state"]["status"] == "returning",
-            max_steps=1000,
-        )
-        assert returning["mission_state"]["status"] == "returning"
 
-        # Now wait longer for ascent to complete
-        result = _recv_until(
-            ws,
-            lambda d: d["mission_state"]["status"] == "mission_success",
-            max_steps=5000,  # increased from 1000
-        )
-        assert result["mission_state"]["status"] == "mission_success"
+def _statuses(run):
+    """The mission statuses a recorded run went through, in order."""
+    statuses = [frame["mission_state"]["status"] for frame in run.frames]
+    return [s for i, s in enumerate(statuses) if i == 0 or s != statuses[i - 1]]
 
 
-def test_pressure_anomaly_failure_path(client):
-    with client.websocket_connect("/ws/telemetry") as ws:
-        ws.receive_json()
-        ws.send_json(
-            {"command": "START_SIMULATION", "payload": {"scenario": "pressure_anomaly"}}
-        )
+def test_nominal_mission_success():
+    run = run_mission("nominal", attentive_operator, record=True)
+    assert run.final_status == "mission_success"
+    path = _statuses(run)
+    assert path.index("searching") < path.index("returning") < path.index("mission_success")
 
-        result = _recv_until(
-            ws,
-            lambda d: d["mission_state"]["status"] == "mission_failure_hull_breach",
-            max_steps=1500,
-        )
-        assert result["mission_state"]["status"] == "mission_failure_hull_breach"
 
+def test_pressure_anomaly_failure_path():
+    run = run_mission("pressure_anomaly", passive_operator)
+    assert run.final_status == "mission_failure_hull_breach"
 
-def test_power_fault_failure_path(client):
-    with client.websocket_connect("/ws/telemetry") as ws:
-        ws.receive_json()
-        ws.send_json(
-            {"command": "START_SIMULATION", "payload": {"scenario": "power_fault"}}
-        )
 
-        result = _recv_until(
-            ws,
-            lambda d: d["mission_state"]["status"] == "mission_failure_lost_signal",
-            max_steps=3000,
-        )
-        assert result["mission_state"]["status"] == "mission_failure_lost_signal"
+def test_power_fault_failure_path():
+    run = run_mission("power_fault", passive_operator)
+    assert run.final_status == "mission_failure_lost_signal"
 
 
-def test_pressure_anomaly_success_path_all_stop_no_snap_no_escalation(client):
+def test_pressure_anomaly_success_path_all_stop_no_snap_no_escalation():
     """
     Operator intervenes with All-Stop after WARNING.
     - Hull returns to nominal and alert clears
     - Depth does NOT 'snap' downward
     - Scenario no longer escalates to CRITICAL / failure
     """
-    with client.websocket_connect("/ws/telemetry") as ws:
-        ws.receive_json()
-        ws.send_json(
-            {"command": "START_SIMULATION", "payload": {"scenario": "pressure_anomaly"}}
-        )
 
-        # Wait until warning triggers and capture depth at that moment
-        at_warning = _recv_until(
-            ws, lambda d: d["alert"]["severity"] == "WARNING", max_steps=500
-        )
-        depth_at_warning = at_warning["rov_state"]["environment"]["depth_meters"]
+    def all_stop_on_warning(tick, sim):
+        warned = sim.state.alert_severity == "WARNING"
+        return [ALL_STOP] if warned and sim.state.propulsion_status == "active" else []
 
-        # Operator sends All Stop
-        ws.send_json(
-            {"command": "SET_PROPULSION_STATE", "payload": {"status": "inactive"}}
-        )
+    run = run_mission("pressure_anomaly", all_stop_on_warning, max_ticks=1500, record=True)
+    frames = run.frames
+    warned = next(i for i, d in enumerate(frames) if d["alert"]["severity"] == "WARNING")
+    depth_at_warning = frames[warned]["rov_state"]["environment"]["depth_meters"]
 
-        # Expect hull back to nominal and alert cleared (no depth snap)
-        nominal = _recv_until(
-            ws, lambda d: d["rov_state"]["hull_integrity"]["status"] == "nominal"
-        )
-        depth_after = nominal["rov_state"]["environment"]["depth_meters"]
-        assert nominal["alert"]["active"] is False
-        assert nominal["rov_state"]["propulsion"]["status"] == "inactive"
+    # Expect hull back to nominal and alert cleared (no depth snap)
+    nominal = next(
+        d for d in frames[warned:] if d["rov_state"]["hull_integrity"]["status"] == "nominal"
+    )
+    assert nominal["alert"]["active"] is False
+    assert nominal["rov_state"]["propulsion"]["status"] == "inactive"
+    # No snap downwards (allow tiny float noise)
+    assert nominal["rov_state"]["environment"]["depth_meters"] + 1e-6 >= depth_at_warning
 
-        # No snap downwards (allow tiny float noise)
-        assert depth_after + 1e-6 >= depth_at_warning
+    # No further escalation for the rest of the run
+    assert len(frames) - warned > 200
+    for frame in frames[warned:]:
+        assert frame["rov_state"]["hull_integrity"]["status"] != "critical"
+        assert frame["mission_state"]["status"] != "mission_failure_hull_breach"
 
-        # No further escalation despite continuing ticks
-        for _ in range(200):
-            frame = ws.receive_json()
-            assert frame["rov_state"]["hull_integrity"]["status"] != "critical"
-            assert frame["mission_state"]["status"] != "mission_failure_hull_breach"
 
-
-def test_nominal_operator_override_respected_during_descent(client):
+def test_nominal_operator_override_respected_during_descent():
     """
     If an operator sends All-Stop during nominal descent,
     scenario logic must NOT force propulsion back on.
     """
-    with client.websocket_connect("/ws/telemetry") as ws:
-        ws.receive_json()
-        ws.send_json(
-            {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
-        )
 
-        # Ensure we're actually descending
-        start = _recv_until(ws, lambda d: d["mission_state"]["status"] == "en_route")
-        d0 = start["rov_state"]["environment"]["depth_meters"]
+    def all_stop_once_descending(tick, sim):
+        descending = sim.state.mission_status == "en_route" and sim.state.depth_meters > 0
+        return [ALL_STOP] if descending and not sim.operator_override else []
 
-        # Operator hits all-stop
-        ws.send_json(
-            {"command": "SET_PROPULSION_STATE", "payload": {"status": "inactive"}}
-        )
+    run = run_mission("nominal", all_stop_once_descending, max_ticks=400, record=True)
+    stopped = next(
+        i for i, d in enumerate(run.frames) if d["rov_state"]["propulsion"]["status"] == "inactive"
+    )
+    d0 = run.frames[stopped]["rov_state"]["environment"]["depth_meters"]
 
-        # After many ticks, propulsion should remain inactive and depth should not increase
-        after = _recv_n(ws, 200)
-        d1 = after["rov_state"]["environment"]["depth_meters"]
-        assert after["rov_state"]["propulsion"]["status"] == "inactive"
+    # After many ticks, propulsion should remain inactive and depth should not increase
+    assert len(run.frames) - stopped > 200
+    for frame in run.frames[stopped:]:
+        assert frame["rov_state"]["propulsion"]["status"] == "inactive"
         # No further descent (allow tiny epsilon for float rounding)
-        assert d1 <= d0 + 1e-6
-        # Mission stays en_route (won't reach target depth)
-        assert after["mission_state"]["status"] == "en_route"
-
-
-def test_power_fault_success_path_jettison(client):
-    with client.websocket_connect("/ws/telemetry") as ws:
-        ws.receive_json()
-        ws.send_json(
-            {"command": "START_SIMULATION", "payload": {"scenario": "power_fault"}}
-        )
+        assert frame["rov_state"]["environment"]["depth_meters"] <= d0 + 1e-6
+    # Mission stays en_route (won't reach target depth)
+    assert run.final_status == "en_route"
 
-        _recv_until(ws, lambda d: d["alert"]["severity"] == "CRITICAL", max_steps=500)
-        ws.send_json({"command": "JETTISON_PACKAGE"})
 
-        result = _recv_until(
-            ws, lambda d: d["mission_state"]["status"] == "emergency_ascent"
-        )
-        assert result["mission_state"]["status"] == "emergency_ascent"
-        # Alert should be cleared by jettison according to updated sim
-        assert result["alert"]["active"] is False
-
-        final = _recv_until(
-            ws,
-            lambda d: d["mission_state"]["status"] == "mission_success",
-            max_steps=1500,
-        )
-        assert final["mission_state"]["status"] == "mission_success"
+def test_power_fault_success_path_jettison():
+    run = run_mission("power_fault", attentive_operator, record=True)
+    ascent = next(d for d in run.frames if d["mission_state"]["status"] == "emergency_ascent")
+    # Alert should be cleared by jettison according to updated sim
+    assert ascent["alert"]["active"] is False
+    assert run.final_status == "mission_success"
 
 
-def test_nominal_mission_alert_and_log_entries(client):
-    with client.websocket_connect("/ws/telemetry") as ws:
-        ws.receive_json()
-        ws.send_json(
-            {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
-        )
+def test_nominal_mission_alert_and_log_entries():
+    run = run_mission("nominal", attentive_operator, record=True)
+    info = next(d for d in run.frames if d["alert"]["severity"] == "INFO")
+    assert info["alert"]["message"].startswith("Bioluminescent signature")
 
-        telemetry = _recv_until(
-            ws, lambda d: d["alert"]["severity"] == "INFO", max_steps=1000
-        )
-        assert telemetry["alert"]["message"].startswith("Bioluminescent signature")
+    assert any("Scenario Started" in log.message for log in run.mission_log)
+    assert any("Bioluminescent signature detected" in log.message for log in run.mission_log)
 
-        sim = _only_session_simulator(client)
 
-    logs = sim.get_mission_log()
-    assert any("Scenario Started" in log.message for log in logs)
-    assert any("Bioluminescent signature detected" in log.message for log in logs)
+# ---------- WEBSOCKET TESTS ----------
 
 
 def test_invalid_command_is_logged(client):
@@ -292,9 +258,10 @@ def test_each_connection_gets_an_isolated_simulator(client):
 
         # ws2 never received START_SIMULATION -- must remain in standby,
         # at depth 0, completely unaffected by ws1's progress.
-        t2 = ws2.receive_json()
-        assert t2["mission_state"]["status"] == "standby"
-        assert t2["rov_state"]["environment"]["depth_meters"] == 0
+        sessions = client.app.state.sim_manager._sessions.values()
+        sim2 = next(s.simulator for s in sessions if s.scenario is None)
+        assert sim2.mission_state.status == "standby"
+        assert sim2.rov_state.environment.depth_meters == 0
 
     # Both sessions cleaned up on disconnect
     assert client.app.state.sim_manager.active_session_count == 0
@@ -329,24 +296,63 @@ def test_two_concurrent_sessions_each_tick_at_one_x_speed(client):
             prev_depth = depth
 
 
-def test_session_task_cancelled_on_disconnect(client):
-    with client.websocket_connect("/ws/telemetry") as ws:
-        ws.receive_json()
-        session = next(iter(client.app.state.sim_manager._sessions.values()))
-        task = session.task
+def test_single_scheduler_drives_all_sessions_and_stops_when_idle(client):
+    sim_manager = client.app.state.sim_manager
+    with client.websocket_connect("/ws/telemetry") as ws1, client.websocket_connect(
+        "/ws/telemetry"
+    ) as ws2:
+        ws1.receive_json()
+        ws2.receive_json()
+        task = sim_manager._tick_task
+        assert task is not None and not task.done()
 
-    # task.cancel() only requests cancellation; give the event loop a moment
-    # to actually process it.
+    # The scheduler is cancelled once the last session goes away; give the
+    # event loop a moment to actually process the cancellation.
     for _ in range(50):
         if task.done():
             break
         time.sleep(0.01)
 
-    # _run_loop catches CancelledError to exit gracefully, so the task
-    # finishes normally (done=True, cancelled=False) rather than ending
-    # in the "cancelled" state -- that's the correct, clean shutdown.
+    # _tick_loop catches CancelledError to exit gracefully, so the task
+    # finishes normally rather than ending in the "cancelled" state.
     assert task.done()
     assert task.exception() is None
+    assert sim_manager._tick_task is None
+
+
+def test_slow_client_does_not_stall_other_sessions(client):
+    """A session whose client can't keep up keeps simulating at full rate; its
+    unsent telemetry is conflated and the other sessions are unaffected."""
+    with client.websocket_connect("/ws/telemetry") as fast, client.websocket_connect(
+        "/ws/telemetry"
+    ) as slow:
+        fast.receive_json()
+        slow.receive_json()
+        slow.send_json(
+            {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+        )
+        _recv_until(slow, lambda d: d["mission_state"]["status"] == "en_route")
+        sessions = client.app.state.sim_manager._sessions.values()
+        slow_session = next(s for s in sessions if s.simulator.active_scenario is not None)
+        fast.send_json(
+            {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+        )
+        _recv_until(fast, lambda d: d["mission_state"]["status"] == "en_route")
+        stalled = asyncio.Event()  # never set: the "slow" send hangs forever
+
+        async def hang(frame):
+            await stalled.wait()
+
+        slow_session.ws.send_text = hang
+        before = len(slow_session.history)
+        _recv_n(fast, 20)
+        assert len(slow_session.history) >= before + 15
+
+        stats = {s["session_id"]: s for s in client.get("/api/v1/sessions").json()}
+        slow_stats = stats[slow_session.session_id]
+        assert slow_stats["conflated_frames"] > 0
+        assert slow_stats["pending_frames"] == 1
+        assert slow_stats["dropped_frames"] == 0
 
 
 def test_server_rejects_connections_beyond_max_sessions(client, monkeypatch):
@@ -359,3 +365,284 @@ def test_server_rejects_connections_beyond_max_sessions(client, monkeypatch):
         with pytest.raises(WebSocketDisconnect):
             with client.websocket_connect("/ws/telemetry") as ws2:
                 ws2.receive_json()
+
+
+# ---------- SPECTATOR TESTS ----------
+
+
+def _only_session(client):
+    sessions = list(client.app.state.sim_manager._sessions.values())
+    assert len(sessions) == 1
+    return sessions[0]
+
+
+def test_spectator_follows_operator_session_read_only(client):
+    with client.websocket_connect("/ws/telemetry") as operator:
+        operator.receive_json()
+        session_id = client.get("/api/v1/sessions").json()[0]["session_id"]
+
+        with client.websocket_connect(f"/ws/telemetry/{session_id}/spectate") as spectator:
+            spectator.receive_json()
+            # Spectators don't occupy a session slot.
+            assert client.app.state.sim_manager.active_session_count == 1
+            assert client.get("/api/v1/sessions").json()[0]["spectator_count"] == 1
+
+            # Commands from a spectator are ignored...
+            spectator.send_json(
+                {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+            )
+            time.sleep(0.05)  # ten passes at the fast_mode tick rate
+            assert _only_session(client).simulator.mission_state.status == "standby"
+
+            # ...but it sees what the operator does.
+            operator.send_json(
+                {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+            )
+            frame = _recv_until(spectator, lambda d: d["mission_state"]["status"] == "en_route")
+            assert frame["rov_state"]["environment"]["depth_meters"] > 0
+
+
+def test_spectate_unknown_session_is_rejected(client):
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/ws/telemetry/not-a-session/spectate") as ws:
+            ws.receive_json()
+
+
+def test_spectators_are_disconnected_when_session_ends(client):
+    with client.websocket_connect("/ws/telemetry") as operator:
+        operator.receive_json()
+        session_id = _only_session(client).session_id
+        spectator_cm = client.websocket_connect(f"/ws/telemetry/{session_id}/spectate")
+        spectator = spectator_cm.__enter__()
+        spectator.receive_json()
+
+    with pytest.raises(WebSocketDisconnect):
+        _recv_n(spectator, 1000)
+    spectator_cm.__exit__(None, None, None)
+
+
+def test_slow_spectator_does_not_stall_other_viewers(client):
+    with client.websocket_connect("/ws/telemetry") as operator:
+        operator.receive_json()
+        # A running mission, so frames keep coming rather than keepalives.
+        operator.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        _recv_until(operator, lambda d: d["mission_state"]["status"] == "en_route")
+        session = _only_session(client)
+        spectate_url = f"/ws/telemetry/{session.session_id}/spectate"
+        with client.websocket_connect(spectate_url) as slow:
+            slow.receive_json()
+            (stuck,) = session.spectators
+            stalled = asyncio.Event()  # never set: the "slow" send hangs forever
+
+            async def hang(frame):
+                await stalled.wait()
+
+            stuck.ws.send_text = hang
+
+            with client.websocket_connect(spectate_url) as fast:
+                # The healthy viewer and the operator keep receiving on schedule.
+                _recv_n(fast, 20)
+                _recv_n(operator, 20)
+            assert stuck.conflated_frames > 0
+
+
+# ---------- RESUME TESTS ----------
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_dropped_session_resumes_where_it_left_off(client):
+    manager = client.app.state.sim_manager
+    with client.websocket_connect("/ws/telemetry?resumable=true") as ws:
+        hello = ws.receive_json()
+        assert hello["type"] == "session" and hello["resumed"] is False
+        session_id = hello["session_id"]
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        before = _recv_until(ws, lambda d: d["rov_state"]["environment"]["depth_meters"] > 100)
+        last_seq = client.get(f"/api/v1/sessions/{session_id}/mission-log").json()[-1]["seq"]
+    _wait_for(lambda: len(manager.parked) == 1)
+
+    with client.websocket_connect(f"/ws/telemetry?resume_token={hello['resume_token']}") as ws:
+        again = ws.receive_json()
+        assert again["type"] == "session" and again["resumed"] is True
+        assert again["session_id"] == session_id
+        assert again["resume_token"] != hello["resume_token"]
+        frame = ws.receive_json()
+        assert frame["mission_state"]["status"] == before["mission_state"]["status"]
+        depth = frame["rov_state"]["environment"]["depth_meters"]
+        assert depth >= before["rov_state"]["environment"]["depth_meters"]
+
+        # The log cursor carried over: new entries continue the seqs.
+        ws.send_json({"command": "FOO_BAR"})
+        _recv_n(ws, 3)
+        log = client.get(f"/api/v1/sessions/{session_id}/mission-log").json()
+        assert log[-1]["seq"] == last_seq + 1
+        assert len(manager.parked) == 0 and manager.resumed_sessions == 1
+
+    # A token works once.
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/ws/telemetry?resume_token={hello['resume_token']}") as ws:
+            ws.receive_json()
+    assert exc.value.code == 1008
+
+
+def test_sessions_are_parked_only_when_resumable(client, monkeypatch):
+    manager = client.app.state.sim_manager
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+    _wait_for(lambda: manager.active_session_count == 0)
+    assert len(manager.parked) == 0
+
+    # Parked sessions expire after the grace period.
+    monkeypatch.setattr(manager.parked, "grace_seconds", 0.0)
+    with client.websocket_connect("/ws/telemetry?resumable=true") as ws:
+        token = ws.receive_json()["resume_token"]
+    _wait_for(lambda: manager.active_session_count == 0)
+    assert len(manager.parked) == 1
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect(f"/ws/telemetry?resume_token={token}") as ws:
+            ws.receive_json()
+
+
+# ---------- ADAPTIVE TICK RATE TESTS ----------
+
+
+class _RecordingSocket:
+    def __init__(self):
+        self.frames: list[dict] = []
+
+    async def send_text(self, text: str):
+        self.frames.append(json.loads(text))
+
+    async def close(self, code: int = 1000, reason: str | None = None):
+        pass
+
+
+def _run_passes(manager, passes):
+    """Advance every session `passes` times by hand, like the scheduler would."""
+
+    async def run():
+        for _ in range(passes):
+            manager._tick_count += 1
+            for session in list(manager._sessions.values()):
+                manager._advance(session)
+            await asyncio.sleep(0)  # let the senders write the frames
+
+    return run()
+
+
+def _overload(manager, level):
+    while manager.slowdown_level < level:
+        manager._adapt(1.0)
+
+
+def test_overload_slows_spectators_but_not_operators():
+    async def run():
+        manager = SimulationManager()
+        busy_ws, viewer_ws = _RecordingSocket(), _RecordingSocket()
+        busy = await manager.create_session(busy_ws)
+        manager._tick_task.cancel()  # passes are driven by hand below
+        manager._tick_task = None
+        await busy.submit_command(
+            {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+        )
+        manager.add_spectator(busy.session_id, viewer_ws)
+        await _run_passes(manager, 1)
+        for ws in (busy_ws, viewer_ws):
+            ws.frames.clear()
+
+        _overload(manager, 2)
+        await _run_passes(manager, 8)
+        await manager.shutdown()
+        return busy_ws.frames, viewer_ws.frames
+
+    busy, viewer = asyncio.run(run())
+    full_rate = 200.0  # the fast_mode fixture's TICKS_PER_SECOND
+    assert len(busy) == 8
+    assert {frame["tick_rate"] for frame in busy} == {full_rate}
+    # Level 2: spectators get every fourth pass.
+    assert len(viewer) == 2
+    assert {frame["tick_rate"] for frame in viewer} == {full_rate / 4}
+
+
+def test_idle_session_hibernates_and_only_sends_keepalives(monkeypatch):
+    monkeypatch.setattr(SimulationManager, "KEEPALIVE_SECONDS", 0.05)  # 10 passes
+
+    async def run():
+        manager = SimulationManager()
+        ws, viewer_ws = _RecordingSocket(), _RecordingSocket()
+        session = await manager.create_session(ws)
+        manager._tick_task.cancel()
+        manager._tick_task = None
+        await _run_passes(manager, 1)
+        first = list(ws.frames)
+        manager.add_spectator(session.session_id, viewer_ws)
+        await asyncio.sleep(0)
+        joined = list(viewer_ws.frames)
+
+        await _run_passes(manager, 20)
+        await manager.shutdown()
+        return session, first, joined, ws.frames[1:], viewer_ws.frames[1:]
+
+    session, first, joined, keepalives, viewer = asyncio.run(run())
+    # The tick that leaves the session idle is sent, announcing the keepalive rate.
+    (frame,) = first
+    assert frame["mission_state"]["status"] == "standby"
+    assert frame["tick_rate"] == 20.0
+    # A new viewer gets the current state straight away.
+    assert len(joined) == 1
+    assert len(keepalives) == 2 and len(viewer) == 2
+    assert [k["rov_state"] for k in keepalives] == [frame["rov_state"]] * 2
+    assert session.hibernating
+    assert len(session.history) == 1  # not ticked since
+
+
+def test_hibernating_session_wakes_as_soon_as_a_command_arrives():
+    async def run():
+        manager = SimulationManager()
+        ws = _RecordingSocket()
+        session = await manager.create_session(ws)
+        manager._tick_task.cancel()
+        manager._tick_task = None
+        await _run_passes(manager, 8)
+        assert session.hibernating
+        ws.frames.clear()
+
+        await session.submit_command(
+            {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+        )
+        await _run_passes(manager, 1)
+        assert not session.hibernating
+        await manager.shutdown()
+        return ws.frames
+
+    (frame,) = asyncio.run(run())
+    assert frame["mission_state"]["status"] == "en_route"
+    assert frame["tick_rate"] == 200.0
+
+
+def test_slowdown_level_steps_with_hysteresis():
+    manager = SimulationManager()
+    manager._adapt(1.0)
+    while manager.tick_load < SimulationManager.OVERLOAD_RATIO:
+        manager._adapt(1.0)
+    assert manager.slowdown_level == 1
+    # Held for SLOWDOWN_HOLD_SECONDS worth of passes however loaded they are.
+    for _ in range(round(SimulationManager.SLOWDOWN_HOLD_SECONDS * 200)):
+        manager._adapt(1.0)
+        assert manager.slowdown_level == 1
+    manager._adapt(1.0)
+    assert manager.slowdown_level == 2
+
+    # Load between the two ratios keeps the level where it is.
+    for _ in range(2000):
+        manager._adapt(0.6)
+    assert manager.slowdown_level == 2
+    for _ in range(2000):
+        manager._adapt(0.1)
+    assert manager.slowdown_level == 0
@@ -0,0 +1,117 @@
+# backend/tests/test_grpc.py
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime
+
+import grpc
+import pytest
+
+from backend.grpc_gen import mission_log_pb2, mission_log_pb2_grpc
+from backend.logs import LogEntry, LogLevel
+from backend.mission_log_hub import MissionLogHub, SubscriberOverflowError
+
+from .test_backend import _only_session
+from .test_persistence import _seed_mission
+
+# ---------- Helpers ----------
+
+
+@pytest.fixture
+def stub(client):
+    with grpc.insecure_channel(f"localhost:{client.app.state.grpc_port}") as channel:
+        yield mission_log_pb2_grpc.MissionLogServiceStub(channel)
+
+
+def _wait_for_subscribers(client, count, timeout=2.0):
+    hub = client.app.state.sim_manager.log_hub
+    deadline = time.monotonic() + timeout
+    while hub.subscriber_count < count:
+        assert time.monotonic() < deadline, "stream never subscribed"
+        time.sleep(0.01)
+
+
+def _entry(message: str) -> LogEntry:
+    return LogEntry(timestamp=datetime.now(UTC), level=LogLevel.INFO, message=message)
+
+
+# ---------- Hub ----------
+
+
+def test_hub_fans_out_to_mission_and_global_subscribers():
+    async def _run():
+        hub = MissionLogHub()
+        mission_a, mission_b = uuid.uuid4(), uuid.uuid4()
+        only_a = hub.subscribe(mission_a)
+        everything = hub.subscribe()
+        hub.publish(mission_a, [_entry("a1"), _entry("a2")])
+        hub.publish(mission_b, [_entry("b1")])
+
+        received_a = [await anext(aiter(only_a)) for _ in range(2)]
+        received_all = [await anext(aiter(everything)) for _ in range(3)]
+        only_a.close()
+        everything.close()
+        return mission_a, mission_b, received_a, received_all, hub.subscriber_count
+
+    mission_a, mission_b, received_a, received_all, remaining = asyncio.run(_run())
+    assert [(m, e.message) for m, e in received_a] == [(mission_a, "a1"), (mission_a, "a2")]
+    assert [e.message for _, e in received_all] == ["a1", "a2", "b1"]
+    assert remaining == 0
+
+
+def test_hub_drops_subscriber_that_falls_behind():
+    async def _run():
+        hub = MissionLogHub()
+        slow = hub.subscribe(max_pending=3)
+        hub.publish(uuid.uuid4(), [_entry(str(i)) for i in range(10)])
+        received = []
+        with pytest.raises(SubscriberOverflowError):
+            async for _, entry in slow:
+                received.append(entry.message)
+        return received, slow.overflowed, hub.subscriber_count
+
+    received, overflowed, remaining = asyncio.run(_run())
+    assert received == ["0", "1", "2"]
+    assert overflowed
+    assert remaining == 0
+
+
+# ---------- gRPC ----------
+
+
+def test_get_mission_log_returns_persisted_entries(client, stub):
+    mission_id = _seed_mission(3, start=datetime(2030, 1, 1, tzinfo=UTC), severity="CRITICAL")
+
+    response = stub.GetMissionLog(mission_log_pb2.GetMissionLogRequest(mission_id=str(mission_id)))
+    assert len(response.entries) == 4
+    assert all(e.level == mission_log_pb2.LogEntry.CRITICAL for e in response.entries)
+    assert all(e.mission_id == str(mission_id) for e in response.entries)
+    timestamps = [e.timestamp for e in response.entries]
+    assert timestamps == sorted(timestamps)
+
+
+def test_get_mission_log_rejects_invalid_mission_id(client, stub):
+    with pytest.raises(grpc.RpcError) as exc:
+        stub.GetMissionLog(mission_log_pb2.GetMissionLogRequest(mission_id="nope"))
+    assert exc.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+
+
+def test_stream_mission_log_pushes_live_entries(client, stub):
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        mission_id = str(_only_session(client).mission_id)
+        stream = stub.StreamMissionLog(
+            mission_log_pb2.StreamMissionLogRequest(mission_id=mission_id)
+        )
+        _wait_for_subscribers(client, 1)
+
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        first = next(stream)
+        second = next(stream)
+        stream.cancel()
+
+    assert first.mission_id == second.mission_id == mission_id
+    assert first.message == "Scenario Started: Nominal."
+    assert first.level == mission_log_pb2.LogEntry.INFO
+    assert second.timestamp >= first.timestamp
+    _wait_for_subscribers(client, 0)
@@ -0,0 +1,54 @@
+# backend/tests/test_headless.py
+from datetime import UTC, datetime, timedelta
+from itertools import pairwise
+
+import pytest
+
+from backend.clock import VirtualClock
+from backend.headless import attentive_operator, passive_operator, run_mission
+from backend.simulator import RovSimulator
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    ("scenario", "operator", "outcome"),
+    [
+        ("nominal", attentive_operator, "mission_success"),
+        ("pressure_anomaly", attentive_operator, "mission_success"),
+        ("pressure_anomaly", passive_operator, "mission_failure_hull_breach"),
+        ("power_fault", attentive_operator, "mission_success"),
+        ("power_fault", passive_operator, "mission_failure_lost_signal"),
+    ],
+)
+def test_headless_mission_outcomes(scenario, operator, outcome):
+    run = run_mission(scenario, operator, ticks_per_second=2, start=START)
+    assert run.final_status == outcome
+    # Simulated time is exactly one tick period per tick, however fast it ran.
+    assert run.ended_at - run.started_at == timedelta(seconds=run.ticks / 2)
+
+
+def test_unattended_nominal_mission_stops_at_max_ticks():
+    run = run_mission("nominal", passive_operator, max_ticks=300)
+    assert run.ticks == 300
+    assert run.final_status == "searching"
+
+
+def test_recorded_frames_and_log_use_simulated_time():
+    run = run_mission("power_fault", ticks_per_second=4, start=START, record=True)
+
+    assert len(run.frames) == run.ticks
+    stamps = [datetime.fromisoformat(frame["timestamp"]) for frame in run.frames]
+    assert stamps[0] == START + timedelta(seconds=0.25)
+    assert all(b - a == timedelta(seconds=0.25) for a, b in pairwise(stamps))
+    assert all(START <= entry.timestamp <= run.ended_at for entry in run.mission_log)
+
+
+def test_simulator_uses_injected_clock():
+    clock = VirtualClock(START)
+    sim = RovSimulator(clock=clock)
+    clock.advance(90)
+    sim.handle_command({"command": "FOO_BAR"})
+
+    assert sim.get_mission_log()[-1].timestamp == START + timedelta(seconds=90)
+    assert sim.get_telemetry().timestamp == (START + timedelta(seconds=90)).isoformat()
@@ -0,0 +1,111 @@
+# backend/tests/test_metrics.py
+import time
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from backend.metrics import Histogram, Metric, render, with_labels
+from backend.simulation_manager import SimulationManager
+
+# ---------- Helpers ----------
+
+
+def _samples(text: str) -> dict[str, float]:
+    """Parse exposition text into {'name{labels}': value}, skipping comments."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            key, _, value = line.rpartition(" ")
+            samples[key] = float(value)
+    return samples
+
+
+def _scrape(client) -> dict[str, float]:
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    return _samples(resp.text)
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met"
+        time.sleep(0.02)
+
+
+# ---------- Exposition ----------
+
+
+def test_histograms_render_cumulative_buckets_and_families_merge():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+    text = render(
+        [
+            Metric("demo_seconds", "histogram", "Demo.").add(histogram),
+            *with_labels([Metric("demo_total", "counter", "Demo.").add(2)], worker="0"),
+            Metric("demo_total", "counter", "Demo.").add(3, worker='say "hi"'),
+        ]
+    )
+
+    assert text.count("# TYPE demo_total counter") == 1
+    assert _samples(text) == {
+        'demo_seconds_bucket{le="0.1"}': 2,
+        'demo_seconds_bucket{le="1.0"}': 3,
+        'demo_seconds_bucket{le="+Inf"}': 4,
+        "demo_seconds_sum": 3.65,
+        "demo_seconds_count": 4,
+        'demo_total{worker="0"}': 2,
+        'demo_total{worker="say \\"hi\\""}': 3,
+    }
+
+
+# ---------- Endpoint ----------
+
+
+def test_metrics_report_tick_loop_sessions_and_rejections(client, monkeypatch):
+    monkeypatch.setattr(SimulationManager, "MAX_CONCURRENT_SESSIONS", 1)
+
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        for _ in range(20):
+            ws.receive_json()
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/ws/telemetry") as rejected:
+                rejected.receive_json()
+
+        metrics = _scrape(client)
+        assert metrics["odyssey_active_sessions"] == 1
+        assert metrics["odyssey_rejected_sessions_total"] == 1
+        assert metrics["odyssey_session_crashes_total"] == 0
+        assert metrics["odyssey_tick_seconds_count"] >= 20
+        assert metrics['odyssey_tick_seconds_bucket{le="+Inf"}'] == (
+            metrics["odyssey_tick_seconds_count"]
+        )
+        assert metrics["odyssey_send_seconds_count"] >= 20
+        assert "odyssey_command_queue_depth" in metrics
+        assert "odyssey_event_queue_depth" in metrics
+
+    assert _scrape(client)["odyssey_active_sessions"] == 0
+
+
+def test_crashed_session_is_counted_and_logged(client, caplog):
+    def broken_update():
+        raise RuntimeError("boom")
+
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        (session,) = client.app.state.sim_manager._sessions.values()
+        session.simulator.update = broken_update
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        # The client is told, and the session no longer holds a slot.
+        with pytest.raises(WebSocketDisconnect) as exc:
+            while True:
+                ws.receive_json()
+        assert exc.value.code == 1011
+
+        metrics = _scrape(client)
+        assert metrics["odyssey_session_crashes_total"] == 1
+        assert metrics["odyssey_active_sessions"] == 0
+    assert "crashed" in caplog.text
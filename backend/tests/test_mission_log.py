@@ -0,0 +1,91 @@
+# backend/tests/test_mission_log.py
+import gc
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from backend import mission_log
+from backend.config import settings
+from backend.logs import LogEntry, LogLevel
+from backend.mission_log import MissionLog
+from backend.simulator import RovSimulator
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def spill_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "mission_log_dir", str(tmp_path))
+    return tmp_path
+
+
+def _entries(count: int) -> list[LogEntry]:
+    levels = list(LogLevel)
+    return [
+        LogEntry(
+            timestamp=START + timedelta(seconds=i, microseconds=123_457 * i),
+            level=levels[i % len(levels)],
+            message=f"entry {i}",
+            seq=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+def test_spilled_entries_are_read_back_in_order(spill_dir):
+    log = MissionLog(capacity=3)
+    entries = _entries(10)
+    for entry in entries:
+        log.append(entry)
+
+    assert len(log) == 10
+    assert len(log._records) == 3
+    assert len(list(spill_dir.iterdir())) == 1
+    assert list(log) == entries
+    # `since` works across the memory/disk boundary and within memory alone.
+    assert list(log.since(4)) == entries[4:]
+    assert list(log.since(8)) == entries[8:]
+    assert list(log.since(10)) == []
+
+
+def test_recent_entries_are_served_without_reading_the_spill_file(spill_dir, monkeypatch):
+    log = MissionLog(capacity=4)
+    entries = _entries(10)
+    for entry in entries:
+        log.append(entry)
+
+    def no_disk(*args, **kwargs):
+        raise AssertionError("spill file read")
+
+    monkeypatch.setattr(mission_log, "open", no_disk, raising=False)
+    assert list(log.since(6)) == entries[6:]
+    assert list(log.since(9)) == entries[9:]
+    assert list(log.since(10)) == []
+    with pytest.raises(AssertionError, match="spill file read"):
+        list(log.since(5))
+
+
+def test_spill_file_is_deleted_on_clear_and_collection(spill_dir):
+    log = MissionLog(capacity=1)
+    for entry in _entries(3):
+        log.append(entry)
+    log.clear()
+    assert list(log) == [] and len(log) == 0
+    assert list(spill_dir.iterdir()) == []
+
+    for entry in _entries(3):
+        log.append(entry)
+    del log
+    gc.collect()
+    assert list(spill_dir.iterdir()) == []
+
+
+def test_simulator_keeps_the_full_log_with_bounded_memory(spill_dir, monkeypatch):
+    monkeypatch.setattr(settings, "mission_log_memory_entries", 5)
+    sim = RovSimulator()
+    for _ in range(50):
+        sim.handle_command({"command": "NOT_A_COMMAND"})
+
+    assert len(sim.mission_log._records) == 5
+    assert [entry.seq for entry in sim.get_mission_log()] == list(range(1, 51))
+    assert [entry.seq for entry in sim.get_mission_log(since=40)] == list(range(41, 51))
@@ -0,0 +1,99 @@
+# backend/tests/test_outbound_queue.py
+import asyncio
+import json
+
+from backend.outbound_queue import OutboundQueue
+from backend.telemetry_encoding import DeltaEncoder
+
+# ---------- Helpers ----------
+
+
+class _GatedSocket:
+    """Records sent frames; while the gate is closed, sends hang like a stalled link."""
+
+    def __init__(self):
+        self.sent: list[str] = []
+        self.closed_with: int | None = None
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def send_text(self, text: str):
+        await self.gate.wait()
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000, reason: str | None = None):
+        self.closed_with = code
+
+
+async def _drain():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+# ---------- Queue ----------
+
+
+def test_stalled_link_keeps_only_newest_telemetry_and_every_event():
+    async def run():
+        ws = _GatedSocket()
+        queue = OutboundQueue(ws)  # type: ignore[arg-type]
+        queue.put("t0")
+        await _drain()
+        ws.gate.clear()
+        queue.put("t1")  # in flight when the link stalls
+        await _drain()
+        for frame in ["t2", "t3", "e4", "t5", "t6", "e7", "t8", "t9"]:
+            queue.put(frame, conflate=frame.startswith("t"))
+        assert queue.pending_frames == 3  # e4, e7 and the newest telemetry, t9
+        ws.gate.set()
+        await _drain()
+        return ws, queue
+
+    ws, queue = asyncio.run(run())
+    assert ws.sent == ["t0", "t1", "e4", "e7", "t9"]
+    assert queue.sent_frames == 5
+    assert queue.conflated_frames == 5  # t2, t3, t5, t6, t8
+    assert queue.dropped_frames == 0
+    assert queue.max_send_seconds >= queue.mean_send_seconds > 0
+
+
+def test_client_too_far_behind_on_events_is_disconnected():
+    async def run():
+        ws = _GatedSocket()
+        ws.gate.clear()
+        queue = OutboundQueue(ws, max_pending=3)  # type: ignore[arg-type]
+        queue.put("e0", conflate=False)
+        await _drain()
+        for i in range(1, 6):
+            queue.put(f"e{i}", conflate=False)
+        await _drain()
+        return ws, queue
+
+    ws, queue = asyncio.run(run())
+    assert ws.closed_with == 1013
+    assert queue.closed
+    # e0 is stuck in flight; e1-e3 were waiting and e4, e5 arrived too late.
+    assert queue.dropped_frames == 5
+    assert ws.sent == []
+
+
+def test_delta_frames_are_encoded_against_the_last_frame_sent():
+    async def run():
+        ws = _GatedSocket()
+        queue = OutboundQueue(ws, encoder=DeltaEncoder())  # type: ignore[arg-type]
+        queue.put({"a": 0, "b": 0})
+        await _drain()
+        ws.gate.clear()
+        queue.put({"a": 1, "b": 0})
+        await _drain()
+        queue.put({"a": 2, "b": 0})  # conflated
+        queue.put({"a": 2, "b": 1})
+        ws.gate.set()
+        await _drain()
+        return [json.loads(text) for text in ws.sent]
+
+    keyframe, first, second = asyncio.run(run())
+    assert keyframe["type"] == "keyframe"
+    assert [first["seq"], second["seq"]] == [1, 2]  # no gap despite the conflation
+    assert second["changes"] == {"a": 2, "b": 1}
+
@@ -1,12 +1,17 @@
 # backend/tests/test_persistence.py
 import asyncio
+import json
 import time
 import uuid
+from datetime import UTC, datetime, timedelta
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.pool import NullPool
 
 from backend.config import settings
+from backend.event_writer import EventWriter
+from backend.logs import LogEntry, LogLevel
 from backend.repository import EventLogRepository
 
 from .test_backend import _recv_n, _recv_until
@@ -29,6 +34,48 @@ def _query_events(*, mission_id: uuid.UUID | None = None, severity: str | None =
     return asyncio.run(_query())
 
 
+def _insert_rows(rows: list[dict]) -> int:
+    async def _insert():
+        engine = create_async_engine(settings.database_url, poolclass=NullPool)
+        try:
+            async with async_sessionmaker(engine)() as session:
+                return await EventLogRepository(session).insert_many(rows)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(_insert())
+
+
+def _seed_mission(count: int, *, start: datetime, severity: str = "WARNING"):
+    """Insert `count` events one second apart (plus a tie at the first timestamp)."""
+    mission_id = uuid.uuid4()
+    rows = [
+        {
+            "timestamp": start + timedelta(seconds=i),
+            "severity": severity,
+            "message": f"event {i}",
+            "mission_id": mission_id,
+        }
+        for i in range(count)
+    ]
+    rows.append({**rows[0], "message": "event 0 tie"})
+    _insert_rows(rows)
+    return mission_id
+
+
+def _list_missions():
+    async def _query():
+        engine = create_async_engine(settings.database_url, poolclass=NullPool)
+        try:
+            async with async_sessionmaker(engine)() as session:
+                missions = await EventLogRepository(session).list_missions()
+                return {m.mission_id: m for m in missions}
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(_query())
+
+
 def _wait_for_events(*, mission_id: uuid.UUID, severity: str, min_count=1, timeout=2.0):
     deadline = time.monotonic() + timeout
     events = []
@@ -127,5 +174,220 @@ def test_missions_endpoint_summarizes_persisted_events(client):
     missions = {m["mission_id"]: m for m in resp.json()}
     assert str(mission_id) in missions
     summary = missions[str(mission_id)]
+    assert summary["scenario"] == "pressure_anomaly"
+    assert summary["status"] != "standby"
     assert summary["event_count"] >= 1
-    assert summary["first_event_at"] <= summary["last_event_at"]
+    assert summary["started_at"] <= summary["first_event_at"] <= summary["last_event_at"]
+
+
+def test_history_queries_are_cached_until_events_are_persisted(client):
+    cache = client.app.state.query_cache
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        mission_id = next(iter(client.app.state.sim_manager._sessions.values())).mission_id
+        params = {"mission_id": str(mission_id)}
+        assert client.get("/api/v1/events", params=params).json() == []
+        assert client.get("/api/v1/events", params=params).json() == []
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        ws.send_json(
+            {"command": "START_SIMULATION", "payload": {"scenario": "pressure_anomaly"}}
+        )
+        _recv_until(ws, lambda d: d["alert"]["severity"] == "WARNING", max_steps=500)
+
+    # The writer's flush drops the cached page, so the new event shows up.
+    deadline = time.monotonic() + 2.0
+    events = []
+    while not events and time.monotonic() < deadline:
+        events = client.get("/api/v1/events", params=params).json()
+        time.sleep(0.05)
+    assert "WARNING" in {e["severity"] for e in events}
+    assert cache.invalidated >= 1
+
+
+def test_mission_row_is_created_when_a_scenario_starts(client):
+    # A connection that never starts a scenario leaves no mission behind.
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+    assert client.get("/api/v1/missions").json() == []
+
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        session = next(iter(client.app.state.sim_manager._sessions.values()))
+        mission_id = str(session.mission_id)
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        _recv_until(ws, lambda d: d["mission_state"]["status"] == "en_route")
+
+        # Write-behind: the row lands shortly after, without any events.
+        deadline = time.monotonic() + 2.0
+        missions = {}
+        while mission_id not in missions and time.monotonic() < deadline:
+            missions = {m["mission_id"]: m for m in client.get("/api/v1/missions").json()}
+            time.sleep(0.05)
+    # Submitted after the standby connection's would have been.
+    assert list(missions) == [mission_id]
+    assert missions[mission_id]["scenario"] == "nominal"
+    assert missions[mission_id]["event_count"] == 0
+    assert missions[mission_id]["first_event_at"] is None
+
+
+def test_insert_many_writes_all_rows_in_one_call():
+    mission_id = uuid.uuid4()
+    now = datetime.now(UTC)
+    rows = [
+        {"timestamp": now, "severity": "WARNING", "message": f"event {i}", "mission_id": mission_id}
+        for i in range(25)
+    ]
+
+    assert _insert_rows(rows) == 25
+    events = _query_events(mission_id=mission_id)
+    assert sorted(e.message for e in events) == sorted(f"event {i}" for i in range(25))
+
+
+def test_event_writer_batches_and_flushes_on_stop():
+    mission_id = uuid.uuid4()
+
+    async def _write():
+        engine = create_async_engine(settings.database_url, poolclass=NullPool)
+        writer = EventWriter(
+            max_queue=100, batch_size=40, session_factory=async_sessionmaker(engine)
+        )
+        writer.start()
+        try:
+            accepted = [
+                writer.submit(
+                    mission_id,
+                    LogEntry(timestamp=datetime.now(UTC), level=LogLevel.CRITICAL, message="x"),
+                )
+                for _ in range(120)
+            ]
+            await writer.stop()
+        finally:
+            await engine.dispose()
+        return writer, accepted
+
+    writer, accepted = asyncio.run(_write())
+    # The queue is bounded, so the burst beyond max_queue is dropped, not buffered.
+    assert accepted.count(True) == 100
+    assert writer.dropped_events == 20
+    assert writer.persisted_events == 100
+    assert len(_query_events(mission_id=mission_id)) == 100
+
+
+def test_events_endpoint_pages_with_keyset_cursor(client):
+    start = datetime(2030, 1, 1, tzinfo=UTC)
+    mission_id = _seed_mission(7, start=start)
+
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"mission_id": str(mission_id), "limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        resp = client.get("/api/v1/events", params=params)
+        assert resp.status_code == 200
+        page = resp.json()
+        assert len(page) <= 3
+        seen.extend(page)
+        pages += 1
+        cursor = resp.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert len(seen) == 8
+    assert len({e["id"] for e in seen}) == 8  # the timestamp tie is neither skipped nor repeated
+    keys = [(e["timestamp"], e["id"]) for e in seen]
+    assert keys == sorted(keys)
+
+
+def test_events_endpoint_filters_by_time_range(client):
+    start = datetime(2030, 1, 1, tzinfo=UTC)
+    mission_id = _seed_mission(5, start=start)
+
+    resp = client.get(
+        "/api/v1/events",
+        params={
+            "mission_id": str(mission_id),
+            "since": (start + timedelta(seconds=1)).isoformat(),
+            "until": (start + timedelta(seconds=3)).isoformat(),
+        },
+    )
+    assert resp.status_code == 200
+    assert [e["message"] for e in resp.json()] == ["event 1", "event 2"]
+
+
+def test_events_endpoint_rejects_malformed_cursor(client):
+    resp = client.get("/api/v1/events", params={"cursor": "not-a-cursor"})
+    assert resp.status_code == 400
+
+
+def test_events_stream_returns_every_match_as_ndjson(client):
+    start = datetime(2030, 1, 1, tzinfo=UTC)
+    mission_id = _seed_mission(1200, start=start)
+
+    resp = client.get("/api/v1/events/stream", params={"mission_id": str(mission_id)})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(events) == 1201
+    assert all(e["mission_id"] == str(mission_id) for e in events)
+    keys = [(e["timestamp"], e["id"]) for e in events]
+    assert keys == sorted(keys)
+
+    resp = client.get(
+        "/api/v1/events/stream",
+        params={
+            "mission_id": str(mission_id),
+            "since": (start + timedelta(seconds=1199)).isoformat(),
+        },
+    )
+    assert [json.loads(line)["message"] for line in resp.text.splitlines()] == ["event 1199"]
+
+
+def test_inserts_maintain_mission_stats_incrementally():
+    start = datetime(2030, 1, 1, tzinfo=UTC)
+    mission_id = _seed_mission(3, start=start)
+    _insert_rows(
+        [
+            {
+                "timestamp": start - timedelta(seconds=5),
+                "severity": "CRITICAL",
+                "message": "earlier",
+                "mission_id": mission_id,
+            }
+        ]
+    )
+
+    mission = _list_missions()[mission_id]
+    assert mission.event_count == 5
+    assert mission.first_event_at == start - timedelta(seconds=5)
+    assert mission.last_event_at == start + timedelta(seconds=2)
+
+
+def test_backfill_rebuilds_missions_from_event_log():
+    start = datetime(2030, 1, 1, tzinfo=UTC)
+    first = _seed_mission(4, start=start)
+    second = _seed_mission(2, start=start + timedelta(hours=1))
+
+    async def _reset_and_backfill():
+        engine = create_async_engine(settings.database_url, poolclass=NullPool)
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text("TRUNCATE TABLE mission"))
+            async with async_sessionmaker(engine)() as session:
+                repo = EventLogRepository(session)
+                # Re-running must not double-count.
+                return [await repo.backfill_missions(), await repo.backfill_missions()]
+        finally:
+            await engine.dispose()
+
+    assert asyncio.run(_reset_and_backfill()) == [2, 2]
+    missions = _list_missions()
+    assert list(missions) == [second, first]  # most recently started first
+    assert missions[first].event_count == 5
+    assert missions[first].started_at == missions[first].first_event_at == start
+    assert missions[first].last_event_at == start + timedelta(seconds=3)
+    assert missions[second].event_count == 3
+    assert missions[second].status is None
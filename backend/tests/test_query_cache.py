@@ -0,0 +1,97 @@
+# backend/tests/test_query_cache.py
+import asyncio
+import uuid
+
+from backend.query_cache import MISSIONS, QueryCache, event_tags, written_tags
+
+MISSION_A = uuid.uuid4()
+MISSION_B = uuid.uuid4()
+
+
+def _loader(value):
+    calls = []
+
+    async def load():
+        calls.append(value)
+        return value
+
+    return load, calls
+
+
+def test_results_are_served_until_they_expire():
+    async def run():
+        cache = QueryCache(max_entries=10, ttl_seconds=60)
+        load, calls = _loader([1, 2])
+        assert await cache.get_or_load("k", (MISSIONS,), load) == [1, 2]
+        assert await cache.get_or_load("k", (MISSIONS,), load) == [1, 2]
+        assert (cache.hits, cache.misses, len(calls)) == (1, 1, 1)
+
+        cache.ttl_seconds = 0
+        await cache.get_or_load("k2", (MISSIONS,), load)
+        await cache.get_or_load("k2", (MISSIONS,), load)
+        assert (cache.expired, len(calls)) == (1, 3)
+
+    asyncio.run(run())
+
+
+def test_least_recently_used_entry_is_evicted():
+    async def run():
+        cache = QueryCache(max_entries=2, ttl_seconds=60)
+        load, calls = _loader(None)
+        for key in ("a", "b", "a", "c"):  # "b" is the least recently used
+            await cache.get_or_load(key, (), load)
+        assert cache.evicted == 1 and len(cache) == 2
+        await cache.get_or_load("a", (), load)
+        assert len(calls) == 3
+        await cache.get_or_load("b", (), load)
+        assert len(calls) == 4
+
+    asyncio.run(run())
+
+
+def test_writes_invalidate_only_the_queries_they_affect():
+    async def run():
+        cache = QueryCache(max_entries=100, ttl_seconds=60)
+        load, _ = _loader([])
+        filters = [
+            (severity, mission)
+            for severity in (None, "WARNING", "CRITICAL")
+            for mission in (None, MISSION_A, MISSION_B)
+        ]
+        for severity, mission in filters:
+            await cache.get_or_load((severity, mission), event_tags(severity, mission), load)
+        await cache.get_or_load("missions", (MISSIONS,), load)
+
+        cache.invalidate(written_tags({("WARNING", MISSION_A)}))
+        left = set(cache._entries)
+        assert left == {
+            ("CRITICAL", None),
+            ("CRITICAL", MISSION_A),
+            ("CRITICAL", MISSION_B),
+            (None, MISSION_B),
+            ("WARNING", MISSION_B),
+        }
+        assert cache.invalidated == len(filters) + 1 - len(left)
+
+    asyncio.run(run())
+
+
+def test_result_loaded_across_an_invalidation_is_not_stored():
+    async def run():
+        cache = QueryCache(max_entries=10, ttl_seconds=60)
+        loading = asyncio.Event()
+        written = asyncio.Event()
+
+        async def slow_load():
+            loading.set()
+            await written.wait()
+            return "before the write"
+
+        task = asyncio.create_task(cache.get_or_load("k", (MISSIONS,), slow_load))
+        await loading.wait()
+        cache.invalidate({MISSIONS})
+        written.set()
+        assert await task == "before the write"
+        assert len(cache) == 0
+
+    asyncio.run(run())
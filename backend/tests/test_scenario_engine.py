@@ -0,0 +1,230 @@
+# backend/tests/test_scenario_engine.py
+import ast
+import hashlib
+import json
+import random
+
+import pytest
+
+from backend import simulator as simulator_module
+from backend.headless import attentive_operator, run_mission
+from backend.scenario_engine import FIELDS, ScenarioError, _Compiler, load_scenarios
+from backend.simulator import SCENARIO_CONSTANTS, SCENARIOS, RovSimulator
+
+from .test_vector_engine import SCRIPTS
+
+SHALLOW_SURVEY = """
+title = "Shallow Survey"
+
+[[rule]]
+when.mission_status = "en_route"
+when.depth_meters.lt = 100
+set.propulsion_status = "active"
+
+[[rule]]
+# Reaching 100 m switches to searching, which the next rule sees this tick.
+when.mission_status = "en_route"
+when.depth_meters.ge = 100
+set.mission_status = "searching"
+reset_timer = true
+log = [{ level = "INFO", message = "Survey depth reached." }]
+
+[[rule]]
+when.mission_status = "searching"
+set.mission_status = "returning"
+log = [{ level = "INFO", message = "Survey complete, surfacing." }]
+
+[[rule]]
+when.mission_status = "returning"
+when.depth_meters.le = 0
+set.mission_status = "mission_success"
+set.propulsion_status = "inactive"
+stop = true
+"""
+
+# Digests of 500-tick traces recorded from the hand-written scenario methods
+# the TOML files replaced (see `_trace`): one per scripted path, and one for
+# FUZZ_RUNS runs with random commands.
+GOLDEN_TRACES = {
+    "_nominal_success": "125258f7c5ca8232b9eaf61236eaf1e3af1b3cff73fe824b58c427b62ae23767",
+    "_nominal_all_stop_then_reset": (
+        "7544319bb081ae3c5f6e2e83ce6823fb7e1b80017b03b626b0490f5236641ee1"
+    ),
+    "_pressure_anomaly_failure": "8e23525e981a7ad4cc27691768bdb3d38e3bc5ef228f76436876ddc264690327",
+    "_pressure_anomaly_all_stop": (
+        "1ae6893de69ee7d9a23a74a62059f4f30cf0b6d1c62d2db52eef857ffb0dd74a"
+    ),
+    "_power_fault_failure": "2cff9851dd1ca1c543859bb0a6ac998cc450d8ed4096669c98083683e60c6385",
+    "_power_fault_jettison": "ca5926572c6e912f7408be12cea1593c2e9fc85a2d1cc0d605b359f28aa5098f",
+}
+GOLDEN_FUZZ = "28823878b7c0b1c6e64624c50d1629b3121b802934a703958daf94cb87e29eb2"
+FUZZ_RUNS = 20
+
+FUZZ_COMMANDS = [
+    *(
+        {"command": "START_SIMULATION", "payload": {"scenario": scenario}}
+        for scenario in ("nominal", "pressure_anomaly", "power_fault")
+    ),
+    {"command": "SET_PROPULSION_STATE", "payload": {"status": "inactive"}},
+    {"command": "SET_PROPULSION_STATE", "payload": {"status": "active"}},
+    {"command": "DEPLOY_ARM"},
+    {"command": "COLLECT_SAMPLE"},
+    {"command": "JETTISON_PACKAGE"},
+    {"command": "RESET_SIMULATION"},
+]
+
+# ---------- Helpers ----------
+
+
+def _write(tmp_path, name, text):
+    (tmp_path / f"{name}.toml").write_text(text)
+
+
+def _messages(sim):
+    return [entry.message for entry in sim.get_mission_log()]
+
+
+def _observed(sim):
+    return sim.get_telemetry().model_dump(
+        include={"rov_state", "mission_state", "alert"}, warnings=False
+    )
+
+
+def _trace(script, ticks=500):
+    """Digest of every frame, the scenario's private state and the log."""
+    sim = RovSimulator()
+    digest = hashlib.sha256()
+    frame = _observed(sim)
+    for tick in range(ticks):
+        for cmd in script(tick, frame):
+            sim.handle_command(cmd)
+        sim.update()
+        frame = _observed(sim)
+        private = [
+            sim.scenario_timer,
+            sim.operator_override,
+            sim.pressure_normalization_ticks,
+            sim.pressure_normalization_target,
+            sim.simulation_running,
+        ]
+        digest.update(json.dumps([frame, private], sort_keys=True).encode())
+    for entry in sim.get_mission_log():
+        digest.update(f"{entry.level}|{entry.message}".encode())
+    return digest.hexdigest()
+
+
+def _fuzz(seed):
+    rng = random.Random(seed)
+
+    def script(tick, frame):
+        if tick == 0:
+            return [FUZZ_COMMANDS[seed % 3]]
+        return [rng.choice(FUZZ_COMMANDS)] if rng.random() < 0.05 else []
+
+    return script
+
+
+# ---------- Loading ----------
+
+
+def test_builtin_scenarios_are_compiled_once_at_import():
+    assert set(SCENARIOS) == {"nominal", "pressure_anomaly", "power_fault"}
+    assert SCENARIOS["pressure_anomaly"].title == "Pressure Anomaly"
+    # One entry per mission status in each scenario's transition table.
+    assert set(SCENARIOS["nominal"].table) == set(FIELDS["mission_status"][1])
+
+
+@pytest.mark.parametrize(
+    ("rule", "error"),
+    [
+        ('when.depth = 1\nset.propulsion_status = "active"', "unknown field 'depth'"),
+        ('set.mission_status = "lost"', "'mission_status' must be one of"),
+        ("when.depth_meters.lt = \"MAX_DEPTH\"\nstop = true", "unknown constant 'MAX_DEPTH'"),
+        ("when.depth_meters.near = 5\nstop = true", "unknown operator 'near'"),
+        ('switch_to = "nowhere"', "switch_to unknown scenario 'nowhere'"),
+        ('on = "SELF_DESTRUCT"', "Input should be 'SET_PROPULSION_STATE'"),
+    ],
+)
+def test_invalid_scenario_files_are_rejected(tmp_path, rule, error):
+    _write(tmp_path, "broken", f"[[rule]]\n{rule}\n")
+    with pytest.raises(ScenarioError, match=error):
+        load_scenarios(SCENARIO_CONSTANTS, tmp_path)
+
+
+# ---------- Evaluation ----------
+
+
+def test_scenario_added_as_data_runs_without_code_changes(tmp_path, monkeypatch):
+    _write(tmp_path, "shallow_survey", SHALLOW_SURVEY)
+    scenarios = load_scenarios(SCENARIO_CONSTANTS, tmp_path)
+    assert {"nominal", "shallow_survey"} <= set(scenarios)
+    monkeypatch.setattr(simulator_module, "SCENARIOS", scenarios)
+
+    run = run_mission("shallow_survey", attentive_operator, record=True)
+
+    assert run.final_status == "mission_success"
+    messages = [entry.message for entry in run.mission_log]
+    assert messages[0] == "Scenario Started: Shallow Survey."
+    # searching -> returning fired in the same tick the survey depth was reached.
+    reached = messages.index("Survey depth reached.")
+    assert run.mission_log[reached + 1].message == "Survey complete, surfacing."
+    assert run.mission_log[reached + 1].timestamp == run.mission_log[reached].timestamp
+
+
+def test_scenario_files_in_extra_dir_replace_builtins(tmp_path):
+    _write(tmp_path, "nominal", 'title = "Custom"\n')
+    scenarios = load_scenarios(SCENARIO_CONSTANTS, tmp_path)
+    assert scenarios["nominal"].title == "Custom"
+    assert scenarios["power_fault"].title == "Power Fault"
+
+
+def test_command_rules_only_run_when_the_command_applied():
+    sim = RovSimulator()
+    sim.handle_command({"command": "START_SIMULATION", "payload": {"scenario": "power_fault"}})
+    sim.state.power_status = "fault"
+    sim.state.package_status = "jettisoned"
+
+    # Nothing left to jettison, so power_fault's JETTISON_PACKAGE rule stays quiet.
+    sim.handle_command({"command": "JETTISON_PACKAGE"})
+    assert sim.rov_state.power.status == "fault"
+    assert _messages(sim)[-1] == "Command Sent: JETTISON_PACKAGE."
+
+
+def test_hostile_text_in_a_scenario_file_stays_data(tmp_path):
+    _write(
+        tmp_path,
+        "hostile",
+        '[[rule]]\nlog = [{ level = "INFO", message = "__import__(\'os\').system(\'id\')" }]\n',
+    )
+    scenario = load_scenarios(SCENARIO_CONSTANTS, tmp_path)["hostile"]
+    sim = RovSimulator()
+    scenario.tick(sim)
+    assert _messages(sim)[-1] == "__import__('os').system('id')"
+
+
+def test_compiler_rejects_nodes_outside_its_whitelist():
+    compiler = _Compiler("test", SCENARIO_CONSTANTS)
+    call = ast.Call(ast.Name("__import__", ast.Load()), [ast.Constant(0)], [])
+    with pytest.raises(ScenarioError, match="unexpected name '__import__'"):
+        compiler.function("f", [ast.Expr(call)])
+    dunder = ast.Attribute(ast.Name("sim", ast.Load()), "__class__", ast.Load())
+    with pytest.raises(ScenarioError, match="unexpected attribute '__class__'"):
+        compiler.function("f", [ast.Expr(dunder)])
+    subscript = ast.Subscript(ast.Name("sim", ast.Load()), ast.Constant(0), ast.Load())
+    with pytest.raises(ScenarioError, match="unexpected Subscript node"):
+        compiler.function("f", [ast.Expr(subscript)])
+
+
+# ---------- Golden traces ----------
+
+
+@pytest.mark.parametrize("script", SCRIPTS, ids=lambda script: script.__name__)
+def test_scripted_paths_match_the_hand_written_scenarios(script):
+    assert _trace(script) == GOLDEN_TRACES[script.__name__]
+
+
+def test_fuzzed_runs_match_the_hand_written_scenarios():
+    digest = hashlib.sha256()
+    for seed in range(FUZZ_RUNS):
+        digest.update(_trace(_fuzz(seed)).encode())
+    assert digest.hexdigest() == GOLDEN_FUZZ
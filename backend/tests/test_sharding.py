@@ -0,0 +1,254 @@
+# backend/tests/test_sharding.py
+import time
+import uuid
+
+import grpc
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+from backend.config import settings
+from backend.grpc_gen import mission_log_pb2, mission_log_pb2_grpc
+from backend.main import app
+from backend.sharding import ShardedSimulationManager
+
+# ---------- Helpers ----------
+
+
+@pytest.fixture
+def sharded_client(monkeypatch):
+    """App started with two simulation worker processes."""
+    monkeypatch.setattr(settings, "simulation_workers", 2)
+    with TestClient(app) as c:
+        assert isinstance(c.app.state.sim_manager, ShardedSimulationManager)
+        yield c
+
+
+def _recv_until(ws, condition, max_steps=2000):
+    last = None
+    for _ in range(max_steps):
+        last = ws.receive_json()
+        if condition(last):
+            return last
+    raise AssertionError("Condition not met in telemetry stream", last)
+
+
+# ---------- SHARDING TESTS ----------
+
+
+def test_sharded_session_streams_telemetry_and_applies_commands(sharded_client):
+    with sharded_client.websocket_connect("/ws/telemetry") as ws:
+        first = ws.receive_json()
+        assert first["mission_state"]["status"] == "standby"
+
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        frame = _recv_until(ws, lambda d: d["mission_state"]["status"] == "en_route")
+        assert frame["rov_state"]["environment"]["depth_meters"] >= 0
+
+        _recv_until(ws, lambda d: d["rov_state"]["environment"]["depth_meters"] > 0)
+        (session,) = sharded_client.get("/api/v1/sessions").json()
+        assert session["scenario"] == "nominal"
+        assert session["mission_status"] == "en_route"
+
+    assert sharded_client.app.state.sim_manager.active_session_count == 0
+
+
+def test_sessions_are_spread_across_workers(sharded_client):
+    manager = sharded_client.app.state.sim_manager
+    with sharded_client.websocket_connect("/ws/telemetry") as ws1:
+        with sharded_client.websocket_connect("/ws/telemetry") as ws2:
+            ws1.receive_json()
+            ws2.receive_json()
+            workers = {session.worker.index for session in manager._sessions.values()}
+            assert workers == {0, 1}
+
+
+def test_sharded_delta_encoding_and_resync(sharded_client):
+    with sharded_client.websocket_connect("/ws/telemetry?encoding=delta") as ws:
+        assert ws.receive_json()["type"] == "keyframe"
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        assert ws.receive_json()["type"] == "delta"
+        ws.send_json({"command": "RESYNC"})
+        _recv_until(ws, lambda d: d["type"] == "keyframe" and d["seq"] > 0)
+
+
+def test_sharded_session_resumes_after_a_drop(sharded_client):
+    manager = sharded_client.app.state.sim_manager
+    with sharded_client.websocket_connect("/ws/telemetry?resumable=true&encoding=delta") as ws:
+        hello = ws.receive_json()
+        assert hello["type"] == "session"
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        _recv_until(ws, lambda d: "rov_state" in d.get("changes", {}))
+    deadline = time.monotonic() + 5
+    while len(manager.parked) == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    url = f"/ws/telemetry?resume_token={hello['resume_token']}&encoding=delta"
+    with sharded_client.websocket_connect(url) as ws:
+        again = ws.receive_json()
+        assert again["resumed"] is True and again["session_id"] == hello["session_id"]
+        keyframe = ws.receive_json()
+        assert keyframe["type"] == "keyframe"
+        assert keyframe["telemetry"]["mission_state"]["status"] == "en_route"
+        assert keyframe["telemetry"]["rov_state"]["environment"]["depth_meters"] > 0
+    assert manager.resumed_sessions == 1
+
+
+def test_sharded_manager_enforces_global_session_limit(sharded_client, monkeypatch):
+    monkeypatch.setattr(ShardedSimulationManager, "MAX_CONCURRENT_SESSIONS", 1)
+
+    with sharded_client.websocket_connect("/ws/telemetry") as ws1:
+        ws1.receive_json()
+        with pytest.raises(WebSocketDisconnect) as exc:
+            with sharded_client.websocket_connect("/ws/telemetry") as ws2:
+                ws2.receive_json()
+        assert exc.value.code == 1013
+
+
+def test_sharded_spectator_sees_operator_session(sharded_client):
+    with sharded_client.websocket_connect("/ws/telemetry") as operator:
+        operator.receive_json()
+        session_id = sharded_client.get("/api/v1/sessions").json()[0]["session_id"]
+
+        with sharded_client.websocket_connect(
+            f"/ws/telemetry/{session_id}/spectate"
+        ) as spectator:
+            spectator.receive_json()
+            operator.send_json(
+                {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+            )
+            _recv_until(spectator, lambda d: d["mission_state"]["status"] == "en_route")
+
+
+def test_sharded_session_telemetry_history(sharded_client):
+    with sharded_client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        _recv_until(ws, lambda d: d["rov_state"]["environment"]["depth_meters"] > 1)
+        session_id = sharded_client.get("/api/v1/sessions").json()[0]["session_id"]
+
+        resp = sharded_client.get(f"/api/v1/sessions/{session_id}/telemetry")
+        assert resp.status_code == 200
+        assert resp.json()["series"]["depth_meters"][-1] > 1
+
+    resp = sharded_client.get(f"/api/v1/sessions/{session_id}/telemetry")
+    assert resp.status_code == 404
+
+
+def test_sharded_log_entries_reach_grpc_stream(sharded_client):
+    with grpc.insecure_channel(f"localhost:{sharded_client.app.state.grpc_port}") as channel:
+        stub = mission_log_pb2_grpc.MissionLogServiceStub(channel)
+        stream = stub.StreamMissionLog(mission_log_pb2.StreamMissionLogRequest())
+        hub = sharded_client.app.state.sim_manager.log_hub
+        deadline = time.monotonic() + 2.0
+        while hub.subscriber_count < 1:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+
+        with sharded_client.websocket_connect("/ws/telemetry") as ws:
+            ws.receive_json()
+            ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+            entry = next(stream)
+            stream.cancel()
+
+    assert entry.message == "Scenario Started: Nominal."
+
+
+def test_sharded_metrics_include_each_worker(sharded_client):
+    with sharded_client.websocket_connect("/ws/telemetry") as ws:
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        for _ in range(10):
+            ws.receive_json()
+        text = sharded_client.get("/metrics").text
+
+    # Sessions and sockets are counted once, by the FastAPI process...
+    assert "odyssey_active_sessions 1" in text.splitlines()
+    assert text.count("# TYPE odyssey_active_sessions gauge") == 1
+    # ...and the tick loops in each worker, labelled by worker.
+    assert 'odyssey_tick_seconds_count{worker="0"}' in text
+    assert 'odyssey_tick_seconds_count{worker="1"}' in text
+    assert 'odyssey_send_seconds_count{worker=' not in text
+
+
+def test_worker_writes_invalidate_the_parent_query_cache(sharded_client):
+    with sharded_client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        (session,) = sharded_client.get("/api/v1/sessions").json()
+        assert sharded_client.get("/api/v1/missions").json() == []  # now cached
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+
+        # Only the worker's "persisted" message can make the row show up.
+        deadline = time.monotonic() + 5
+        missions = []
+        while session["session_id"] not in missions:
+            assert time.monotonic() < deadline
+            missions = [m["mission_id"] for m in sharded_client.get("/api/v1/missions").json()]
+            time.sleep(0.05)
+
+
+def test_crashed_worker_session_is_closed_and_freed(monkeypatch, tmp_path):
+    # Sets a number to a string: the worker's physics step raises.
+    (tmp_path / "broken.toml").write_text('[[rule]]\nset.charge_percent = "boom"\n')
+    monkeypatch.setenv("SCENARIOS_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "simulation_workers", 1)
+    with TestClient(app) as client:
+        with client.websocket_connect("/ws/telemetry") as ws:
+            ws.receive_json()
+            ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "broken"}})
+            with pytest.raises(WebSocketDisconnect) as exc:
+                while True:
+                    ws.receive_json()
+            assert exc.value.code == 1011
+        assert client.app.state.sim_manager.active_session_count == 0
+
+
+def test_dead_worker_gets_no_new_sessions(sharded_client):
+    manager = sharded_client.app.state.sim_manager
+    with sharded_client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        (session,) = manager._sessions.values()
+        dead = session.worker
+        dead.process.kill()
+        with pytest.raises(WebSocketDisconnect) as exc:
+            while True:
+                ws.receive_json()
+        assert exc.value.code == 1011
+    assert manager.active_session_count == 0
+    assert not dead.alive
+
+    for _ in range(2):
+        with sharded_client.websocket_connect("/ws/telemetry") as ws:
+            assert ws.receive_json()["mission_state"]["status"] == "standby"
+            (session,) = manager._sessions.values()
+            assert session.worker is not dead
+    assert sharded_client.get("/metrics").status_code == 200
+
+    (live,) = (worker for worker in manager._workers if worker is not dead)
+    live.process.kill()
+    deadline = time.monotonic() + 10
+    while live.alive and time.monotonic() < deadline:
+        time.sleep(0.05)
+    with sharded_client.websocket_connect("/ws/telemetry") as ws:
+        with pytest.raises(WebSocketDisconnect) as exc:
+            ws.receive_json()
+        assert exc.value.code == 1011
+
+
+def test_corrupt_snapshot_fails_only_its_own_session(sharded_client):
+    manager = sharded_client.app.state.sim_manager
+    manager.parked.park("bad-token", str(uuid.uuid4()), b"not a snapshot")
+    with sharded_client.websocket_connect("/ws/telemetry?resume_token=bad-token") as ws:
+        with pytest.raises(WebSocketDisconnect) as exc:
+            while True:
+                ws.receive_json()
+        assert exc.value.code == 1011
+    assert manager.active_session_count == 0
+
+    # Both workers survived and take new sessions.
+    assert all(worker.alive and worker.process.is_alive() for worker in manager._workers)
+    with sharded_client.websocket_connect("/ws/telemetry") as ws1:
+        with sharded_client.websocket_connect("/ws/telemetry") as ws2:
+            ws1.receive_json()
+            ws2.receive_json()
+            assert {s.worker.index for s in manager._sessions.values()} == {0, 1}
@@ -0,0 +1,50 @@
+# backend/tests/test_sim_snapshot.py
+import pytest
+
+from backend.clock import VirtualClock
+from backend.sim_snapshot import VERSION, restore, snapshot
+from backend.simulator import RovSimulator
+
+from .test_vector_engine import SCRIPTS, _frame
+
+
+@pytest.mark.parametrize("script", SCRIPTS, ids=lambda script: script.__name__)
+def test_restored_simulator_carries_on_identically(script):
+    """Restore a snapshot every 25 ticks and run the twin alongside the
+    original: frames and log entries must stay identical, so nothing the
+    scenario depends on (timer, override, pressure normalization) is lost."""
+    clock = VirtualClock()
+    sim = RovSimulator(clock)
+    twin, restored_at = None, 0
+    frame = _frame(sim.get_telemetry())
+    for tick in range(400):
+        if tick % 25 == 0:
+            twin = restore(snapshot(sim), clock)
+            assert twin.get_telemetry_json() == sim.get_telemetry_json()
+            restored_at = twin.log_seq
+            assert restored_at == sim.log_seq
+        for cmd in script(tick, frame):
+            sim.handle_command(cmd)
+            twin.handle_command(cmd)
+        sim.update()
+        twin.update()
+        clock.advance(1 / RovSimulator.TICKS_PER_SECOND)
+
+        assert twin.get_telemetry_json() == sim.get_telemetry_json()
+        # The log itself isn't carried over; new entries continue its seqs.
+        assert twin.get_mission_log() == sim.get_mission_log(since=restored_at)
+        frame = _frame(sim.get_telemetry())
+
+
+def test_snapshot_is_compact_and_validated():
+    sim = RovSimulator()
+    sim.handle_command({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+    blob = snapshot(sim)
+    assert len(blob) < 100
+
+    with pytest.raises(ValueError, match="version"):
+        restore(bytes([VERSION + 1]) + blob[1:])
+    with pytest.raises(ValueError, match="Invalid"):
+        restore(blob[:-1])
+    with pytest.raises(ValueError, match="unknown scenario"):
+        restore(blob.replace(b"nominal", b"nominax"))
@@ -0,0 +1,230 @@
+# backend/tests/test_telemetry_archive.py
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import asyncpg
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from backend.clock import VirtualClock
+from backend.config import settings
+from backend.main import app
+from backend.repository import TelemetryRepository
+from backend.simulator import RovSimulator
+from backend.telemetry_archive import PARTITION_RETRY_SECONDS, TelemetryArchiver
+
+from .test_backend import _only_session, _recv_until
+
+# Just before midnight, so a run spans two day partitions.
+START = datetime(2030, 3, 1, 23, 59, 50, tzinfo=UTC)
+
+# ---------- Helpers ----------
+
+
+@pytest.fixture
+def archiving_client(monkeypatch):
+    """App started with TELEMETRY_ARCHIVE enabled."""
+    monkeypatch.setattr(settings, "telemetry_archive", True)
+    with TestClient(app) as c:
+        yield c
+
+
+def _archive_run(ticks: int, *, tps: int = 2, **archiver_kwargs):
+    """Archive `ticks` ticks of a nominal mission on a virtual clock."""
+    mission_id = uuid.uuid4()
+
+    async def _run():
+        engine = create_async_engine(settings.database_url, poolclass=NullPool)
+        archiver = TelemetryArchiver(engine=engine, **archiver_kwargs)
+        archiver.start()
+        try:
+            clock = VirtualClock(START)
+            sim = RovSimulator(clock=clock)
+            sim.handle_command(
+                {"command": "START_SIMULATION", "payload": {"scenario": "nominal"}}
+            )
+            for _ in range(ticks):
+                clock.advance(1 / tps)
+                sim.update()
+                archiver.record(mission_id, sim)
+            await archiver.stop()
+        finally:
+            await engine.dispose()
+        return archiver
+
+    return mission_id, asyncio.run(_run())
+
+
+def _query(fn):
+    async def _run():
+        engine = create_async_engine(settings.database_url, poolclass=NullPool)
+        try:
+            async with async_sessionmaker(engine)() as session:
+                return await fn(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(_run())
+
+
+# ---------- Tests ----------
+
+
+def test_archiver_copies_every_sample_into_day_partitions():
+    mission_id, archiver = _archive_run(60, batch_size=25)
+    assert archiver.archived_samples == 60
+    assert archiver.dropped_samples == archiver.failed_samples == 0
+
+    async def _per_partition(session):
+        result = await session.execute(
+            text(
+                "SELECT tableoid::regclass::text, count(*) FROM telemetry_sample "
+                "WHERE mission_id = :mission_id GROUP BY 1 ORDER BY 1"
+            ),
+            {"mission_id": mission_id},
+        )
+        return result.all()
+
+    # Ticks at 23:59:50.5 ... 23:59:59.5, then from midnight on.
+    assert _query(_per_partition) == [
+        ("telemetry_sample_20300301", 19),
+        ("telemetry_sample_20300302", 41),
+    ]
+
+
+def test_downsample_averages_fixed_buckets():
+    mission_id, _ = _archive_run(60)
+
+    async def _downsample(session):
+        return await TelemetryRepository(session).downsample(mission_id, bucket_seconds=10)
+
+    telemetry = _query(_downsample)
+    # Buckets are aligned to whole 10 s, not to the first sample.
+    assert telemetry.timestamps == [START + timedelta(seconds=10 * i) for i in range(4)]
+    assert telemetry.samples == [19, 20, 20, 1]
+    depths = telemetry.series["depth_meters"]
+    assert depths == sorted(depths)
+    assert set(telemetry.series) == {
+        "charge_percent",
+        "power_level_percent",
+        "hull_pressure_kpa",
+        "depth_meters",
+        "water_temp_celsius",
+    }
+
+
+def test_archiver_drops_samples_beyond_max_pending():
+    _, archiver = _archive_run(30, max_pending=10, flush_interval=60)
+    assert archiver.archived_samples == 10
+    assert archiver.dropped_samples == 20
+
+
+def test_live_sessions_are_archived_when_enabled(archiving_client):
+    client = archiving_client
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        _recv_until(ws, lambda d: d["rov_state"]["environment"]["depth_meters"] > 2)
+        mission_id = _only_session(client).mission_id
+
+    # Write-behind: samples arrive within one flush interval.
+    url = f"/api/v1/missions/{mission_id}/telemetry"
+    deadline = time.monotonic() + 3.0
+    body = client.get(url, params={"bucket_seconds": 0.1}).json()
+    while not body["samples"] and time.monotonic() < deadline:
+        time.sleep(0.1)
+        body = client.get(url, params={"bucket_seconds": 0.1}).json()
+    assert sum(body["samples"]) > 0
+    assert body["series"]["depth_meters"][-1] > 2
+
+
+def test_partition_that_failed_to_create_is_retried():
+    class _Driver:
+        def __init__(self):
+            self.calls = 0
+
+        async def execute(self, sql: str):
+            self.calls += 1
+            if self.calls <= 2:
+                raise asyncpg.PostgresError("could not obtain lock")
+
+    async def _run():
+        archiver = TelemetryArchiver()
+        driver = _Driver()
+        day = START.date()
+        await archiver._create_partition(driver, day)  # type: ignore[arg-type]
+        await archiver._create_partition(driver, day)  # type: ignore[arg-type]
+        assert day not in archiver._partitions
+        assert archiver._partition_retries[day][1] == 2 * PARTITION_RETRY_SECONDS
+        await archiver._create_partition(driver, day)  # type: ignore[arg-type]
+        assert day in archiver._partitions
+        assert day not in archiver._partition_retries
+
+    asyncio.run(_run())
+
+
+def test_day_already_in_the_default_partition_is_not_retried(monkeypatch):
+    # A day no other test archives, seeded into the default partition.
+    start = datetime(2031, 6, 1, 12, tzinfo=UTC)
+    seeded = uuid.uuid4()
+
+    async def _seed(session):
+        await session.execute(
+            text(
+                "INSERT INTO telemetry_sample (mission_id, timestamp, charge_percent, "
+                "power_level_percent, hull_pressure_kpa, depth_meters, water_temp_celsius, "
+                "mission_status) VALUES (:mission_id, :timestamp, 100, 0, 0, 0, 18, 'standby')"
+            ),
+            {"mission_id": seeded, "timestamp": start},
+        )
+        await session.commit()
+
+    _query(_seed)
+    mission_id = uuid.uuid4()
+    attempts = []
+    create_partition = TelemetryArchiver._create_partition
+
+    async def _counting(self, driver, day):
+        attempts.append(day)
+        await create_partition(self, driver, day)
+
+    monkeypatch.setattr(TelemetryArchiver, "_create_partition", _counting)
+
+    async def _run():
+        engine = create_async_engine(settings.database_url, poolclass=NullPool)
+        archiver = TelemetryArchiver(engine=engine)
+        clock = VirtualClock(start)
+        sim = RovSimulator(clock=clock)
+        try:
+            for _ in range(3):  # one COPY per flush
+                clock.advance(1)
+                archiver.record(mission_id, sim)
+                batch, archiver._pending = archiver._pending, []
+                await archiver._copy(batch)
+        finally:
+            await engine.dispose()
+        return archiver
+
+    archiver = asyncio.run(_run())
+    assert attempts == [start.date()]
+    assert start.date() in archiver._default_days
+    assert archiver.archived_samples == 3 and archiver.failed_samples == 0
+
+    async def _cleanup(session):
+        await session.execute(
+            text("DELETE FROM telemetry_sample WHERE mission_id IN (:a, :b)"),
+            {"a": seeded, "b": mission_id},
+        )
+        await session.commit()
+
+    _query(_cleanup)
+
+def test_bucket_finer_than_a_millisecond_is_rejected(client):
+    url = f"/api/v1/missions/{uuid.uuid4()}/telemetry"
+    assert client.get(url, params={"bucket_seconds": 1e-9}).status_code == 422
+    assert client.get(url, params={"bucket_seconds": 0.001}).status_code == 200
@@ -0,0 +1,103 @@
+# backend/tests/test_telemetry_encoding.py
+from itertools import pairwise
+
+import pytest
+from fastapi import WebSocketDisconnect
+
+from backend.telemetry_encoding import DeltaEncoder, diff_frames
+
+# ---------- Helpers ----------
+
+
+def _merge(state, changes):
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(state.get(key), dict):
+            _merge(state[key], value)
+        else:
+            state[key] = value
+    return state
+
+
+def _apply(state, frame):
+    if frame["type"] == "keyframe":
+        return frame["telemetry"]
+    return _merge(state, frame["changes"])
+
+
+# ---------- Unit tests ----------
+
+
+def test_diff_frames_keeps_only_changed_leaves():
+    previous = {"t": 1, "a": {"x": 1.0, "y": "same"}, "b": {"z": None}}
+    current = {"t": 2, "a": {"x": 2.0, "y": "same"}, "b": {"z": None}}
+    assert diff_frames(previous, current) == {"t": 2, "a": {"x": 2.0}}
+
+
+def test_encoder_sends_periodic_keyframes_and_resyncs_on_request():
+    encoder = DeltaEncoder()
+    encoder.KEYFRAME_INTERVAL = 3
+    kinds = [encoder.encode({"n": i})["type"] for i in range(7)]
+    assert kinds == ["keyframe", "delta", "delta"] * 2 + ["keyframe"]
+
+    encoder.request_keyframe()
+    frame = encoder.encode({"n": 7})
+    assert frame == {"type": "keyframe", "seq": 7, "telemetry": {"n": 7}}
+
+
+# ---------- WebSocket tests ----------
+
+
+def test_delta_stream_reconstructs_full_telemetry(client):
+    with client.websocket_connect("/ws/telemetry?encoding=delta") as ws:
+        first = ws.receive_json()
+        assert first["type"] == "keyframe"
+        state = first["telemetry"]
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+
+        seq = first["seq"]
+        depths = []
+        for _ in range(40):
+            frame = ws.receive_json()
+            assert frame["seq"] == seq + 1
+            seq = frame["seq"]
+            if frame["type"] == "delta":
+                # Fields that do not move during descent are not resent.
+                assert "science_package" not in frame["changes"].get("rov_state", {})
+            state = _apply(state, frame)
+            if state["mission_state"]["status"] == "en_route":
+                depths.append(state["rov_state"]["environment"]["depth_meters"])
+
+        # Reconstructed state descends exactly DESCENT_RATE per frame, like the
+        # full stream does, and keeps every untouched field from the keyframe.
+        assert len(depths) > 10
+        assert all(b - a == pytest.approx(25.0) for a, b in pairwise(depths))
+        assert state["rov_state"]["science_package"]["status"] == "attached"
+        assert state["rov_state"]["propulsion"]["status"] == "active"
+
+
+def test_resync_command_yields_keyframe(client):
+    with client.websocket_connect("/ws/telemetry?encoding=delta") as ws:
+        ws.receive_json()
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        assert ws.receive_json()["type"] == "delta"
+        ws.send_json({"command": "RESYNC"})
+        for _ in range(20):
+            frame = ws.receive_json()
+            if frame["type"] == "keyframe":
+                break
+        else:
+            raise AssertionError("no keyframe after RESYNC")
+
+        sim = next(iter(client.app.state.sim_manager._sessions.values())).simulator
+        assert not any("Unknown command" in e.message for e in sim.get_mission_log())
+
+
+def test_full_encoding_is_the_default(client):
+    with client.websocket_connect("/ws/telemetry") as ws:
+        assert "rov_state" in ws.receive_json()
+
+
+def test_unsupported_encoding_is_rejected(client):
+    with pytest.raises(WebSocketDisconnect):
+        with client.websocket_connect("/ws/telemetry?encoding=bogus") as ws:
+            ws.receive_json()
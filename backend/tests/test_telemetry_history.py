@@ -0,0 +1,97 @@
+# backend/tests/test_telemetry_history.py
+from datetime import UTC, datetime, timedelta
+
+from backend.clock import VirtualClock
+from backend.simulator import RovSimulator
+from backend.telemetry_history import TelemetryHistory
+
+from .test_backend import _only_session, _recv_n, _recv_until
+
+START = datetime(2026, 1, 1, tzinfo=UTC)
+
+# ---------- Helpers ----------
+
+
+def _run(history: TelemetryHistory, ticks: int, tps: int = 2):
+    """Tick a nominal mission on a virtual clock, recording every tick; returns frames."""
+    clock = VirtualClock(START)
+    sim = RovSimulator(clock=clock)
+    sim.handle_command({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+    frames = []
+    for _ in range(ticks):
+        clock.advance(1 / tps)
+        sim.update()
+        history.record(sim)
+        frames.append(sim.get_telemetry_dict())
+    return frames
+
+
+# ---------- Ring buffer ----------
+
+
+def test_history_matches_frames_and_keeps_only_capacity_samples():
+    history = TelemetryHistory(capacity=10)
+    frames = _run(history, ticks=25)
+
+    assert len(history) == 10
+    window = history.window(seconds=3600)
+    assert window["timestamps"] == [
+        datetime.fromisoformat(f["timestamp"]) for f in frames[-10:]
+    ]
+    assert window["series"]["depth_meters"] == [
+        f["rov_state"]["environment"]["depth_meters"] for f in frames[-10:]
+    ]
+    assert window["series"]["charge_percent"] == [
+        f["rov_state"]["power"]["charge_percent"] for f in frames[-10:]
+    ]
+
+
+def test_window_covers_last_n_seconds_of_simulated_time():
+    history = TelemetryHistory(capacity=100)
+    _run(history, ticks=20, tps=2)
+
+    window = history.window(seconds=3)
+    # 2 ticks per second: the newest sample plus the 5 before it.
+    assert len(window["timestamps"]) == 6
+    assert window["timestamps"][-1] - window["timestamps"][0] == timedelta(seconds=2.5)
+
+
+def test_memory_is_fixed_by_capacity():
+    history = TelemetryHistory(capacity=600)
+    before = history.nbytes
+    _run(history, ticks=1000)
+    assert history.nbytes == before == 600 * 28
+    assert history.window(1)["memory_bytes"] == before
+
+
+def test_empty_history_window():
+    window = TelemetryHistory(capacity=4).window(60)
+    assert window["timestamps"] == []
+    assert window["series"]["depth_meters"] == []
+
+
+# ---------- Endpoint ----------
+
+
+def test_session_telemetry_endpoint_returns_recent_history(client):
+    with client.websocket_connect("/ws/telemetry") as ws:
+        ws.receive_json()
+        ws.send_json({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+        _recv_until(ws, lambda d: d["rov_state"]["environment"]["depth_meters"] > 5)
+        _recv_n(ws, 5)
+        session = _only_session(client)
+
+        resp = client.get(
+            f"/api/v1/sessions/{session.session_id}/telemetry", params={"seconds": 1}
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["memory_bytes"] == session.history.nbytes
+        # At 200 ticks/s, one second is at most 200 samples.
+        assert 0 < len(body["timestamps"]) <= RovSimulator.TICKS_PER_SECOND
+        depths = body["series"]["depth_meters"]
+        assert len(depths) == len(body["timestamps"])
+        assert depths == sorted(depths) and depths[-1] > 5
+
+    resp = client.get(f"/api/v1/sessions/{session.session_id}/telemetry")
+    assert resp.status_code == 404
@@ -0,0 +1,58 @@
+# backend/tests/test_telemetry_json.py
+import json
+
+import pytest
+
+from backend.models import TelemetryMessage
+from backend.simulator import RovSimulator
+
+from .test_vector_engine import SCRIPTS, _frame
+
+
+@pytest.mark.parametrize("script", SCRIPTS, ids=lambda script: script.__name__)
+def test_fast_path_frames_conform_to_telemetry_schema(script):
+    """Every fast-path frame must validate against TelemetryMessage and survive a
+    round trip through it unchanged, and must agree with the pydantic snapshot
+    up to the rounding the schema declares."""
+    sim = RovSimulator()
+    frame = _frame(sim.get_telemetry())
+    for tick in range(400):
+        for cmd in script(tick, frame):
+            sim.handle_command(cmd)
+        sim.update()
+
+        text = sim.get_telemetry_json()
+        fast = json.loads(text)
+        assert TelemetryMessage.model_validate_json(text).model_dump() == fast
+        assert json.dumps(
+            {**sim.get_telemetry_dict(), "timestamp": fast["timestamp"]},
+            separators=(",", ":"),
+        ) == text
+
+        frame = _frame(sim.get_telemetry())
+        fast.pop("timestamp")
+        power, env = fast["rov_state"]["power"], fast["rov_state"]["environment"]
+        assert power["charge_percent"] == pytest.approx(
+            frame["rov_state"]["power"]["charge_percent"], abs=0.005
+        )
+        assert env["depth_meters"] == pytest.approx(
+            frame["rov_state"]["environment"]["depth_meters"], abs=0.05
+        )
+        assert fast["rov_state"]["hull_integrity"]["hull_pressure_kpa"] == int(
+            frame["rov_state"]["hull_integrity"]["hull_pressure_kpa"]
+        )
+        assert fast["mission_state"] == frame["mission_state"]
+        assert fast["alert"] == frame["alert"]
+
+
+def test_state_views_are_snapshots():
+    sim = RovSimulator()
+    sim.handle_command({"command": "START_SIMULATION", "payload": {"scenario": "nominal"}})
+    for _ in range(3):
+        sim.update()
+    snapshot = sim.rov_state
+    sim.update()
+
+    assert snapshot.environment.depth_meters < sim.state.depth_meters
+    assert sim.mission_state.status == sim.state.mission_status
+    assert not hasattr(sim.state, "__dict__")
@@ -0,0 +1,131 @@
+# backend/tests/test_vector_engine.py
+import pytest
+
+from backend.simulator import RovSimulator
+from backend.vector_engine import VectorizedRovEngine
+
+# ---------- Helpers ----------
+
+
+def _start(scenario):
+    return {"command": "START_SIMULATION", "payload": {"scenario": scenario}}
+
+
+ALL_STOP = {"command": "SET_PROPULSION_STATE", "payload": {"status": "inactive"}}
+
+
+def _nominal_success(tick, frame):
+    if tick == 0:
+        return [_start("nominal")]
+    if frame["alert"]["severity"] == "INFO":
+        return [{"command": "DEPLOY_ARM"}, {"command": "COLLECT_SAMPLE"}]
+    return []
+
+
+def _nominal_all_stop_then_reset(tick, frame):
+    return {
+        0: [_start("nominal"), {"command": "FOO_BAR"}],
+        10: [ALL_STOP],
+        40: [{"command": "RESET_SIMULATION"}],
+        45: [_start("nominal")],
+    }.get(tick, [])
+
+
+def _pressure_anomaly_failure(tick, frame):
+    return [_start("pressure_anomaly")] if tick == 0 else []
+
+
+def _pressure_anomaly_all_stop(tick, frame):
+    if tick == 0:
+        return [_start("pressure_anomaly")]
+    if frame["alert"]["severity"] == "WARNING":
+        return [ALL_STOP]
+    return []
+
+
+def _power_fault_failure(tick, frame):
+    return [_start("power_fault"), {"command": "JETTISON_PACKAGE"}] if tick == 0 else []
+
+
+def _power_fault_jettison(tick, frame):
+    if tick == 0:
+        return [_start("power_fault")]
+    if frame["alert"]["severity"] == "CRITICAL":
+        return [{"command": "JETTISON_PACKAGE"}]
+    return []
+
+
+SCRIPTS = [
+    _nominal_success,
+    _nominal_all_stop_then_reset,
+    _pressure_anomaly_failure,
+    _pressure_anomaly_all_stop,
+    _power_fault_failure,
+    _power_fault_jettison,
+]
+
+
+def _frame(telemetry):
+    frame = telemetry.model_dump(warnings=False)
+    del frame["timestamp"]
+    return frame
+
+
+# ---------- Tests ----------
+
+
+def test_engine_matches_scalar_simulator_for_every_scenario():
+    """Run every script side by side in one engine and in separate RovSimulators;
+    every frame and every log entry must be identical."""
+    engine = VectorizedRovEngine(capacity=2)  # forces the arrays to grow
+    sims = [RovSimulator() for _ in SCRIPTS]
+    slots = [engine.add_session() for _ in SCRIPTS]
+    frames = [_frame(sim.get_telemetry()) for sim in sims]
+
+    for tick in range(400):
+        for script, sim, slot, frame in zip(SCRIPTS, sims, slots, frames, strict=True):
+            for cmd in script(tick, frame):
+                sim.handle_command(cmd)
+                engine.handle_command(slot, cmd)
+            sim.update()
+        engine.update()
+
+        for i, (sim, slot) in enumerate(zip(sims, slots, strict=True)):
+            frames[i] = _frame(sim.get_telemetry())
+            assert _frame(engine.get_telemetry(slot)) == frames[i], (SCRIPTS[i].__name__, tick)
+
+    final_statuses = {frame["mission_state"]["status"] for frame in frames}
+    assert {
+        "mission_success",
+        "mission_failure_hull_breach",
+        "mission_failure_lost_signal",
+    } <= final_statuses
+    for sim, slot in zip(sims, slots, strict=True):
+        expected = [(e.level, e.message, e.seq) for e in sim.get_mission_log()]
+        actual = [(e.level, e.message, e.seq) for e in engine.get_mission_log(slot)]
+        assert actual == expected
+
+
+def test_removed_slot_is_reused_in_standby():
+    engine = VectorizedRovEngine(capacity=1)
+    slot = engine.add_session()
+    engine.handle_command(slot, _start("nominal"))
+    engine.update()
+    engine.remove_session(slot)
+
+    assert engine.add_session() == slot
+    telemetry = engine.get_telemetry(slot)
+    assert telemetry.mission_state.status == "standby"
+    assert telemetry.rov_state.environment.depth_meters == 0.0
+    assert engine.get_mission_log(slot) == []
+
+
+@pytest.mark.parametrize("scenario", ["nominal", "pressure_anomaly", "power_fault"])
+def test_on_event_reports_slot(scenario):
+    engine = VectorizedRovEngine()
+    seen = []
+    engine.on_event = lambda slot, entry: seen.append(slot)
+    engine.add_session()
+    slot = engine.add_session()
+    engine.handle_command(slot, _start(scenario))
+    assert seen and set(seen) == {slot}
@@ -0,0 +1,537 @@
+# backend/vector_engine.py
+from collections.abc import Callable
+from typing import get_args
+
+import numpy as np
+
+from backend.clock import Clock, utc_now
+from backend.config import settings
+from backend.logs import LogEntry, LogLevel
+from backend.mission_log import MissionLog
+from backend.models import (
+    ActiveAlert,
+    Environment,
+    HullIntegrity,
+    ManipulatorArm,
+    MissionState,
+    Power,
+    Propulsion,
+    RovState,
+    SciencePackage,
+    TelemetryMessage,
+)
+from backend.simulator import RovSimulator
+
+# Enumerated state is stored as small integer codes indexing these tuples.
+SCENARIOS: tuple[str | None, ...] = (None, "nominal", "pressure_anomaly", "power_fault")
+MISSION_STATUSES: tuple[str, ...] = get_args(MissionState.model_fields["status"].annotation)
+HULL_STATUSES: tuple[str, ...] = get_args(HullIntegrity.model_fields["status"].annotation)
+ARM_STATUSES: tuple[str, ...] = get_args(ManipulatorArm.model_fields["status"].annotation)
+ALERT_SEVERITIES: tuple[str | None, ...] = (None, "INFO", "WARNING", "CRITICAL")
+ALERT_MESSAGES: tuple[str | None, ...] = (
+    None,
+    "Bioluminescent signature detected. Ready to deploy manipulator arm.",
+    "Hull pressure exceeds nominal limits. Halt descent.",
+    "CRITICAL: Hull pressure at dangerous levels!",
+    "Power system fault! Catastrophic drain. Jettison package to save ROV.",
+    "Battery at 0%. Signal lost.",
+)
+
+NOMINAL, PRESSURE_ANOMALY, POWER_FAULT = 1, 2, 3
+(
+    STANDBY,
+    EN_ROUTE,
+    SEARCHING,
+    RETURNING,
+    MISSION_SUCCESS,
+    EMERGENCY_ASCENT,
+    FAILURE_HULL_BREACH,
+    FAILURE_LOST_SIGNAL,
+) = range(len(MISSION_STATUSES))
+HULL_NOMINAL, HULL_WARNING, HULL_CRITICAL = range(len(HULL_STATUSES))
+ARM_STOWED, ARM_DEPLOYED, ARM_GRIPPING = range(len(ARM_STATUSES))
+SEVERITY_INFO, SEVERITY_WARNING, SEVERITY_CRITICAL = 1, 2, 3
+(
+    ALERT_SIGNATURE,
+    ALERT_PRESSURE_WARNING,
+    ALERT_PRESSURE_CRITICAL,
+    ALERT_POWER_FAULT,
+    ALERT_SIGNAL_LOST,
+) = range(1, len(ALERT_MESSAGES))
+
+
+class VectorizedRovEngine:
+    """Structure-of-arrays alternative to `RovSimulator` for many sessions at once.
+
+    Every session occupies a slot; its state lives at that index in a set of
+    NumPy arrays, and `update()` advances all running slots in one vectorized
+    pass. Scenario transitions are evaluated as boolean masks in the same order
+    as the scalar scenario methods, so per-slot state (including the raw,
+    unrounded floats) and log ordering match `RovSimulator` exactly.
+
+    Commands are rare compared to ticks, so `handle_command` is scalar and
+    only touches a single slot.
+    """
+
+    TARGET_DEPTH = RovSimulator.TARGET_DEPTH
+    DESCENT_RATE = RovSimulator.DESCENT_RATE
+    ASCENT_RATE = RovSimulator.ASCENT_RATE
+    PRESSURE_PER_METER = RovSimulator.PRESSURE_PER_METER
+    PRESSURE_WARNING_THRESHOLD = RovSimulator.PRESSURE_WARNING_THRESHOLD
+    PRESSURE_CRITICAL_THRESHOLD = RovSimulator.PRESSURE_CRITICAL_THRESHOLD
+
+    def __init__(self, capacity: int = 64, clock: Clock = utc_now):
+        self.clock = clock
+        self.capacity = 0
+        self.in_use = np.zeros(0, dtype=bool)
+        self._free_slots: list[int] = []
+        self.mission_logs: list[MissionLog] = []
+        # Optional hook invoked with (slot, entry) for each new LogEntry.
+        self.on_event: Callable[[int, LogEntry], None] | None = None
+
+        self.scenario = np.zeros(0, dtype=np.int8)
+        self.scenario_timer = np.zeros(0, dtype=np.int64)
+        self.running = np.zeros(0, dtype=bool)
+        self.operator_override = np.zeros(0, dtype=bool)
+        self.normalization_target = np.zeros(0, dtype=np.float64)
+        self.normalization_ticks = np.zeros(0, dtype=np.int64)
+
+        self.charge_percent = np.zeros(0, dtype=np.float64)
+        self.power_fault = np.zeros(0, dtype=bool)
+        self.power_level_percent = np.zeros(0, dtype=np.float64)
+        self.propulsion_active = np.zeros(0, dtype=bool)
+        self.hull_pressure_kpa = np.zeros(0, dtype=np.float64)
+        # The scalar simulator's pressure is an int except mid-normalization,
+        # where it is temporarily a float; tracked so telemetry types match.
+        self.pressure_is_float = np.zeros(0, dtype=bool)
+        self.hull_status = np.zeros(0, dtype=np.int8)
+        self.arm_status = np.zeros(0, dtype=np.int8)
+        self.sample_collected = np.zeros(0, dtype=bool)
+        self.package_jettisoned = np.zeros(0, dtype=bool)
+        self.depth_meters = np.zeros(0, dtype=np.float64)
+        self.water_temp_celsius = np.zeros(0, dtype=np.float64)
+        self.mission_status = np.zeros(0, dtype=np.int8)
+        self.log_seq = np.zeros(0, dtype=np.int64)
+        self.alert_active = np.zeros(0, dtype=bool)
+        self.alert_severity = np.zeros(0, dtype=np.int8)
+        self.alert_message = np.zeros(0, dtype=np.int8)
+
+        self._grow(capacity)
+
+    # --- Slot management ---
+
+    _ARRAY_FIELDS = (
+        "in_use",
+        "log_seq",
+        "scenario",
+        "scenario_timer",
+        "running",
+        "operator_override",
+        "normalization_target",
+        "normalization_ticks",
+        "charge_percent",
+        "power_fault",
+        "power_level_percent",
+        "propulsion_active",
+        "hull_pressure_kpa",
+        "pressure_is_float",
+        "hull_status",
+        "arm_status",
+        "sample_collected",
+        "package_jettisoned",
+        "depth_meters",
+        "water_temp_celsius",
+        "mission_status",
+        "alert_active",
+        "alert_severity",
+        "alert_message",
+    )
+
+    def _grow(self, capacity: int):
+        extra = capacity - self.capacity
+        for name in self._ARRAY_FIELDS:
+            array = getattr(self, name)
+            setattr(self, name, np.concatenate([array, np.zeros(extra, dtype=array.dtype)]))
+        self.mission_logs.extend(
+            MissionLog(settings.mission_log_memory_entries) for _ in range(extra)
+        )
+        self._free_slots.extend(reversed(range(self.capacity, capacity)))
+        self.capacity = capacity
+
+    def add_session(self) -> int:
+        """Claim a slot for a new session, in standby, and return its index."""
+        if not self._free_slots:
+            self._grow(max(1, self.capacity * 2))
+        slot = self._free_slots.pop()
+        self.in_use[slot] = True
+        self.log_seq[slot] = 0
+        self._reset_slot(slot)
+        return slot
+
+    def remove_session(self, slot: int):
+        self.in_use[slot] = False
+        self.running[slot] = False
+        self.mission_logs[slot].clear()
+        self._free_slots.append(slot)
+
+    def _reset_slot(self, slot: int):
+        """Reset a slot to standby state (mirrors `RovSimulator._reset_state`)."""
+        self.scenario[slot] = 0
+        self.scenario_timer[slot] = 0
+        self.running[slot] = False
+        self.operator_override[slot] = False
+        self.normalization_target[slot] = np.nan
+        self.normalization_ticks[slot] = 0
+        self.charge_percent[slot] = 100.0
+        self.power_fault[slot] = False
+        self.power_level_percent[slot] = 0.0
+        self.propulsion_active[slot] = False
+        self.hull_pressure_kpa[slot] = 0
+        self.pressure_is_float[slot] = False
+        self.hull_status[slot] = HULL_NOMINAL
+        self.arm_status[slot] = ARM_STOWED
+        self.sample_collected[slot] = False
+        self.package_jettisoned[slot] = False
+        self.depth_meters[slot] = 0.0
+        self.water_temp_celsius[slot] = 18.0
+        self.mission_status[slot] = STANDBY
+        self._clear_alert(slot)
+        self.mission_logs[slot].clear()
+
+    def _clear_alert(self, where):
+        self.alert_active[where] = False
+        self.alert_severity[where] = 0
+        self.alert_message[where] = 0
+
+    def _raise_alert(self, where, severity: int, message: int):
+        self.alert_active[where] = True
+        self.alert_severity[where] = severity
+        self.alert_message[where] = message
+
+    def _add_log_entry(self, slot: int, level: LogLevel, message: str):
+        self.log_seq[slot] += 1
+        entry = LogEntry(
+            timestamp=self.clock(), level=level, message=message, seq=int(self.log_seq[slot])
+        )
+        self.mission_logs[slot].append(entry)
+        if self.on_event:
+            self.on_event(slot, entry)
+
+    def _log_where(self, mask: np.ndarray, level: LogLevel, message: str):
+        for slot in np.flatnonzero(mask):
+            self._add_log_entry(int(slot), level, message)
+
+    # --- Public API ---
+
+    def get_telemetry(self, slot: int) -> TelemetryMessage:
+        """Return a snapshot of one slot's telemetry.
+
+        Built with `model_construct` so values are passed through exactly as
+        stored, the same way `RovSimulator` builds its snapshots.
+        """
+        pressure = self.hull_pressure_kpa[slot]
+        severity = ALERT_SEVERITIES[self.alert_severity[slot]]
+        return TelemetryMessage.model_construct(
+            timestamp=self.clock().isoformat(),
+            tick_rate=float(RovSimulator.TICKS_PER_SECOND),
+            rov_state=RovState.model_construct(
+                power=Power.model_construct(
+                    charge_percent=float(self.charge_percent[slot]),
+                    status="fault" if self.power_fault[slot] else "discharging",
+                ),
+                propulsion=Propulsion.model_construct(
+                    power_level_percent=float(self.power_level_percent[slot]),
+                    status="active" if self.propulsion_active[slot] else "inactive",
+                ),
+                hull_integrity=HullIntegrity.model_construct(
+                    hull_pressure_kpa=(
+                        float(pressure) if self.pressure_is_float[slot] else int(pressure)
+                    ),
+                    status=HULL_STATUSES[self.hull_status[slot]],
+                ),
+                manipulator_arm=ManipulatorArm.model_construct(
+                    status=ARM_STATUSES[self.arm_status[slot]],
+                    sample_collected=bool(self.sample_collected[slot]),
+                ),
+                science_package=SciencePackage.model_construct(
+                    status="jettisoned" if self.package_jettisoned[slot] else "attached"
+                ),
+                environment=Environment.model_construct(
+                    depth_meters=float(self.depth_meters[slot]),
+                    water_temp_celsius=float(self.water_temp_celsius[slot]),
+                ),
+            ),
+            mission_state=MissionState.model_construct(
+                status=MISSION_STATUSES[self.mission_status[slot]]
+            ),
+            alert=ActiveAlert.model_construct(
+                active=bool(self.alert_active[slot]),
+                severity=severity,
+                message=ALERT_MESSAGES[self.alert_message[slot]],
+            ),
+        )
+
+    def get_mission_log(self, slot: int) -> list[LogEntry]:
+        return list(self.mission_logs[slot])
+
+    def handle_command(self, slot: int, command: dict):
+        """Handle a frontend command for one slot (mirrors `RovSimulator.handle_command`)."""
+        command_name = command.get("command")
+        payload = command.get("payload", {})
+
+        match command_name:
+            case "START_SIMULATION":
+                self._handle_start_simulation(slot, payload.get("scenario"))
+            case "SET_PROPULSION_STATE":
+                self._add_log_entry(
+                    slot,
+                    LogLevel.OPERATOR,
+                    f"Command Sent: SET_PROPULSION_STATE({payload.get('status')}).",
+                )
+                self._handle_set_propulsion(slot, payload.get("status"))
+            case "DEPLOY_ARM":
+                self._add_log_entry(slot, LogLevel.OPERATOR, "Command Sent: DEPLOY_ARM.")
+                if self.arm_status[slot] == ARM_STOWED:
+                    self.arm_status[slot] = ARM_DEPLOYED
+                    self._add_log_entry(
+                        slot, LogLevel.INFO, "Manipulator arm status changed to 'deployed'."
+                    )
+            case "COLLECT_SAMPLE":
+                self._add_log_entry(slot, LogLevel.OPERATOR, "Command Sent: COLLECT_SAMPLE.")
+                if self.arm_status[slot] == ARM_DEPLOYED:
+                    self.arm_status[slot] = ARM_GRIPPING
+                    self.sample_collected[slot] = True
+                    self._add_log_entry(slot, LogLevel.INFO, "Sample collected successfully.")
+            case "JETTISON_PACKAGE":
+                self._add_log_entry(slot, LogLevel.OPERATOR, "Command Sent: JETTISON_PACKAGE.")
+                self._handle_jettison_package(slot)
+            case "RESET_SIMULATION":
+                self._reset_slot(slot)
+                self._add_log_entry(slot, LogLevel.INFO, "Simulation reset to standby.")
+            case _:
+                self._add_log_entry(slot, LogLevel.WARNING, f"Unknown command: {command_name}")
+
+    def _handle_start_simulation(self, slot: int, scenario: str | None):
+        if scenario is not None and scenario in SCENARIOS:
+            self._reset_slot(slot)
+            self.scenario[slot] = SCENARIOS.index(scenario)
+            self.running[slot] = True
+            self.mission_status[slot] = EN_ROUTE
+            self._add_log_entry(
+                slot, LogLevel.INFO, f"Scenario Started: {scenario.replace('_', ' ').title()}."
+            )
+            self._add_log_entry(slot, LogLevel.INFO, "Mission status changed to 'en_route'.")
+        else:
+            self._add_log_entry(
+                slot, LogLevel.WARNING, f"Attempted to start unknown scenario: {scenario}"
+            )
+
+    def _handle_set_propulsion(self, slot: int, status: str):
+        if status not in ["active", "inactive"]:
+            return
+
+        self.propulsion_active[slot] = status == "active"
+        self.operator_override[slot] = True
+
+        if (
+            self.scenario[slot] == PRESSURE_ANOMALY
+            and status == "inactive"
+            and self.hull_status[slot] in (HULL_WARNING, HULL_CRITICAL)
+        ):
+            self.hull_status[slot] = HULL_NOMINAL
+            self._clear_alert(slot)
+            self.scenario_timer[slot] = 0
+            self._add_log_entry(slot, LogLevel.INFO, "Hull pressure returned to nominal.")
+            self._add_log_entry(slot, LogLevel.INFO, "Operator intervention successful.")
+            self.normalization_target[slot] = self.depth_meters[slot] * self.PRESSURE_PER_METER
+            self.normalization_ticks[slot] = 5
+            self.scenario[slot] = NOMINAL
+            self.mission_status[slot] = SEARCHING
+            self._add_log_entry(
+                slot, LogLevel.INFO, "Anomaly resolved. Resuming mission: searching for sample."
+            )
+
+    def _handle_jettison_package(self, slot: int):
+        if self.package_jettisoned[slot]:
+            return
+        self.package_jettisoned[slot] = True
+        if self.power_fault[slot]:
+            self.power_fault[slot] = False
+            self._clear_alert(slot)
+            self.mission_status[slot] = EMERGENCY_ASCENT
+            self.propulsion_active[slot] = True
+            self.operator_override[slot] = True
+            self._add_log_entry(
+                slot, LogLevel.INFO, "Science package jettisoned. Power drain stabilized."
+            )
+            self._add_log_entry(
+                slot, LogLevel.INFO, "Mission status changed to 'emergency_ascent'."
+            )
+
+    def update(self):
+        """Advance every running slot by one tick."""
+        ticking = self.running.copy()
+        if not ticking.any():
+            return
+
+        self.scenario_timer[ticking] += 1
+        self._update_nominal_scenario(ticking & (self.scenario == NOMINAL))
+        self._update_pressure_anomaly_scenario(ticking & (self.scenario == PRESSURE_ANOMALY))
+        self._update_power_fault_scenario(ticking & (self.scenario == POWER_FAULT))
+        # Like `RovSimulator.update`, physics still runs on the tick a scenario
+        # stops the simulation.
+        self._update_physics(ticking)
+
+    # --- Scenario Logic ---
+
+    def _update_nominal_scenario(self, mask: np.ndarray):
+        if not mask.any():
+            return
+        en_route = mask & (self.mission_status == EN_ROUTE)
+        descending = en_route & ~self.operator_override & (self.depth_meters < self.TARGET_DEPTH)
+        self.propulsion_active[descending] = True
+        arrived = en_route & ~descending & (self.depth_meters >= self.TARGET_DEPTH)
+        self.mission_status[arrived] = SEARCHING
+        self.propulsion_active[arrived & ~self.operator_override] = False
+        self.scenario_timer[arrived] = 0
+        self._log_where(arrived, LogLevel.INFO, "Mission status changed to 'searching'.")
+
+        signature = (
+            mask
+            & (self.mission_status == SEARCHING)
+            & (self.scenario_timer > 30)
+            & ~self.alert_active
+        )
+        self._raise_alert(signature, SEVERITY_INFO, ALERT_SIGNATURE)
+        self._log_where(
+            signature, LogLevel.INFO, "Bioluminescent signature detected. Awaiting operator action."
+        )
+
+        # Propulsion is left as-is here: the scalar code only re-asserts
+        # "active" when it is already not "inactive".
+        collected = mask & self.sample_collected & (self.mission_status != RETURNING)
+        self.mission_status[collected] = RETURNING
+        self._clear_alert(collected)
+        self._log_where(collected, LogLevel.INFO, "Mission status changed to 'returning'.")
+
+        surfaced = mask & (self.mission_status == RETURNING) & (self.depth_meters <= 0)
+        self.mission_status[surfaced] = MISSION_SUCCESS
+        self.propulsion_active[surfaced] = False
+        self.running[surfaced] = False
+        self._log_where(surfaced, LogLevel.INFO, "Mission status changed to 'mission_success'.")
+
+    def _update_pressure_anomaly_scenario(self, mask: np.ndarray):
+        mask = mask & ~self.operator_override
+        if not mask.any():
+            return
+        self.propulsion_active[mask & (self.mission_status == EN_ROUTE)] = True
+
+        warning = (
+            mask
+            & (self.hull_status == HULL_NOMINAL)
+            & (self.hull_pressure_kpa > self.PRESSURE_WARNING_THRESHOLD)
+        )
+        self.hull_status[warning] = HULL_WARNING
+        self.scenario_timer[warning] = 0
+        self._raise_alert(warning, SEVERITY_WARNING, ALERT_PRESSURE_WARNING)
+        self._log_where(warning, LogLevel.WARNING, "Hull pressure exceeds nominal limits.")
+
+        critical = mask & (self.hull_status == HULL_WARNING) & (self.scenario_timer > 30)
+        self.hull_status[critical] = HULL_CRITICAL
+        self.scenario_timer[critical] = 0
+        self._raise_alert(critical, SEVERITY_CRITICAL, ALERT_PRESSURE_CRITICAL)
+        self._log_where(critical, LogLevel.CRITICAL, "Hull pressure has reached a critical level!")
+
+        breach = mask & (self.hull_status == HULL_CRITICAL) & (self.scenario_timer > 15)
+        self.mission_status[breach] = FAILURE_HULL_BREACH
+        self.running[breach] = False
+        self._log_where(
+            breach, LogLevel.CRITICAL, "Mission status changed to 'mission_failure_hull_breach'."
+        )
+
+    def _update_power_fault_scenario(self, mask: np.ndarray):
+        if not mask.any():
+            return
+        en_route = mask & (self.mission_status == EN_ROUTE)
+        shallow = en_route & (self.depth_meters < self.TARGET_DEPTH)
+        self.propulsion_active[shallow & ~self.operator_override] = True
+        arrived = en_route & ~shallow & (self.depth_meters >= self.TARGET_DEPTH)
+        self.mission_status[arrived] = SEARCHING
+        self.propulsion_active[arrived & ~self.operator_override] = False
+        self.scenario_timer[arrived] = 0
+        self._log_where(arrived, LogLevel.INFO, "Mission status changed to 'searching'.")
+
+        fault = (
+            mask
+            & (self.mission_status == SEARCHING)
+            & (self.scenario_timer > 10)
+            & ~self.power_fault
+        )
+        self.power_fault[fault] = True
+        self.scenario_timer[fault] = 0
+        self._raise_alert(fault, SEVERITY_CRITICAL, ALERT_POWER_FAULT)
+        self._log_where(
+            fault, LogLevel.CRITICAL, "Power system fault detected. Catastrophic battery drain."
+        )
+
+        lost = mask & self.power_fault & (self.charge_percent <= 0)
+        self.mission_status[lost] = FAILURE_LOST_SIGNAL
+        self.running[lost] = False
+        self._raise_alert(lost, SEVERITY_CRITICAL, ALERT_SIGNAL_LOST)
+        for slot in np.flatnonzero(lost):
+            self._add_log_entry(int(slot), LogLevel.CRITICAL, "Battery at 0%. Signal lost.")
+            self._add_log_entry(
+                int(slot),
+                LogLevel.CRITICAL,
+                "Mission status changed to 'mission_failure_lost_signal'.",
+            )
+
+        surfaced = mask & (self.mission_status == EMERGENCY_ASCENT) & (self.depth_meters <= 0)
+        self.mission_status[surfaced] = MISSION_SUCCESS
+        self.running[surfaced] = False
+        self._clear_alert(surfaced)
+        self._log_where(surfaced, LogLevel.INFO, "ROV returned to surface successfully.")
+
+    # --- General Physics ---
+
+    def _update_physics(self, mask: np.ndarray):
+        ascent_phase = mask & (
+            (self.mission_status == RETURNING) | (self.mission_status == EMERGENCY_ASCENT)
+        )
+        descent_phase = mask & (
+            (self.mission_status == EN_ROUTE) | (self.mission_status == SEARCHING)
+        )
+        self.propulsion_active[ascent_phase] = True
+
+        descend = descent_phase & self.propulsion_active
+        self.depth_meters[descend] = np.minimum(
+            self.TARGET_DEPTH * 1.5, self.depth_meters[descend] + self.DESCENT_RATE
+        )
+        ascend = ascent_phase & self.propulsion_active
+        self.depth_meters[ascend] = np.maximum(0, self.depth_meters[ascend] - self.ASCENT_RATE)
+
+        normalizing = mask & (self.normalization_ticks > 0)
+        step = (
+            self.hull_pressure_kpa[normalizing] - self.normalization_target[normalizing]
+        ) / self.normalization_ticks[normalizing]
+        self.hull_pressure_kpa[normalizing] -= step
+        self.normalization_ticks[normalizing] -= 1
+        self.pressure_is_float[normalizing] = True
+        finished = normalizing & (self.normalization_ticks == 0)
+        self.hull_pressure_kpa[finished] = np.trunc(self.normalization_target[finished])
+        self.normalization_target[finished] = np.nan
+        self.pressure_is_float[finished] = False
+        tracking = mask & ~normalizing
+        self.hull_pressure_kpa[tracking] = np.trunc(
+            self.depth_meters[tracking] * self.PRESSURE_PER_METER
+        )
+        self.pressure_is_float[tracking] = False
+
+        self.power_level_percent[mask] = np.where(self.propulsion_active[mask], 75.0, 0.0)
+
+        drain_rate = np.where(
+            self.power_fault[mask],
+            0.03 + 1.5,
+            np.where(self.propulsion_active[mask], 0.03 + 0.3, 0.03),
+        )
+        self.charge_percent[mask] = np.maximum(0, self.charge_percent[mask] - drain_rate)
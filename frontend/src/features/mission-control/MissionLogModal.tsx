@@ -1,4 +1,5 @@
 import { useEffect, useState } from "react";
+import useRovStore from "../../store/rovStore";
 
 interface LogEntry {
     timestamp: string;
@@ -9,13 +10,19 @@ interface LogEntry {
 export default function MissionLogModal({ onClose }: { onClose: () => void }) {
     const [entries, setEntries] = useState<LogEntry[]>([]);
     const [loading, setLoading] = useState(true);
+    const sessionId = useRovStore((state) => state.sessionId);
 
     useEffect(() => {
         async function fetchLogs() {
+            if (!sessionId) {
+                // No session handshake yet: there is no log to show.
+                setLoading(false);
+                return;
+            }
             try {
                 const apiUrl = `${
                     import.meta.env.VITE_API_BASE_URL
-                }/mission-log`;
+                }/api/v1/sessions/${encodeURIComponent(sessionId)}/mission-log`;
                 const res = await fetch(apiUrl);
                 if (!res.ok) {
                     throw new Error(`HTTP error! status: ${res.status}`);
@@ -30,7 +37,7 @@ export default function MissionLogModal({ onClose }: { onClose: () => void }) {
         }
 
         fetchLogs();
-    }, []);
+    }, [sessionId]);
 
     const levelColorMap: { [key: string]: string } = {
         INFO: "text-info",
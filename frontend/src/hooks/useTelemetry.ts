@@ -2,49 +2,109 @@
 
 import { useEffect } from "react";
 import useRovStore from "../store/rovStore";
-import type { RovCommand, TelemetryMessage } from "../types";
+import type { RovCommand, SessionMessage, TelemetryMessage } from "../types";
+
+// Reconnect delays double per failed attempt up to the cap. Half of each is
+// random so clients dropped together don't retry together. The server keeps
+// a dropped session for 60 s, so the cap leaves several tries within that.
+const RECONNECT_BASE_DELAY_MS = 1000;
+const RECONNECT_MAX_DELAY_MS = 15_000;
+// Close code 1013 means the server is at capacity: wait much longer.
+const AT_CAPACITY_BASE_DELAY_MS = 30_000;
+const AT_CAPACITY_MAX_DELAY_MS = 300_000;
+
+const reconnectDelay = (attempt: number, base: number, max: number) => {
+    const delay = Math.min(max, base * 2 ** attempt);
+    return delay / 2 + (Math.random() * delay) / 2;
+};
 
 export const useTelemetry = () => {
     const updateTelemetry = useRovStore((state) => state.updateTelemetry);
     const setSendCommand = useRovStore((state) => state.setSendCommand);
+    const setSessionId = useRovStore((state) => state.setSessionId);
 
     useEffect(() => {
-        console.log("Attempting to connect...");
-
         const wsBaseUrl = import.meta.env.VITE_WS_URL ?? "ws://localhost:8000";
-        const ws = new WebSocket(`${wsBaseUrl}/ws/telemetry`);
-
-        ws.onopen = () => {
-            console.log("Websocket connection established");
-
-            setSendCommand((command: RovCommand) => {
-                if (ws.readyState === WebSocket.OPEN) {
-                    ws.send(JSON.stringify(command));
-                } else {
-                    console.error(
-                        "WebSocket is not open. Cannot send command."
-                    );
+        // Token of the current session, so a dropped connection can resume it.
+        let resumeToken: string | null = null;
+        let ws: WebSocket;
+        let reconnectTimer: ReturnType<typeof setTimeout> | undefined;
+        // Reconnects since the last session handshake.
+        let attempt = 0;
+        let closing = false;
+
+        const connect = () => {
+            console.log("Attempting to connect...");
+            const query = resumeToken
+                ? `resume_token=${encodeURIComponent(resumeToken)}`
+                : "resumable=true";
+            ws = new WebSocket(`${wsBaseUrl}/ws/telemetry?${query}`);
+
+            ws.onopen = () => {
+                console.log("Websocket connection established");
+
+                setSendCommand((command: RovCommand) => {
+                    if (ws.readyState === WebSocket.OPEN) {
+                        ws.send(JSON.stringify(command));
+                    } else {
+                        console.error(
+                            "WebSocket is not open. Cannot send command."
+                        );
+                    }
+                });
+            };
+
+            ws.onmessage = (event) => {
+                const message: TelemetryMessage | SessionMessage = JSON.parse(
+                    event.data
+                );
+                if ("type" in message) {
+                    resumeToken = message.resume_token;
+                    setSessionId(message.session_id);
+                    attempt = 0;
+                    return;
                 }
-            });
-        };
+                console.log(message);
+                updateTelemetry(message);
+                console.log(useRovStore.getState());
+            };
 
-        ws.onmessage = (event) => {
-            const message: TelemetryMessage = JSON.parse(event.data);
-            console.log(message);
-            updateTelemetry(message);
-            console.log(useRovStore.getState());
-        };
+            ws.onclose = (event) => {
+                console.log("WebSocket connection closed.");
+                if (closing) {
+                    return;
+                }
+                if (event.code === 1008) {
+                    // Token expired or unknown: start a new session instead.
+                    resumeToken = null;
+                }
+                const delay =
+                    event.code === 1013
+                        ? reconnectDelay(
+                              attempt,
+                              AT_CAPACITY_BASE_DELAY_MS,
+                              AT_CAPACITY_MAX_DELAY_MS
+                          )
+                        : reconnectDelay(
+                              attempt,
+                              RECONNECT_BASE_DELAY_MS,
+                              RECONNECT_MAX_DELAY_MS
+                          );
+                attempt += 1;
+                reconnectTimer = setTimeout(connect, delay);
+            };
 
-        ws.onclose = () => {
-            console.log("WebSocket connection closed.");
+            ws.onerror = (error) => {
+                console.error("WebSocket error:", error);
+            };
         };
 
-        ws.onerror = (error) => {
-            console.error("WebSocket error:", error);
-        };
+        connect();
 
         return () => {
             console.log("Closing websocket connection...");
+            closing = true;
+            clearTimeout(reconnectTimer);
             ws.close();
         };
     }, []);
@@ -3,6 +3,7 @@ import type { TelemetryMessage, RovStoreState } from "../types";
 
 const initialState: TelemetryMessage = {
     timestamp: new Date().toISOString(),
+    tick_rate: 2,
     rov_state: {
         power: { charge_percent: 100.0, status: "discharging" },
         propulsion: { power_level_percent: 0.0, status: "inactive" },
@@ -26,6 +27,8 @@ const useRovStore = create<RovStoreState>((set) => ({
             ...state,
             sendCommand: sendCommandFn,
         })),
+    sessionId: null,
+    setSessionId: (sessionId) => set({ sessionId }),
 }));
 
 export default useRovStore;
@@ -52,10 +52,20 @@ export interface RovStoreState {
     updateTelemetry: (newTelemetry: TelemetryMessage) => void;
     sendCommand: (command: RovCommand) => void;
     setSendCommand: (sendCommandFn: (command: RovCommand) => void) => void;
+    /** Id of the operator session, from the connection's handshake. */
+    sessionId: string | null;
+    setSessionId: (sessionId: string | null) => void;
 }
 
 export interface TelemetryMessage {
     timestamp: string;
+    /**
+     * Frames per second this receiver currently gets, for interpolating
+     * between frames. Operators get the server's full tick rate, except while
+     * an idle session hibernates (its keepalive rate, one frame every 5 s).
+     * Spectators get a reduced rate while the server is under load.
+     */
+    tick_rate: number;
     rov_state: RovState;
     mission_state: MissionState;
     alert: ActiveAlert;
@@ -118,6 +128,15 @@ export interface ActiveAlert {
     message: string | null;
 }
 
+/** First message on a `?resumable=true` connection. */
+export interface SessionMessage {
+    type: "session";
+    session_id: string;
+    /** Reconnect with `?resume_token=` to pick the session up again. */
+    resume_token: string;
+    resumed: boolean;
+}
+
 
 export interface SubsystemCardProps {
     name?: string